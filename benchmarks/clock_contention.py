@@ -0,0 +1,73 @@
+"""
+Measure the registration throughput of pytils.clock.Schedule and ShardedSchedule under many producer threads.
+
+Each producer registers and cancels keys in a loop while the dispatchers of the schedule run, so that producers contend
+with each other and with dispatch for the schedule locks.
+
+Usage:
+    python -m benchmarks.clock_contention [PRODUCERS] [KEYS_PER_PRODUCER]
+
+"""
+
+import sys
+import time
+from threading import Barrier, Thread
+
+from pytils.clock import Schedule, ShardedSchedule
+from pytils.dev.stopwatch import Stopwatch
+
+_DEFAULT_PRODUCER_COUNT = 16
+_DEFAULT_KEYS_PER_PRODUCER = 20000
+_SHARD_COUNTS = (1, 2, 4, 8)
+
+
+def noop(_):
+    pass
+
+
+def produce(schedule, key_count: int, barrier: Barrier):
+    barrier.wait()
+    for i in range(key_count):
+        key = schedule.register(noop, None, 0.001 * (i % 100))
+        if i % 2:
+            schedule.cancel(key)
+
+
+def measure(schedule, producer_count: int, key_count: int) -> float:
+    schedule.start()
+
+    barrier = Barrier(producer_count + 1)
+    producers = [Thread(target=produce, args=(schedule, key_count, barrier)) for _ in range(producer_count)]
+    for producer in producers:
+        producer.start()
+
+    stopwatch = Stopwatch(time.perf_counter)
+    barrier.wait()
+    stopwatch.set_reference_time()
+    for producer in producers:
+        producer.join()
+    stopwatch.add_mark()
+
+    (duration, _), = stopwatch.get_offsets()
+    return duration
+
+
+def main(producer_count: int, key_count: int):
+    total = producer_count * key_count
+
+    print(f'{"shards":<8}{"producers":>10}{"keys":>10}{"total (ms)":>14}{"keys/s":>14}')
+    for shard_count in _SHARD_COUNTS:
+        if shard_count == 1:
+            schedule = Schedule(noop)
+        else:
+            schedule = ShardedSchedule(noop, shards=shard_count)
+
+        duration = measure(schedule, producer_count, key_count)
+        print(f'{shard_count:<8}{producer_count:>10}{total:>10}{duration * 1e3:>14.1f}{total / duration:>14.0f}')
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_PRODUCER_COUNT,
+        int(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_KEYS_PER_PRODUCER,
+    )
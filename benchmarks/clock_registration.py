@@ -0,0 +1,48 @@
+"""
+Measure the startup cost of registering a large job set with pytils.clock.Schedule.
+
+Usage:
+    python -m benchmarks.clock_registration [JOBS]
+
+"""
+
+import sys
+import time
+
+from pytils.clock import Schedule
+from pytils.dev.stopwatch import Stopwatch
+
+_DEFAULT_JOB_COUNT = 100000
+
+
+def noop():
+    pass
+
+
+def register_individually(schedule, jobs):
+    for job in jobs:
+        schedule.register(*job)
+
+
+def register_in_bulk(schedule, jobs):
+    schedule.register_many(jobs)
+
+
+def main(job_count: int):
+    jobs = [(noop, 1. + i % 60, float(i % 1000) / 1000.) for i in range(job_count)]
+
+    print(f'{"method":<16}{"jobs":>10}{"total (ms)":>14}{"per job (us)":>16}')
+    for method, register in (('register', register_individually), ('register_many', register_in_bulk)):
+        schedule = Schedule(noop)
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        register(schedule, jobs)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{method:<16}{job_count:>10}{duration * 1e3:>14.1f}{duration / job_count * 1e6:>16.3f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_JOB_COUNT)
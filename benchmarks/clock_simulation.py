@@ -0,0 +1,42 @@
+"""
+Measure the firing rate of a schedule simulated over virtual time with pytils.clock.VirtualClock.
+
+Usage:
+    python -m benchmarks.clock_simulation [KEYS] [HORIZON]
+
+"""
+
+import sys
+import time
+
+from pytils.clock import TimingWheelTimerStore, VirtualClock
+from pytils.dev.stopwatch import Stopwatch
+
+_DEFAULT_KEY_COUNT = 1000
+_DEFAULT_HORIZON = 3600.
+
+
+def noop():
+    pass
+
+
+def main(key_count: int, horizon: float):
+    print(f'{"store":<8}{"keys":>8}{"firings":>12}{"total (s)":>12}{"per firing (us)":>18}')
+    for name, timers in (('heap', None), ('wheel', TimingWheelTimerStore())):
+        clock = VirtualClock(timers=timers)
+        clock.schedule.register_many((noop, 1. + i % 60, float(i % 1000) / 1000.) for i in range(key_count))
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        firings = clock.run_until(horizon)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<8}{key_count:>8}{firings:>12}{duration:>12.2f}{duration / firings * 1e6:>18.3f}')
+
+
+if __name__ == '__main__':
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_KEY_COUNT,
+        float(sys.argv[2]) if len(sys.argv) > 2 else _DEFAULT_HORIZON,
+    )
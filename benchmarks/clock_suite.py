@@ -0,0 +1,330 @@
+"""
+Benchmark suite for pytils.clock, with a stable JSON output and a compare mode that flags regressions.
+
+The suite drives a Clock, i.e. a Schedule dispatching to a SchedulingQueue run by a pool of handler threads, with
+each timer store, and covers:
+
+- registration: the throughput of Schedule.register into a schedule already holding heap_size pending keys;
+- dispatch: the throughput of dispatching and running one-shot keys that are all due, with heap_size pending keys in
+  the background, handler threads and an action duration;
+- latency: the firing latency of periodic keys, i.e. the time from the due time of a run to its start, as p50, p99 and
+  p999, across handler threads and action durations.
+
+Every case cancels its keys and stops its threads before the next one starts.
+
+Usage:
+    python -m benchmarks.clock_suite run [--quick] [--output FILE]
+    python -m benchmarks.clock_suite compare BASELINE CANDIDATE [--threshold FRACTION]
+
+Compare exits with status 1 if any metric regressed by more than the threshold.
+
+"""
+
+import argparse
+import itertools
+import json
+import platform
+import queue
+import sys
+import time
+from threading import Thread
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from pytils.clock import Clock, HeapTimerStore, OverflowPolicy, ScheduleKey, TimingWheelTimerStore
+
+FORMAT_VERSION = 2
+
+_DEFAULT_THRESHOLD = 0.1
+
+TIMER_STORES = {
+    'heap': HeapTimerStore,
+    'wheel': TimingWheelTimerStore,
+}
+
+_FULL = {
+    'timers': tuple(TIMER_STORES),
+    'heap_sizes': (1000, 10000, 100000),
+    'threads': (1, 4),
+    'durations': (0., 0.001),
+    'operations': 20000,
+    'latency_keys': 200,
+    'latency_period': 0.01,
+    'latency_runs': 5000,
+}
+_QUICK = {
+    'timers': tuple(TIMER_STORES),
+    'heap_sizes': (1000, 10000),
+    'threads': (1, 4),
+    'durations': (0., 0.001),
+    'operations': 2000,
+    'latency_keys': 50,
+    'latency_period': 0.01,
+    'latency_runs': 500,
+}
+
+Result = Dict[str, Any]
+
+
+def noop():
+    pass
+
+
+def metric(value: float, unit: str, better: str) -> Dict[str, Any]:
+    return {'value': value, 'unit': unit, 'better': better}
+
+
+def quantiles(values: List[float]) -> Dict[str, Dict[str, Any]]:
+    values = sorted(values)
+    return {
+        name: metric(values[min(len(values) - 1, int(q * len(values)))], 's', 'lower')
+        for name, q in (('p50', 0.5), ('p99', 0.99), ('p999', 0.999))
+    }
+
+
+class Harness:
+    """
+    Clock with the provided timer store and handler threads, whose keys are cancelled and threads stopped by stop.
+
+    Its queue blocks the dispatcher rather than dropping runs once full, so that every run of the benchmarks completes.
+
+    """
+
+    def __init__(self, timers: str, thread_count: int):
+        self.clock = Clock(timers=TIMER_STORES[timers](), workers=thread_count, overflow_policy=OverflowPolicy.BLOCK)
+        self.keys = []  # type: List[ScheduleKey]
+
+        self._is_running = True
+        self._dispatcher = Thread(target=self._dispatch, daemon=True)
+        self._dispatcher.start()
+
+    def register(self, action: Callable[[], Any], period: Optional[float], delay: Optional[float]) -> ScheduleKey:
+        key = self.clock.schedule.register(action, period, delay)
+        self.keys.append(key)
+        return key
+
+    def register_many(self, jobs: Iterable[Tuple[Callable[[], Any], Optional[float], Optional[float]]]):
+        self.keys.extend(self.clock.schedule.register_many(jobs))
+
+    def stop(self):
+        """Cancel the keys, then stop the dispatcher thread and the handler threads."""
+        schedule = self.clock.schedule
+        for key in self.keys:
+            schedule.cancel(key)
+        self.keys.clear()
+
+        # Wake up the dispatcher so that it sees that it should exit
+        self._is_running = False
+        schedule.register(noop, None)
+        self._dispatcher.join()
+
+        if not self.clock.stop_workers(10.):
+            raise RuntimeError('handler threads did not stop')
+
+    def _dispatch(self):
+        schedule = self.clock.schedule
+        while self._is_running:
+            schedule.handle_one()
+
+
+class LatencyProbe:
+    """Periodic action that records the firing latency of each of its runs, i.e. the drift of its key."""
+
+    def __init__(self, lags: List[float], action: Callable[[], Any]):
+        self.key = None  # type: Optional[ScheduleKey]
+        self._lags = lags
+        self._action = action
+
+    def __call__(self):
+        # The key is only set once registered, which may be after a first run
+        key = self.key
+        if key is not None:
+            self._lags.append(key.stats.last_drift)
+        self._action()
+
+
+def sleeper(duration: float) -> Callable[[], Any]:
+    if not duration:
+        return noop
+    return lambda: time.sleep(duration)
+
+
+def bench_registration(timers: str, heap_size: int, operations: int) -> Result:
+    # No thread is started, so that nothing contends with the registrations
+    schedule = Clock(timers=TIMER_STORES[timers]()).schedule
+    schedule.register_many((noop, None, 3600.) for _ in range(heap_size))
+
+    start = time.perf_counter()
+    for i in range(operations):
+        schedule.register(noop, 1. + i % 60, 3600.)
+    duration = time.perf_counter() - start
+
+    return {
+        'name': 'registration',
+        'params': {'timers': timers, 'heap_size': heap_size},
+        'metrics': {'throughput': metric(operations / duration, 'ops/s', 'higher')},
+    }
+
+
+def bench_dispatch(timers: str, heap_size: int, threads: int, action_duration: float, operations: int) -> Result:
+    if action_duration:
+        # Keep the expected runtime of sleeping actions bounded
+        operations = min(operations, int(0.5 * threads / action_duration))
+
+    harness = Harness(timers, threads)
+    harness.register_many((noop, None, 3600.) for _ in range(heap_size))
+
+    completed = itertools.count(1)
+    finished = queue.SimpleQueue()
+    action = sleeper(action_duration)
+
+    def count():
+        action()
+        if next(completed) == operations:
+            finished.put(time.perf_counter())
+
+    start = time.perf_counter()
+    harness.register_many((count, None, None) for _ in range(operations))
+    duration = finished.get() - start
+    harness.stop()
+
+    return {
+        'name': 'dispatch',
+        'params': {'timers': timers, 'heap_size': heap_size, 'threads': threads, 'action_duration': action_duration},
+        'metrics': {'throughput': metric(operations / duration, 'ops/s', 'higher')},
+    }
+
+
+def bench_latency(
+        timers: str, threads: int, action_duration: float, key_count: int, period: float, run_count: int) -> Result:
+    harness = Harness(timers, threads)
+    lags = []  # type: List[float]
+    action = sleeper(action_duration)
+    for i in range(key_count):
+        probe = LatencyProbe(lags, action)
+        probe.key = harness.register(probe, period, period * i / key_count)
+
+    while len(lags) < run_count:
+        time.sleep(period)
+    harness.stop()
+
+    return {
+        'name': 'latency',
+        'params': {
+            'timers': timers, 'threads': threads, 'action_duration': action_duration, 'keys': key_count,
+            'period': period,
+        },
+        'metrics': quantiles(lags[:run_count]),
+    }
+
+
+def run_suite(config: Dict[str, Any]) -> Iterable[Result]:
+    for timers, heap_size in itertools.product(config['timers'], config['heap_sizes']):
+        yield bench_registration(timers, heap_size, config['operations'])
+
+    for timers, heap_size, threads, action_duration in itertools.product(
+            config['timers'], config['heap_sizes'], config['threads'], config['durations']):
+        yield bench_dispatch(timers, heap_size, threads, action_duration, config['operations'])
+
+    for timers, threads, action_duration in itertools.product(
+            config['timers'], config['threads'], config['durations']):
+        yield bench_latency(
+            timers, threads, action_duration, config['latency_keys'], config['latency_period'], config['latency_runs']
+        )
+
+
+def result_id(result: Result) -> Tuple:
+    return (result['name'],) + tuple(sorted(result['params'].items()))
+
+
+def describe(result: Result) -> str:
+    params = ', '.join(f'{name}={value}' for name, value in sorted(result['params'].items()))
+    return f'{result["name"]}({params})'
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any], threshold: float) -> List[str]:
+    """Get a description of every metric of the candidate that is worse than in the baseline beyond the threshold."""
+    for report in (baseline, candidate):
+        if report.get('format') != FORMAT_VERSION:
+            raise ValueError(f'unsupported result format: {report.get("format")!r}')
+
+    baseline_results = {result_id(result): result for result in baseline['results']}
+
+    regressions = []
+    for result in candidate['results']:
+        base = baseline_results.get(result_id(result))
+        if base is None:
+            continue
+
+        for name, new in result['metrics'].items():
+            old = base['metrics'].get(name)
+            if old is None or not old['value']:
+                continue
+
+            change = (new['value'] - old['value']) / old['value']
+            if new['better'] == 'higher':
+                change = -change
+
+            if change > threshold:
+                regressions.append(
+                    f'{describe(result)} {name}: {old["value"]:.6g} -> {new["value"]:.6g} {new["unit"]} '
+                    f'({change:+.1%} worse)'
+                )
+
+    return regressions
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.clock_suite', description=__doc__.split('\n\n')[0])
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help='run the suite')
+    run_parser.add_argument('--quick', action='store_true', help='run a reduced configuration')
+    run_parser.add_argument('--output', '-o', help='write the results to this file instead of standard output')
+
+    compare_parser = commands.add_parser('compare', help='flag regressions between two result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+    compare_parser.add_argument(
+        '--threshold', type=float, default=_DEFAULT_THRESHOLD,
+        help=f'relative change beyond which a metric has regressed (default: {_DEFAULT_THRESHOLD})'
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == 'run':
+        results = []
+        for result in run_suite(_QUICK if args.quick else _FULL):
+            print(describe(result), file=sys.stderr)
+            results.append(result)
+
+        report = json.dumps({
+            'format': FORMAT_VERSION,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'quick': args.quick,
+            'results': results,
+        }, indent=2, sort_keys=True)
+
+        if args.output is None:
+            print(report)
+        else:
+            with open(args.output, 'w') as f:
+                f.write(report + '\n')
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    with open(args.candidate) as f:
+        candidate = json.load(f)
+
+    regressions = compare(baseline, candidate, args.threshold)
+    for regression in regressions:
+        print(regression)
+    if not regressions:
+        print('No regression beyond the threshold.')
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
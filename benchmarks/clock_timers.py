@@ -0,0 +1,64 @@
+"""
+Compare the TimerStore implementations of pytils.clock as the number of pending keys grows.
+
+Each round pushes the given number of entries with uniformly distributed next_run times, then drains the store while
+advancing the time in fixed steps, as a Schedule would when woken up by due entries.
+
+Usage:
+    python -m benchmarks.clock_timers [KEYS ...]
+
+"""
+
+import random
+import sys
+import time
+
+from pytils.clock import HeapTimerStore, ScheduleEntry, ScheduleKey, TimingWheelTimerStore
+from pytils.dev.stopwatch import Stopwatch
+
+_DEFAULT_KEY_COUNTS = (1000, 10000, 100000, 300000)
+_HORIZON = 60.
+_STEP = 0.01
+
+STORES = {
+    'heap': HeapTimerStore,
+    'wheel': lambda: TimingWheelTimerStore(resolution=_STEP),
+}
+
+
+def run_round(store, next_runs):
+    """Push and drain the provided next_run times, returning the push and drain durations."""
+    stopwatch = Stopwatch(time.perf_counter)
+
+    stopwatch.set_reference_time()
+    for next_run in next_runs:
+        store.push(ScheduleEntry(next_run, ScheduleKey(None, None)), 0.)
+    stopwatch.add_mark('push')
+
+    now = 0.
+    while len(store):
+        while store.pop(now) is not None:
+            pass
+        now += _STEP
+    stopwatch.add_mark('drain')
+
+    return dict((key, interval) for interval, key in stopwatch.get_intervals())
+
+
+def main(key_counts):
+    rng = random.Random(0)
+
+    print(f'{"store":<8}{"keys":>10}{"push (us/key)":>16}{"drain (us/key)":>16}')
+    for key_count in key_counts:
+        next_runs = [rng.uniform(0., _HORIZON) for _ in range(key_count)]
+        for name, make_store in STORES.items():
+            intervals = run_round(make_store(), next_runs)
+            print(
+                f'{name:<8}{key_count:>10}'
+                f'{intervals["push"] / key_count * 1e6:>16.3f}'
+                f'{intervals["drain"] / key_count * 1e6:>16.3f}'
+            )
+
+
+if __name__ == '__main__':
+    main([int(arg) for arg in sys.argv[1:]] or _DEFAULT_KEY_COUNTS)
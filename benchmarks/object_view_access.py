@@ -0,0 +1,75 @@
+"""
+Measure the cost of repeated deep access through pytils.object_view.ObjectView, CachingObjectView and compiled paths.
+
+Usage:
+    python -m benchmarks.object_view_access [ITERATIONS]
+
+"""
+
+import sys
+import time
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import CachingObjectView, ObjectView
+
+_DEFAULT_ITERATIONS = 200000
+
+CONFIG = {
+    'service': {
+        'network': {
+            'listeners': [
+                {'port': 8080, 'tls': {'enabled': False}},
+                {'port': 8443, 'tls': {'enabled': True, 'ciphers': ['TLS_AES_128_GCM_SHA256']}},
+            ],
+        },
+        'limits': {'connections': 1024, 'timeout': 30.},
+    },
+}
+
+
+def read_dict(config, iterations: int):
+    for _ in range(iterations):
+        _ = config['service']['network']['listeners'][1]['tls']['enabled']
+        _ = config['service']['limits']['timeout']
+
+
+def read_view(view, iterations: int):
+    for _ in range(iterations):
+        _ = view.service.network.listeners[1].tls.enabled
+        _ = view.service.limits.timeout
+
+
+def read_compiled(config, iterations: int):
+    enabled = ObjectView.compile('service.network.listeners[1].tls.enabled')
+    timeout = ObjectView.compile('service.limits.timeout')
+    for _ in range(iterations):
+        _ = enabled(config)
+        _ = timeout(config)
+
+
+def read_batch(config, iterations: int):
+    ObjectView.compile_many('service.network.listeners[1].tls.enabled', 'service.limits.timeout').extract(
+        [config] * iterations
+    )
+
+
+def main(iterations: int):
+    print(f'{"access":<20}{"iterations":>12}{"total (ms)":>14}{"per read (ns)":>16}')
+    for name, read, data in (
+            ('dict', read_dict, CONFIG),
+            ('ObjectView', read_view, ObjectView.of(CONFIG)),
+            ('CachingObjectView', read_view, CachingObjectView.of(CONFIG)),
+            ('compile', read_compiled, CONFIG),
+            ('compile_many', read_batch, CONFIG)):
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        read(data, iterations)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<20}{iterations:>12}{duration * 1e3:>14.1f}{duration / iterations / 2 * 1e9:>16.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_ITERATIONS)
@@ -0,0 +1,60 @@
+"""
+Measure the memory and scan cost of records held as a list of dicts and in pytils.object_view.ColumnarObjectView.
+
+Usage:
+    python -m benchmarks.object_view_columnar [RECORDS]
+
+"""
+
+import sys
+import time
+import tracemalloc
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import ColumnarObjectView, ObjectView
+
+_DEFAULT_RECORDS = 200000
+
+
+def make_records(records: int) -> list:
+    return [{'id': i, 'price': i * 0.25, 'quantity': i % 7, 'sku': f'SKU-{i % 1000}'} for i in range(records)]
+
+
+def scan_rows(view) -> float:
+    return sum(row.price * row.quantity for row in view)
+
+
+def scan_columns(view) -> float:
+    return sum(map(float.__mul__, view.column('price'), map(float, view.column('quantity'))))
+
+
+def time_scan(scan, view) -> float:
+    stopwatch = Stopwatch(time.perf_counter)
+    stopwatch.set_reference_time()
+    scan(view)
+    stopwatch.add_mark()
+
+    (duration, _), = stopwatch.get_offsets()
+    return duration
+
+
+def main(records: int):
+    tracemalloc.start()
+    rows = make_records(records)
+    rows_size = tracemalloc.get_traced_memory()[0]
+    columns = ColumnarObjectView.of(rows)
+    del rows
+    columns_size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    rows = ObjectView.of(columns.to_records())
+
+    print(f'{records} records')
+    print(f'{"storage":<24}{"memory (MB)":>14}{"scan (ms)":>12}')
+    print(f'{"list of dicts":<24}{rows_size / 1e6:>14.1f}{time_scan(scan_rows, rows) * 1e3:>12.1f}')
+    print(f'{"columns, by row":<24}{columns_size / 1e6:>14.1f}{time_scan(scan_rows, columns) * 1e3:>12.1f}')
+    print(f'{"columns, by column":<24}{columns_size / 1e6:>14.1f}{time_scan(scan_columns, columns) * 1e3:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_RECORDS)
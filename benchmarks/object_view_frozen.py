@@ -0,0 +1,70 @@
+"""
+Measure the cost of updating one field of a large document by deep copying it and through FrozenObjectView.set_in.
+
+Usage:
+    python -m benchmarks.object_view_frozen [SECTIONS]
+
+"""
+
+import copy
+import sys
+import time
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import FrozenObjectView
+
+_DEFAULT_SECTIONS = 2000
+_UPDATES = 100
+
+
+def make_document(sections: int) -> dict:
+    return {
+        f'section{i}': {'enabled': True, 'limits': {'rate': i, 'burst': [i, 2 * i]}}
+        for i in range(sections)
+    }
+
+
+def update_copies(document: dict):
+    for i in range(_UPDATES):
+        document = copy.deepcopy(document)
+        document['section0']['limits']['rate'] = i
+
+
+def update_frozen(document: FrozenObjectView):
+    for i in range(_UPDATES):
+        document = document.set_in('section0.limits.rate', i)
+
+
+def compare_copies(document: dict):
+    copy.deepcopy(document) == document
+
+
+def compare_frozen(document: FrozenObjectView):
+    document.set_in('section0.limits.rate', -1) == document
+
+
+def main(sections: int):
+    document = make_document(sections)
+    frozen = FrozenObjectView.of(document)
+    hash(frozen)
+
+    print(f'{sections} sections, {_UPDATES} updates')
+    print(f'{"operation":<28}{"total (ms)":>14}')
+    for name, run, data in (
+        ('deepcopy + update', update_copies, document),
+        ('FrozenObjectView.set_in', update_frozen, frozen),
+        ('compare deep copy', compare_copies, document),
+        ('compare frozen update', compare_frozen, frozen),
+    ):
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        run(data)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<28}{duration * 1e3:>14.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_SECTIONS)
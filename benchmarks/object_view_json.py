@@ -0,0 +1,76 @@
+"""
+Measure the cost of reading parts of a large JSON document through ObjectView and LazyJsonView.
+
+Each access pattern is timed, and its peak memory allocation traced, from the raw document to the values read:
+
+- head: fields near the start of the document;
+- middle: a record in the middle of the top-level array;
+- tail: fields after the top-level array, and its length.
+
+Usage:
+    python -m benchmarks.object_view_json [RECORDS]
+
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import LazyJsonView, ObjectView
+
+_DEFAULT_RECORDS = 50000
+
+
+def make_document(records: int) -> bytes:
+    return json.dumps({
+        'header': {'version': 3, 'source': 'benchmark'},
+        'records': [
+            {'id': i, 'name': f'record {i}', 'values': [i, i * 0.5, None], 'tags': {'even': i % 2 == 0}}
+            for i in range(records)
+        ],
+        'footer': {'total': records},
+    }).encode()
+
+
+def eager(raw: bytes):
+    return ObjectView.of(json.loads(raw))
+
+
+def head(view):
+    return view.header.version, view.records[0].name
+
+
+def middle(view):
+    return view.records[view.footer.total // 2].tags.even
+
+
+def tail(view):
+    return view.footer.total, len(view.records)
+
+
+def main(records: int):
+    raw = make_document(records)
+    print(f'document: {len(raw) / 1e6:.1f} MB, {records} records')
+    print(f'{"access":<10}{"view":<16}{"total (ms)":>14}{"peak (MB)":>12}')
+    for access in (head, middle, tail):
+        for name, of in (('ObjectView', eager), ('LazyJsonView', LazyJsonView.of)):
+            stopwatch = Stopwatch(time.perf_counter)
+
+            stopwatch.set_reference_time()
+            access(of(raw))
+            stopwatch.add_mark()
+
+            # Trace allocations in a separate run, as tracing slows it down
+            tracemalloc.start()
+            access(of(raw))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            (duration, _), = stopwatch.get_offsets()
+            print(f'{access.__name__:<10}{name:<16}{duration * 1e3:>14.1f}{peak / 1e6:>12.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_RECORDS)
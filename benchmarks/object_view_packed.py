@@ -0,0 +1,54 @@
+"""
+Measure the cost of reading fields of packed binary records by unpacking them into dicts and through PackedObjectView.
+
+Usage:
+    python -m benchmarks.object_view_packed [RECORDS]
+
+"""
+
+import struct
+import sys
+import time
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import ObjectView, PackedObjectView, RecordSchema
+
+_DEFAULT_RECORDS = 200000
+
+ORDER = RecordSchema([('id', 'Q'), ('price', 'd'), ('quantity', 'I'), ('sku', '12s')])
+_ORDER_FORMAT = struct.Struct('<QdI12s')
+
+
+def make_buffer(records: int) -> bytes:
+    return b''.join(_ORDER_FORMAT.pack(i, i * 0.25, i % 7, b'SKU-%d' % i) for i in range(records))
+
+
+def read_dicts(buffer: bytes) -> float:
+    records = [
+        dict(zip(ORDER.fields, values))
+        for values in _ORDER_FORMAT.iter_unpack(buffer)
+    ]
+    return sum(order.price for order in ObjectView.of(records))
+
+
+def read_packed(buffer: bytes) -> float:
+    return sum(order.price for order in PackedObjectView.of(buffer, ORDER))
+
+
+def main(records: int):
+    buffer = make_buffer(records)
+    print(f'{records} records of {ORDER.size} bytes')
+    print(f'{"access":<20}{"total (ms)":>14}')
+    for name, read in (('dicts + ObjectView', read_dicts), ('PackedObjectView', read_packed)):
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        read(buffer)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<20}{duration * 1e3:>14.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_RECORDS)
@@ -0,0 +1,70 @@
+"""
+Measure the cost of finding the values matching a pattern in a large document by nested loops over views, by a Query
+traversing the raw data and by a Query of a PathIndex.
+
+Usage:
+    python -m benchmarks.object_view_query [ORDERS]
+
+"""
+
+import sys
+import time
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import ObjectView, PathIndex, Query
+
+_DEFAULT_ORDERS = 50000
+_REPEATS = 10
+
+SKUS = Query('orders.*.lines.*.sku')
+
+
+def make_document(orders: int) -> dict:
+    return {
+        'orders': [
+            {
+                'id': i,
+                'customer': {'name': f'customer {i}'},
+                'lines': [{'sku': f'SKU-{i}-{j}', 'qty': j} for j in range(4)],
+            }
+            for i in range(orders)
+        ],
+    }
+
+
+def loops(document: dict) -> list:
+    return [line.sku for order in ObjectView.of(document).orders for line in order.lines]
+
+
+def traversal(document: dict) -> list:
+    return SKUS.values(document)
+
+
+def main(orders: int):
+    document = make_document(orders)
+    stopwatch = Stopwatch(time.perf_counter)
+    stopwatch.set_reference_time()
+    index = PathIndex(document)
+    stopwatch.add_mark()
+    (build, _), = stopwatch.get_offsets()
+
+    print(f'{orders} orders, {_REPEATS} queries of {SKUS.segments}; index built in {build * 1e3:.1f} ms')
+    print(f'{"query":<22}{"per query (ms)":>16}')
+    for name, query, data in (
+        ('loops over views', loops, document),
+        ('Query of raw data', traversal, document),
+        ('Query of PathIndex', SKUS.values, index),
+    ):
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        for _ in range(_REPEATS):
+            query(data)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<22}{duration / _REPEATS * 1e3:>16.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_ORDERS)
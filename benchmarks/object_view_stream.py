@@ -0,0 +1,72 @@
+"""
+Measure the throughput and peak memory of iterating the records of a JSON file by loading it whole and by streaming it.
+
+Each iteration is timed, then run again with its peak memory allocation traced.
+
+Usage:
+    python -m benchmarks.object_view_stream [RECORDS]
+
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import ObjectView
+
+_DEFAULT_RECORDS = 200000
+
+
+def make_document(records: int) -> bytes:
+    return json.dumps({
+        'header': {'version': 3},
+        'records': [
+            {'id': i, 'name': f'record {i}', 'values': [i, i * 0.5, None], 'tags': {'even': i % 2 == 0}}
+            for i in range(records)
+        ],
+    }).encode()
+
+
+def load_whole(path: str) -> int:
+    with open(path, 'rb') as f:
+        return sum(record.id for record in ObjectView.of(json.load(f)).records)
+
+
+def stream(path: str) -> int:
+    with open(path, 'rb') as f:
+        return sum(record.id for record in ObjectView.iter_json(f, 'records'))
+
+
+def main(records: int):
+    raw = make_document(records)
+    with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
+        f.write(raw)
+
+    try:
+        print(f'document: {len(raw) / 1e6:.1f} MB, {records} records')
+        print(f'{"iteration":<28}{"total (ms)":>14}{"MB/s":>10}{"peak (MB)":>12}')
+        for name, iterate in (('json.load + ObjectView.of', load_whole), ('ObjectView.iter_json', stream)):
+            stopwatch = Stopwatch(time.perf_counter)
+
+            stopwatch.set_reference_time()
+            iterate(f.name)
+            stopwatch.add_mark()
+
+            # Traced separately, as tracing slows allocations down
+            tracemalloc.start()
+            iterate(f.name)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            (duration, _), = stopwatch.get_offsets()
+            print(f'{name:<28}{duration * 1e3:>14.1f}{len(raw) / 1e6 / duration:>10.1f}{peak / 1e6:>12.1f}')
+    finally:
+        os.remove(f.name)
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_RECORDS)
@@ -0,0 +1,57 @@
+"""
+Measure the cost of persisting a few writes to a large document by serializing it whole and its delta only.
+
+Usage:
+    python -m benchmarks.object_view_tracked [NODES]
+
+"""
+
+import json
+import sys
+import time
+
+from pytils.dev.stopwatch import Stopwatch
+from pytils.object_view import ObjectView, TrackedObjectView
+
+_DEFAULT_NODES = 20000
+_WRITES = 100
+
+
+def make_state(nodes: int) -> dict:
+    return {f'node{i}': {'load': i, 'peers': [f'node{j}' for j in range(i, i + 8)]} for i in range(nodes)}
+
+
+def write(view: ObjectView):
+    for i in range(_WRITES):
+        view[f'node{i}'].load = -i
+
+
+def persist_whole(state: dict) -> str:
+    view = ObjectView.of(state)
+    write(view)
+    return json.dumps(view())
+
+
+def persist_delta(state: dict) -> str:
+    view = TrackedObjectView.of(state)
+    write(view)
+    return json.dumps(view.checkpoint())
+
+
+def main(nodes: int):
+    print(f'{nodes} nodes, {_WRITES} writes')
+    print(f'{"persistence":<16}{"total (ms)":>14}{"size (kB)":>14}')
+    for name, persist in (('whole document', persist_whole), ('delta', persist_delta)):
+        state = make_state(nodes)
+        stopwatch = Stopwatch(time.perf_counter)
+
+        stopwatch.set_reference_time()
+        serialized = persist(state)
+        stopwatch.add_mark()
+
+        (duration, _), = stopwatch.get_offsets()
+        print(f'{name:<16}{duration * 1e3:>14.1f}{len(serialized) / 1e3:>14.1f}')
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else _DEFAULT_NODES)
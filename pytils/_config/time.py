@@ -3,7 +3,7 @@ from typing import Callable
 
 __all__ = [
     'TimeType', 'ZERO_DURATION',
-    'TimeSupplier', 'DEFAULT_TIME_SUPPLIER'
+    'TimeSupplier', 'DEFAULT_TIME_SUPPLIER', 'MONOTONIC_TIME_SUPPLIER'
 ]
 
 TimeType = float
@@ -11,3 +11,4 @@ ZERO_DURATION = 0.
 
 TimeSupplier = Callable[[], TimeType]
 DEFAULT_TIME_SUPPLIER = time.time
+MONOTONIC_TIME_SUPPLIER = time.monotonic
@@ -0,0 +1,47 @@
+from ._async import AsyncClock, AsyncSchedule
+from ._base import (
+    Action, BatchHandler, CatchUpPolicy, FixedRate, Handler, KeyStats, ScheduleEntry, ScheduleKey, wrap_action
+)
+from ._clock import Clock, LanePolicy, LaneStats, OverflowPolicy, QueueFullError, QueueStats, SchedulingQueue
+from ._metrics import Histogram, HistogramSnapshot, MetricsSnapshot, SchedulerMetrics
+from ._process import ProcessPoolHandler
+from ._schedule import DispatchStats, Schedule, ScheduledRun
+from ._sharded import ShardedSchedule
+from ._timers import HeapTimerStore, TimerStore, TimingWheelTimerStore
+from ._virtual import VirtualClock, VirtualTime
+from .._config.time import TimeSupplier, TimeType
+
+__all__ = [
+    'Action',
+    'AsyncClock',
+    'AsyncSchedule',
+    'BatchHandler',
+    'CatchUpPolicy',
+    'Clock',
+    'DispatchStats',
+    'FixedRate',
+    'Handler',
+    'HeapTimerStore',
+    'Histogram',
+    'HistogramSnapshot',
+    'KeyStats',
+    'LanePolicy',
+    'LaneStats',
+    'MetricsSnapshot',
+    'OverflowPolicy',
+    'ProcessPoolHandler',
+    'QueueFullError',
+    'QueueStats',
+    'Schedule',
+    'ScheduleKey',
+    'ScheduledRun',
+    'SchedulerMetrics',
+    'SchedulingQueue',
+    'ShardedSchedule',
+    'TimeSupplier',
+    'TimeType',
+    'TimerStore',
+    'TimingWheelTimerStore',
+    'VirtualClock',
+    'VirtualTime',
+]
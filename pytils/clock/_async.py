@@ -0,0 +1,179 @@
+import asyncio
+import inspect
+from typing import Dict, Optional, Set
+
+from ._base import Action, FixedRate, LOGGER, ScheduleKey
+from ._schedule import _plan_next_run, _record_start, _validate_timing
+from .._config.time import MONOTONIC_TIME_SUPPLIER, TimeSupplier, TimeType, ZERO_DURATION
+
+__all__ = [
+    'AsyncClock',
+    'AsyncSchedule',
+]
+
+
+class AsyncClock:
+    """Clock that runs its schedule on an asyncio event loop instead of daemon threads."""
+
+    def __init__(
+            self,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            loop: Optional[asyncio.AbstractEventLoop] = None):
+        self._schedule = AsyncSchedule(s_time, loop)
+
+    @property
+    def schedule(self) -> 'AsyncSchedule':
+        return self._schedule
+
+    def close(self):
+        self._schedule.close()
+
+
+class AsyncSchedule:
+    """
+    Schedule that fires its actions through the call_at method of an asyncio event loop.
+
+    Actions may be plain callables or coroutine functions; the result of a plain callable is awaited if it is awaitable.
+    A periodic key is readmitted once its action, including any awaited result, has completed, exactly as done by
+    Schedule.
+
+    No threads are involved: all methods must be called from the thread running the event loop. If no loop is provided,
+    the running loop at the time of the first registration is used.
+
+    """
+
+    def __init__(
+            self,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.s_time = s_time
+
+        self._loop = loop
+        self._handles = {}  # type: Dict[ScheduleKey, asyncio.TimerHandle]
+        self._tasks = set()  # type: Set[asyncio.Future]
+
+    @property
+    def live_count(self) -> int:
+        """Get the number of pending runs."""
+        return len(self._handles)
+
+    def register(
+            self,
+            action: Action,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None,
+            fixed_rate: Optional[FixedRate] = None) -> ScheduleKey:
+        _validate_timing(period, delay, fixed_rate)
+
+        key = ScheduleKey(period, action, fixed_rate)
+        self._admit_first(key, self.s_time() + (delay or ZERO_DURATION))
+
+        return key
+
+    def cancel(self, key: ScheduleKey) -> bool:
+        """
+        Cancel the provided key so that its action is no longer run.
+
+        A run of the action that is already in progress is allowed to complete, but is not readmitted.
+
+        Returns:
+            Whether the key was cancelled by this call, as opposed to having been cancelled already.
+
+        """
+        if key.is_cancelled:
+            return False
+
+        key._is_cancelled = True
+        self._kill(key)
+
+        return True
+
+    def reschedule(
+            self,
+            key: ScheduleKey,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None) -> ScheduleKey:
+        """
+        Replace the period of the provided key and schedule its next run after the provided delay.
+
+        Any pending run of the key is discarded. A run of the action that is already in progress is allowed to complete,
+        but is not readmitted.
+
+        """
+        _validate_timing(period, delay, key.fixed_rate)
+        if key.is_cancelled:
+            raise ValueError('key has been cancelled')
+
+        self._kill(key)
+        key.period = period
+        self._admit_first(key, self.s_time() + (delay or ZERO_DURATION))
+
+        return key
+
+    def close(self):
+        """Cancel every pending run and every awaited action in progress."""
+        for key, handle in self._handles.items():
+            key._is_pending = False
+            handle.cancel()
+        self._handles.clear()
+
+        for task in self._tasks:
+            task.cancel()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop
+
+    def _admit_first(self, key: ScheduleKey, next_run: TimeType):
+        key._slot = next_run
+        self._admit(key, next_run)
+
+    def _admit(self, key: ScheduleKey, next_run: TimeType):
+        loop = self._get_loop()
+        when = loop.time() + max(ZERO_DURATION, next_run - self.s_time())
+
+        key._is_pending = True
+        self._handles[key] = loop.call_at(when, self._fire, key, next_run)
+
+    def _kill(self, key: ScheduleKey):
+        key._generation += 1
+        if key._is_pending:
+            key._is_pending = False
+            self._handles.pop(key).cancel()
+
+    def _fire(self, key: ScheduleKey, scheduled_time: TimeType):
+        del self._handles[key]
+        key._is_pending = False
+
+        generation = key._generation
+        started = self.s_time()
+        _record_start(key, scheduled_time, started)
+
+        try:
+            result = key.action()
+        except Exception:
+            LOGGER.exception('Scheduled task raised an exception')
+            self._readmit(key, generation, started)
+            return
+
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result, loop=self._loop)
+            self._tasks.add(task)
+            task.add_done_callback(lambda t: self._complete(key, generation, started, t))
+        else:
+            self._readmit(key, generation, started)
+
+    def _complete(self, key: ScheduleKey, generation: int, started: TimeType, task: asyncio.Future):
+        self._tasks.discard(task)
+        if task.cancelled():
+            return
+
+        exception = task.exception()
+        if exception is not None:
+            LOGGER.error('Scheduled task raised an exception', exc_info=exception)
+        self._readmit(key, generation, started)
+
+    def _readmit(self, key: ScheduleKey, generation: int, started: TimeType):
+        if key.period is not None and key._generation == generation:
+            self._admit(key, _plan_next_run(key, started, self.s_time()))
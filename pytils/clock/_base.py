@@ -0,0 +1,154 @@
+import enum
+import functools
+import logging
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+__all__ = [
+    'Action',
+    'BatchHandler',
+    'CatchUpPolicy',
+    'FixedRate',
+    'Handler',
+    'KeyStats',
+    'LOGGER',
+    'ScheduleEntry',
+    'ScheduleKey',
+    'wrap_action',
+]
+
+_DEFAULT_MAX_BURST = 8
+
+#
+# Convenience Function
+
+wrap_action = functools.partial
+
+
+#
+# Data Definitions
+
+class CatchUpPolicy(enum.Enum):
+    """Policy for the runs of a fixed-rate key that were missed because a previous run ended too late."""
+
+    SKIP = 'skip'
+    """Drop every missed run and resume at the next slot that is still ahead."""
+
+    COALESCE = 'coalesce'
+    """Replace every missed run with a single immediate run."""
+
+    BURST = 'burst'
+    """Perform the missed runs back to back, dropping the oldest ones beyond max_burst."""
+
+
+class FixedRate(NamedTuple):
+    """
+    Fixed-rate scheduling mode for a periodic key.
+
+    The runs of a fixed-rate key are due at fixed slots, one period apart from the first run, regardless of how long
+    each run takes. Runs whose slot has passed by the time the previous run completes are handled according to the
+    catch-up policy.
+
+    """
+
+    catch_up: CatchUpPolicy = CatchUpPolicy.COALESCE
+    max_burst: int = _DEFAULT_MAX_BURST
+
+
+class KeyStats(NamedTuple):
+    """
+    Statistics on the runs of a ScheduleKey.
+
+    The drift of a run is the time from its slot (fixed-rate keys) or from its due time (other keys) to its start.
+    Overruns count the runs that ended after the next run was due; missed counts the runs that were dropped or merged
+    as a result.
+
+    """
+
+    runs: int
+    missed: int
+    overruns: int
+    last_drift: float
+    max_drift: float
+    total_drift: float
+
+    @property
+    def mean_drift(self) -> float:
+        return self.total_drift / self.runs if self.runs else 0.
+
+
+class ScheduleKey:
+    """
+    Handle for an action registered with a Schedule.
+
+    Keys compare by identity, so that registering the same action twice yields two independently cancellable keys.
+
+    """
+
+    __slots__ = (
+        'period', 'action', 'fixed_rate', 'slack', 'priority',
+        '_generation', '_is_pending', '_is_cancelled', '_slot',
+        '_runs', '_missed', '_overruns', '_last_drift', '_max_drift', '_total_drift',
+    )
+
+    def __init__(
+            self,
+            period: Optional[float],
+            action: 'Action',
+            fixed_rate: Optional[FixedRate] = None,
+            slack: float = 0.,
+            priority: int = 0):
+        self.period = period
+        self.action = action
+        self.fixed_rate = fixed_rate
+        self.slack = slack
+        self.priority = priority
+
+        # Entries stamped with an older generation than their key are dead and are skipped at dispatch
+        self._generation = 0
+        self._is_pending = False
+        self._is_cancelled = False
+
+        # Slot of the current or upcoming run of a fixed-rate key
+        self._slot = 0.
+
+        self._runs = 0
+        self._missed = 0
+        self._overruns = 0
+        self._last_drift = 0.
+        self._max_drift = 0.
+        self._total_drift = 0.
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(period={self.period!r}, action={self.action!r})'
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Get whether this key has been cancelled."""
+        return self._is_cancelled
+
+    @property
+    def stats(self) -> KeyStats:
+        """Get the statistics on the runs of this key."""
+        return KeyStats(
+            self._runs, self._missed, self._overruns,
+            self._last_drift, self._max_drift, self._total_drift
+        )
+
+
+class ScheduleEntry(NamedTuple):
+    next_run: float
+    key: 'ScheduleKey'
+    generation: int = 0
+    window_start: Optional[float] = None
+
+    @property
+    def earliest(self) -> float:
+        """Get the earliest time at which this entry may be dispatched."""
+        return self.next_run if self.window_start is None else self.window_start
+
+
+Action = Callable[[], Any]
+Handler = Callable[[Action], Any]
+BatchHandler = Callable[[Sequence[Action]], Any]
+
+LOGGER = logging.getLogger('pytils.clock')
@@ -0,0 +1,432 @@
+import enum
+import time
+from collections import deque
+from threading import Condition
+from typing import Deque, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from pytils.mixins import DaemonHandler
+from ._base import Action, LOGGER
+from ._metrics import SchedulerMetrics
+from ._schedule import Schedule, ScheduledRun
+from ._sharded import ShardedSchedule
+from ._timers import TimerStore
+from .._config.time import MONOTONIC_TIME_SUPPLIER, TimeSupplier
+
+__all__ = [
+    'Clock',
+    'LanePolicy',
+    'LaneStats',
+    'OverflowPolicy',
+    'QueueFullError',
+    'QueueStats',
+    'SchedulingQueue',
+]
+
+_DEFAULT_MAX_TASK_QUEUE_SIZE = 4096
+
+
+class OverflowPolicy(enum.Enum):
+    """Policy for due actions that arrive at a full SchedulingQueue."""
+
+    BLOCK = 'block'
+    """Block the dispatching Schedule until there is room in the queue."""
+
+    REJECT = 'reject'
+    """Raise a QueueFullError to the dispatching Schedule, which skips the run."""
+
+    DROP_OLDEST = 'drop_oldest'
+    """Skip the run of the oldest queued action to make room."""
+
+    DROP_NEWEST = 'drop_newest'
+    """Skip the run of the arriving action."""
+
+
+class LanePolicy(enum.Enum):
+    """Policy by which a SchedulingQueue picks the lane to serve next."""
+
+    STRICT = 'strict'
+    """Always serve the most urgent non-empty lane."""
+
+    WEIGHTED = 'weighted'
+    """Serve the non-empty lanes in proportion to their weights, by smooth weighted round-robin."""
+
+
+class QueueFullError(RuntimeError):
+    """Error raised when an action is rejected by a full SchedulingQueue."""
+
+
+class QueueStats(NamedTuple):
+    """Backpressure statistics of a SchedulingQueue."""
+
+    depth: int
+    dropped: int
+    rejected: int
+    blocked_time: float
+
+
+class LaneStats(NamedTuple):
+    """
+    Statistics on one lane of a SchedulingQueue.
+
+    Wait times are measured by time.perf_counter from enqueue to dequeue. Promoted counts the actions served ahead of
+    more urgent lanes because they had waited longer than max_lane_wait.
+
+    """
+
+    depth: int
+    dequeued: int
+    promoted: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def mean_wait(self) -> float:
+        return self.total_wait / self.dequeued if self.dequeued else 0.
+
+
+class Clock:
+
+    def __init__(
+            self,
+            max_queue_size: int = _DEFAULT_MAX_TASK_QUEUE_SIZE,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            timers: Optional[TimerStore] = None,
+            workers: int = 0,
+            overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+            metrics: Optional[SchedulerMetrics] = None,
+            lanes: int = 1,
+            lane_policy: LanePolicy = LanePolicy.STRICT,
+            lane_weights: Optional[Sequence[int]] = None,
+            max_lane_wait: Optional[float] = None,
+            shards: int = 1):
+        self._scheduling_queue = SchedulingQueue(
+            max_queue_size, s_time, timers, workers, overflow_policy, metrics,
+            lanes, lane_policy, lane_weights, max_lane_wait, shards
+        )
+
+    @property
+    def schedule(self):
+        return self._scheduling_queue.schedule
+
+    def run_scheduler(self):
+        self.schedule.run()
+
+    def start_scheduler(self):
+        self.schedule.start()
+
+    def run_handler(self):
+        self._scheduling_queue.run()
+
+    def start_handler(self):
+        self._scheduling_queue.start()
+
+    def resize_workers(self, num_workers: int, max_workers: Optional[int] = None):
+        self._scheduling_queue.resize(num_workers, max_workers)
+
+    def stop_workers(self, timeout: Optional[float] = None) -> bool:
+        return self._scheduling_queue.stop(timeout)
+
+
+class SchedulingQueue(DaemonHandler):
+    """
+    Queue of due actions dispatched by a Schedule.
+
+    Actions are run outside of the queue lock, either by daemon threads spawned through start or by a managed pool of
+    worker threads, whose size is set through resize and which scales with the queue depth between its bounds. Both may
+    be used at the same time; stop drains the queue before stopping the pool.
+
+    Once max_queue_size actions are waiting, arriving actions are handled according to the overflow policy. The runs
+    that are dropped or rejected are skipped, so that periodic keys are readmitted as if they had run. Dropping the
+    oldest action drops it from the least urgent lane holding any action.
+
+    Actions are queued in one FIFO lane per priority, the runs of a key going to the lane of its priority (capped at
+    the last lane) and other actions to lane 0, the most urgent. The lane to serve next is picked according to the lane
+    policy; to protect the less urgent lanes from starvation, an action that has waited longer than max_lane_wait is
+    served first regardless of its lane.
+
+    """
+
+    def __init__(
+            self,
+            max_queue_size: int = _DEFAULT_MAX_TASK_QUEUE_SIZE,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            timers: Optional[TimerStore] = None,
+            workers: int = 0,
+            overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+            metrics: Optional[SchedulerMetrics] = None,
+            lanes: int = 1,
+            lane_policy: LanePolicy = LanePolicy.STRICT,
+            lane_weights: Optional[Sequence[int]] = None,
+            max_lane_wait: Optional[float] = None,
+            shards: int = 1):
+        """
+        Initialize an empty SchedulingQueue instance.
+
+        Args:
+            max_queue_size: The number of actions beyond which the overflow policy applies.
+                (Defaults to 4096.)
+            s_time: The time supplier of the Schedule.
+                (Defaults to time.monotonic.)
+            timers: The timer store of the Schedule.
+                (Defaults to None, i.e. a HeapTimerStore.)
+            workers: The initial number of worker threads.
+                (Defaults to 0.)
+            overflow_policy: The policy for actions arriving at a full queue.
+                (Defaults to OverflowPolicy.DROP_OLDEST.)
+            metrics: The metrics to record, if any.
+                (Defaults to None.)
+            lanes: The number of priority lanes.
+                (Defaults to 1.)
+            lane_policy: The policy by which to pick the lane to serve next.
+                (Defaults to LanePolicy.STRICT.)
+            lane_weights: The weights of the lanes under LanePolicy.WEIGHTED.
+                (Defaults to None, i.e. each lane weighs twice as much as the next.)
+            max_lane_wait: The wait, in seconds, beyond which an action is served first regardless of its lane.
+                (Defaults to None, i.e. no starvation protection.)
+            shards: The number of shards of the schedule; more than one shard yields a ShardedSchedule, whose shards
+                cannot share the provided timer store.
+                (Defaults to 1.)
+
+        """
+        if max_queue_size < 1:
+            raise ValueError('max_queue_size must be positive')
+        if lanes < 1:
+            raise ValueError('lanes must be positive')
+        if lane_weights is None:
+            lane_weights = [2 ** (lanes - 1 - lane) for lane in range(lanes)]
+        elif len(lane_weights) != lanes or min(lane_weights) < 1:
+            raise ValueError('lane_weights must hold one positive weight per lane')
+        if max_lane_wait is not None and max_lane_wait < 0:
+            raise ValueError('max_lane_wait must be non-negative')
+        if shards < 1:
+            raise ValueError('shards must be positive')
+        if shards > 1 and timers is not None:
+            raise ValueError('timers cannot be shared across shards')
+
+        self._cv = Condition()
+        self._lanes = [deque() for _ in range(lanes)]  # type: List[Deque[Tuple[float, Action]]]
+        self._size = 0
+        self._max_queue_size = max_queue_size
+        self._overflow_policy = overflow_policy
+
+        self._lane_policy = lane_policy
+        self._lane_weights = tuple(lane_weights)
+        self._lane_credits = [0] * lanes
+        self._max_lane_wait = max_lane_wait
+
+        self._lane_dequeued = [0] * lanes
+        self._lane_promoted = [0] * lanes
+        self._lane_total_wait = [0.] * lanes
+        self._lane_max_wait = [0.] * lanes
+
+        self._dropped = 0
+        self._rejected = 0
+        self._blocked_time = 0.
+
+        self._metrics = metrics
+        if shards > 1:
+            self._schedule = ShardedSchedule(
+                self._enqueue, s_time, shards, metrics=metrics, batch_handler=self._enqueue_many
+            )  # type: Union[Schedule, ShardedSchedule]
+        else:
+            self._schedule = Schedule(self._enqueue, s_time, timers, metrics=metrics, batch_handler=self._enqueue_many)
+
+        if workers:
+            self.resize(workers)
+
+    @property
+    def schedule(self):
+        return self._schedule
+
+    @property
+    def stats(self) -> QueueStats:
+        """Get the backpressure statistics of this queue."""
+        with self._cv:
+            return QueueStats(self._size, self._dropped, self._rejected, self._blocked_time)
+
+    @property
+    def lane_stats(self) -> Tuple[LaneStats, ...]:
+        """Get the statistics on each lane of this queue, from the most urgent to the least urgent."""
+        with self._cv:
+            return tuple(
+                LaneStats(
+                    len(self._lanes[lane]), self._lane_dequeued[lane], self._lane_promoted[lane],
+                    self._lane_total_wait[lane], self._lane_max_wait[lane]
+                )
+                for lane in range(len(self._lanes))
+            )
+
+    @property
+    def num_workers(self) -> int:
+        """Get the number of running worker threads."""
+        return self.thread_count
+
+    def resize(self, num_workers: int, max_workers: Optional[int] = None):
+        """
+        Set the number of worker threads, or the bounds between which it scales with the queue depth.
+
+        Missing workers are started immediately. Excess workers exit as soon as they are done with their current action.
+
+        """
+        if num_workers < 0:
+            raise ValueError('num_workers must be non-negative')
+
+        self.resize_pool(num_workers, max_workers)
+
+    def load(self) -> float:
+        return self._size
+
+    def wakeup(self):
+        with self._cv:
+            self._cv.notify_all()
+
+    def handle_one(self):
+        with self._cv:
+            self._cv.wait_for(self._has_work_or_should_yield)
+            if not self._size:
+                return False
+
+            action = self._dequeue()
+
+        _run_action(action)
+
+    def _has_work_or_should_yield(self) -> bool:
+        return self._size > 0 or self.should_yield()
+
+    def _is_full(self) -> bool:
+        return self._size >= self._max_queue_size
+
+    def _lane_of(self, action: Action) -> int:
+        if isinstance(action, ScheduledRun):
+            return min(action.key.priority, len(self._lanes) - 1)
+        return 0
+
+    def _enqueue(self, action: Action):
+        with self._cv:
+            skipped = self._offer(action)
+
+        if isinstance(skipped, ScheduledRun):
+            skipped.skip()
+
+    def _enqueue_many(self, actions: Sequence[Action]):
+        skipped = []  # type: List[Action]
+
+        with self._cv:
+            for action in actions:
+                try:
+                    dropped = self._offer(action)
+                except QueueFullError as e:
+                    LOGGER.warning('Scheduled task was not accepted by the handler: %r', e)
+                    dropped = action
+
+                if dropped is not None:
+                    skipped.append(dropped)
+
+        for action in skipped:
+            if isinstance(action, ScheduledRun):
+                action.skip()
+
+    def _offer(self, action: Action) -> Optional[Action]:
+        """Add an action to the queue according to the overflow policy and return the action to skip, if any."""
+        skipped = None
+        lane = self._lane_of(action)
+
+        if self._is_full():
+            policy = self._overflow_policy
+            if policy is OverflowPolicy.BLOCK:
+                blocked_at = time.perf_counter()
+                self._cv.wait_for(lambda: not self._is_full())
+                self._blocked_time += time.perf_counter() - blocked_at
+            elif policy is OverflowPolicy.REJECT:
+                self._rejected += 1
+                raise QueueFullError('scheduling queue is full')
+            else:
+                self._dropped += 1
+
+                victim = max(index for index, queued in enumerate(self._lanes) if queued)
+                if policy is OverflowPolicy.DROP_NEWEST or lane > victim:
+                    return action
+
+                _, skipped = self._lanes[victim].popleft()
+                self._size -= 1
+
+        enqueued_at = time.perf_counter()
+        self._lanes[lane].append((enqueued_at, action))
+        self._size += 1
+        self._cv.notify()
+        self.rescale_pool()
+
+        if self._metrics is not None:
+            if isinstance(action, ScheduledRun):
+                action.enqueued_at = enqueued_at
+            self._metrics.record_enqueue(self._size)
+
+        return skipped
+
+    def _dequeue(self) -> Action:
+        was_full = self._is_full()
+        now = time.perf_counter()
+
+        lane = self._pick_lane(now)
+        enqueued_at, action = self._lanes[lane].popleft()
+        self._size -= 1
+
+        wait = now - enqueued_at
+        self._lane_dequeued[lane] += 1
+        self._lane_total_wait[lane] += wait
+        if wait > self._lane_max_wait[lane]:
+            self._lane_max_wait[lane] = wait
+
+        if self._metrics is not None and getattr(action, 'enqueued_at', None) is not None:
+            self._metrics.record_dequeue(wait)
+
+        # A blocked producer may be waiting alongside the consumers; make sure that it is woken up
+        if was_full:
+            self._cv.notify_all()
+        else:
+            self._cv.notify()
+
+        return action
+
+    def _pick_lane(self, now: float) -> int:
+        lanes = self._lanes
+        if len(lanes) == 1:
+            return 0
+
+        if self._max_lane_wait is not None:
+            # Serve the longest-waiting action that has been starved for too long, if any
+            starved = None
+            deadline = now - self._max_lane_wait
+            for lane, queued in enumerate(lanes):
+                if queued and queued[0][0] < deadline and (starved is None or queued[0][0] < lanes[starved][0][0]):
+                    starved = lane
+
+            if starved is not None:
+                if any(lanes[lane] for lane in range(starved)):
+                    self._lane_promoted[starved] += 1
+                return starved
+
+        if self._lane_policy is LanePolicy.STRICT:
+            return next(lane for lane, queued in enumerate(lanes) if queued)
+
+        # Smooth weighted round-robin over the non-empty lanes
+        credits = self._lane_credits
+        total_weight = 0
+        chosen = None
+        for lane, queued in enumerate(lanes):
+            if queued:
+                weight = self._lane_weights[lane]
+                credits[lane] += weight
+                total_weight += weight
+                if chosen is None or credits[lane] > credits[chosen]:
+                    chosen = lane
+
+        credits[chosen] -= total_weight
+        return chosen
+
+
+def _run_action(action: Action):
+    try:
+        action()
+    except Exception:
+        LOGGER.exception('Scheduled task raised an exception')
@@ -0,0 +1,194 @@
+import bisect
+from threading import Lock
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from ._base import ScheduleKey
+
+__all__ = [
+    'DEFAULT_DURATION_BOUNDS',
+    'DEFAULT_SIZE_BOUNDS',
+    'Histogram',
+    'HistogramSnapshot',
+    'MetricsSnapshot',
+    'SchedulerMetrics',
+]
+
+DEFAULT_DURATION_BOUNDS = (
+    1e-5, 2.5e-5, 5e-5,
+    1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3,
+    1e-2, 2.5e-2, 5e-2,
+    1e-1, 2.5e-1, 5e-1,
+    1., 2.5, 5.,
+    10., 30., 60.,
+)
+DEFAULT_SIZE_BOUNDS = tuple(4 ** exponent for exponent in range(11))
+
+
+class HistogramSnapshot(NamedTuple):
+    """
+    Snapshot of a Histogram.
+
+    counts[i] is the number of values v recorded with bounds[i - 1] < v <= bounds[i]; the last count holds the values
+    beyond the last bound.
+
+    """
+
+    bounds: Sequence[float]
+    counts: Sequence[int]
+    count: int
+    total: float
+    max: float
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.
+
+    def quantile(self, q: float) -> float:
+        """Get an upper estimate of the q-quantile, i.e. the bound of the bucket holding it."""
+        if not 0. <= q <= 1.:
+            raise ValueError('q must be in [0, 1]')
+        if not self.count:
+            return 0.
+
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+
+class Histogram:
+    """
+    Histogram over fixed bucket bounds.
+
+    Histogram is not thread-safe; concurrent recordings must be serialized by the caller.
+
+    """
+
+    __slots__ = ('_bounds', '_counts', '_count', '_total', '_max')
+
+    def __init__(self, bounds: Sequence[float] = DEFAULT_DURATION_BOUNDS):
+        if list(bounds) != sorted(set(bounds)):
+            raise ValueError('bounds must be strictly increasing')
+
+        self._bounds = tuple(bounds)
+        self._counts = [0] * (len(self._bounds) + 1)  # type: List[int]
+        self._count = 0
+        self._total = 0.
+        self._max = 0.
+
+    def record(self, value: float):
+        self._counts[bisect.bisect_left(self._bounds, value)] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(self._bounds, tuple(self._counts), self._count, self._total, self._max)
+
+
+class MetricsSnapshot(NamedTuple):
+    """Snapshot of SchedulerMetrics."""
+
+    dispatch_lag: HistogramSnapshot
+    queue_wait: HistogramSnapshot
+    action_duration: HistogramSnapshot
+    timer_count: HistogramSnapshot
+    queue_depth: HistogramSnapshot
+    key_durations: Dict[ScheduleKey, HistogramSnapshot]
+
+
+class SchedulerMetrics:
+    """
+    Opt-in instrumentation of a Schedule and of its SchedulingQueue.
+
+    The following are recorded:
+
+    - dispatch_lag: the time from the due time of an entry to its dispatch, as measured by the time supplier of the
+      Schedule;
+    - queue_wait: the time spent by a due action in the SchedulingQueue, as measured by time.perf_counter;
+    - action_duration: the duration of each run, as measured by time.perf_counter, overall and per periodic key;
+    - timer_count: the number of live pending entries of the Schedule, sampled at each dispatch;
+    - queue_depth: the number of actions in the SchedulingQueue, sampled at each enqueue.
+
+    """
+
+    def __init__(
+            self,
+            duration_bounds: Sequence[float] = DEFAULT_DURATION_BOUNDS,
+            size_bounds: Sequence[float] = DEFAULT_SIZE_BOUNDS,
+            per_key: bool = True):
+        """
+        Initialize an empty SchedulerMetrics instance.
+
+        Args:
+            duration_bounds: The bucket bounds of the duration histograms.
+                (Defaults to DEFAULT_DURATION_BOUNDS.)
+            size_bounds: The bucket bounds of the size histograms.
+                (Defaults to DEFAULT_SIZE_BOUNDS.)
+            per_key: Whether to keep one action duration histogram per periodic key, until it is cancelled.
+                (Defaults to True.)
+
+        """
+        self._lock = Lock()
+        self._duration_bounds = tuple(duration_bounds)
+
+        self._dispatch_lag = Histogram(duration_bounds)
+        self._queue_wait = Histogram(duration_bounds)
+        self._action_duration = Histogram(duration_bounds)
+        self._timer_count = Histogram(size_bounds)
+        self._queue_depth = Histogram(size_bounds)
+        self._key_durations = {} if per_key else None  # type: Optional[Dict[ScheduleKey, Histogram]]
+
+    def record_dispatch(self, lag: float, timer_count: int):
+        with self._lock:
+            self._dispatch_lag.record(lag)
+            self._timer_count.record(timer_count)
+
+    def record_enqueue(self, queue_depth: int):
+        with self._lock:
+            self._queue_depth.record(queue_depth)
+
+    def record_dequeue(self, wait: float):
+        with self._lock:
+            self._queue_wait.record(wait)
+
+    def record_run(self, key: ScheduleKey, duration: float):
+        with self._lock:
+            self._action_duration.record(duration)
+
+            if self._key_durations is not None:
+                if key.period is None:
+                    # One-shot keys are not run again, so their histograms would never be discarded
+                    self._key_durations.pop(key, None)
+                    return
+
+                histogram = self._key_durations.get(key)
+                if histogram is None:
+                    histogram = self._key_durations[key] = Histogram(self._duration_bounds)
+                histogram.record(duration)
+
+    def discard_key(self, key: ScheduleKey):
+        """Discard the action duration histogram of the provided key, e.g. once it has been cancelled."""
+        with self._lock:
+            if self._key_durations is not None:
+                self._key_durations.pop(key, None)
+
+    def snapshot(self) -> MetricsSnapshot:
+        with self._lock:
+            return MetricsSnapshot(
+                self._dispatch_lag.snapshot(),
+                self._queue_wait.snapshot(),
+                self._action_duration.snapshot(),
+                self._timer_count.snapshot(),
+                self._queue_depth.snapshot(),
+                {
+                    key: histogram.snapshot()
+                    for key, histogram in (self._key_durations or {}).items()
+                },
+            )
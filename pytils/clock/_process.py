@@ -0,0 +1,105 @@
+import functools
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import RLock
+from typing import Any, Callable, Dict, Optional
+
+from ._base import Action, LOGGER, ScheduleKey
+from ._schedule import ScheduledRun
+
+__all__ = [
+    'ProcessPoolHandler',
+]
+
+ResultCallback = Callable[[ScheduleKey, Any], Any]
+ErrorCallback = Callable[[ScheduleKey, BaseException], Any]
+
+
+class ProcessPoolHandler:
+    """
+    Handler that runs the actions dispatched by a Schedule in a pool of worker processes.
+
+    Actions must be picklable, e.g. module-level functions or functools.partial objects thereof. The periodic keys of
+    the dispatching Schedule are readmitted by the scheduling process once their run completes in the pool, so the runs
+    of one key never overlap; should a run of a key be dispatched while a previous run is still in progress (e.g. after
+    rescheduling), it is deferred until the previous run completes.
+
+    Results and exceptions are delivered to the provided callbacks in the scheduling process. By default, results are
+    discarded and exceptions are logged.
+
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            on_result: Optional[ResultCallback] = None,
+            on_error: Optional[ErrorCallback] = None):
+        self._executor = ProcessPoolExecutor(max_workers)
+        self._on_result = on_result
+        self._on_error = on_error
+
+        self._lock = RLock()
+        self._is_shut_down = False
+        self._in_flight = {}  # type: Dict[ScheduleKey, Future]
+        self._deferred = {}  # type: Dict[ScheduleKey, ScheduledRun]
+
+    @property
+    def in_flight_count(self) -> int:
+        """Get the number of runs in progress in the pool."""
+        with self._lock:
+            return len(self._in_flight)
+
+    def __call__(self, action: Action):
+        if not isinstance(action, ScheduledRun):
+            self._executor.submit(action).add_done_callback(_log_exception)
+            return
+
+        with self._lock:
+            if action.key in self._in_flight:
+                self._deferred[action.key] = action
+                return
+
+            self._submit(action)
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the pool; runs that complete after this call are not readmitted."""
+        self._is_shut_down = True
+        self._executor.shutdown(wait)
+
+    def _submit(self, run: ScheduledRun):
+        run.begin()
+
+        future = self._executor.submit(run.key.action)
+        self._in_flight[run.key] = future
+        future.add_done_callback(functools.partial(self._complete, run))
+
+    def _complete(self, run: ScheduledRun, future: Future):
+        key = run.key
+        with self._lock:
+            del self._in_flight[key]
+            deferred = self._deferred.pop(key, None)
+
+        if future.cancelled():
+            return
+
+        try:
+            exception = future.exception()
+            if exception is None:
+                if self._on_result is not None:
+                    self._on_result(key, future.result())
+            elif self._on_error is not None:
+                self._on_error(key, exception)
+            else:
+                LOGGER.error('Scheduled task raised an exception', exc_info=exception)
+        finally:
+            # Readmit periodic keys whether or not their run failed
+            if not self._is_shut_down:
+                run.complete()
+
+        if deferred is not None and not self._is_shut_down:
+            with self._lock:
+                self._submit(deferred)
+
+
+def _log_exception(future: Future):
+    if not future.cancelled() and future.exception() is not None:
+        LOGGER.error('Scheduled task raised an exception', exc_info=future.exception())
@@ -0,0 +1,516 @@
+import math
+import time
+from threading import Condition, RLock
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from pytils.mixins import DaemonHandler
+from ._base import Action, BatchHandler, CatchUpPolicy, FixedRate, Handler, LOGGER, ScheduleEntry, ScheduleKey
+from ._metrics import SchedulerMetrics
+from ._timers import HeapTimerStore, TimerStore
+from .._config.time import MONOTONIC_TIME_SUPPLIER, TimeSupplier, TimeType, ZERO_DURATION
+
+__all__ = [
+    'DispatchStats',
+    'Schedule',
+    'ScheduledRun',
+]
+
+_MAX_SLEEP_DURATION = 12.
+
+_DEFAULT_MAX_DEAD_FRACTION = 0.5
+_MIN_COMPACTION_SIZE = 64
+
+
+class DispatchStats(NamedTuple):
+    """
+    Dispatch statistics of a Schedule.
+
+    Each dispatch hands off one due entry along with every entry whose slack window has opened; the latter are counted
+    as early if they were not yet due. The wakeups saved are the entries dispatched beyond the first of each batch.
+
+    """
+
+    wakeups: int
+    dispatched: int
+    early: int
+
+    @property
+    def saved_wakeups(self) -> int:
+        return self.dispatched - self.wakeups
+
+
+class Schedule(DaemonHandler):
+    """
+    Daemon handler that dispatches registered actions to a handler once they are due.
+
+    A key may be registered with some slack, in which case its runs may be dispatched at any time within the slack
+    window following their due time. Due times are rounded within their slack window so that keys with overlapping
+    windows tend to share their dispatches; in addition, each dispatch also takes along every entry whose slack window
+    has already opened, if the timer store supports it.
+
+    Due actions are passed to the batch handler, if provided, and to the handler one by one otherwise. The runs that a
+    handler raises for are skipped, so that periodic keys are readmitted; a batch handler that raises is taken to have
+    accepted none of the runs of its batch.
+
+    """
+
+    def __init__(
+            self,
+            handler: Handler,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            timers: Optional[TimerStore] = None,
+            max_dead_fraction: float = _DEFAULT_MAX_DEAD_FRACTION,
+            metrics: Optional[SchedulerMetrics] = None,
+            batch_handler: Optional[BatchHandler] = None):
+        if not 0. < max_dead_fraction <= 1.:
+            raise ValueError('max_dead_fraction must be in (0, 1]')
+
+        self.s_time = s_time
+
+        self._lock = RLock()
+        self._cv = Condition(self._lock)
+        self._timers = HeapTimerStore() if timers is None else timers
+        self._dead_count = 0
+        self._max_dead_fraction = max_dead_fraction
+        self._metrics = metrics
+
+        self._handler = handler
+        self._batch_handler = batch_handler
+
+        self._wakeups = 0
+        self._dispatched = 0
+        self._early = 0
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        """Get the dispatch statistics of this schedule."""
+        with self._lock:
+            return DispatchStats(self._wakeups, self._dispatched, self._early)
+
+    @property
+    def metrics(self) -> Optional[SchedulerMetrics]:
+        """Get the metrics recorded by this schedule, if enabled."""
+        return self._metrics
+
+    @property
+    def live_count(self) -> int:
+        """Get the number of pending entries that will be dispatched."""
+        with self._lock:
+            return len(self._timers) - self._dead_count
+
+    @property
+    def dead_count(self) -> int:
+        """Get the number of pending entries that have been cancelled but not yet removed."""
+        with self._lock:
+            return self._dead_count
+
+    def register(
+            self,
+            action: Action,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None,
+            fixed_rate: Optional[FixedRate] = None,
+            slack: TimeType = ZERO_DURATION,
+            priority: int = 0) -> ScheduleKey:
+        """
+        Register an action to be run after the provided delay and then, if a period is provided, periodically.
+
+        Args:
+            action: The action to run.
+            period: The period between runs, or None to run the action once.
+            delay: The delay before the first run.
+                (Defaults to None, i.e. no delay.)
+            fixed_rate: The fixed-rate mode of a periodic key.
+                (Defaults to None, i.e. each run is due one period after the start of the previous run.)
+            slack: The duration past its due time within which a run may be dispatched.
+                (Defaults to zero.)
+            priority: The lane in which a SchedulingQueue queues the runs; lower lanes are more urgent.
+                (Defaults to 0.)
+
+        """
+        key = _create_key(action, period, delay, fixed_rate, slack, priority)
+        self._register_key(key, delay)
+        return key
+
+    def register_many(
+            self,
+            jobs: Iterable[Tuple[Action, Optional[TimeType], Optional[TimeType]]]) -> List[ScheduleKey]:
+        """
+        Register several actions at once.
+
+        Args:
+            jobs: An iterable of (action, period, delay) tuples, as accepted by register.
+
+        Returns:
+            The keys of the registered actions, in the order of the provided jobs.
+
+        """
+        keys = []
+        delays = []
+        for action, period, delay in jobs:
+            keys.append(_create_key(action, period, delay))
+            delays.append(delay)
+
+        self._register_keys(keys, delays)
+        return keys
+
+    def cancel(self, key: ScheduleKey) -> bool:
+        """
+        Cancel the provided key so that its action is no longer run.
+
+        A run of the action that is already in progress is allowed to complete, but is not readmitted.
+
+        Returns:
+            Whether the key was cancelled by this call, as opposed to having been cancelled already.
+
+        """
+        with self._cv:
+            if key.is_cancelled:
+                return False
+
+            key._is_cancelled = True
+            self._kill(key)
+
+        if self._metrics is not None:
+            self._metrics.discard_key(key)
+
+        return True
+
+    def reschedule(
+            self,
+            key: ScheduleKey,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None) -> ScheduleKey:
+        """
+        Replace the period of the provided key and schedule its next run after the provided delay.
+
+        Any pending run of the key is discarded. A run of the action that is already in progress is allowed to complete,
+        but is not readmitted.
+
+        """
+        _validate_timing(period, delay, key.fixed_rate)
+
+        with self._cv:
+            if key.is_cancelled:
+                raise ValueError('key has been cancelled')
+
+            self._kill(key)
+            key.period = period
+
+            now = self.s_time()
+            self._admit_first(key, now + (delay or ZERO_DURATION), now)
+
+        return key
+
+    def next_run(self) -> Optional[TimeType]:
+        """
+        Get the earliest time at which an entry may be dispatched, or None if no entry is pending.
+
+        The time returned may belong to a cancelled entry or, depending on the timer store, precede the next due time.
+
+        """
+        with self._lock:
+            return self._timers.next_run()
+
+    def handle_one(self):
+        with self._cv:
+            now = self.s_time()
+            batch = self._pop_batch(now)
+            while not batch:
+                self._cv.wait(self._get_next_sleep_duration())
+                now = self.s_time()
+                batch = self._pop_batch(now)
+
+            actions = self._prepare_dispatch(batch, now)
+
+        self._dispatch(actions)
+
+    def poll(self) -> int:
+        """Dispatch the entries that are due at the current time, if any, without waiting; return their number."""
+        with self._cv:
+            now = self.s_time()
+            batch = self._pop_batch(now)
+            if not batch:
+                return 0
+
+            actions = self._prepare_dispatch(batch, now)
+
+        self._dispatch(actions)
+        return len(actions)
+
+    def _prepare_dispatch(self, batch: List[ScheduleEntry], now: TimeType) -> List['ScheduledRun']:
+        actions = [self._create_readmittence_action_from_entry(entry) for entry in batch]
+
+        self._wakeups += 1
+        self._dispatched += len(batch)
+
+        if self._metrics is not None:
+            timer_count = len(self._timers) - self._dead_count
+            for entry in batch:
+                self._metrics.record_dispatch(now - entry.earliest, timer_count)
+
+        return actions
+
+    def _dispatch(self, actions: Sequence['ScheduledRun']):
+        if self._batch_handler is not None:
+            try:
+                self._batch_handler(actions)
+            except Exception as e:
+                LOGGER.warning('Scheduled tasks were not accepted by the batch handler: %r', e)
+                for action in actions:
+                    action.skip()
+            return
+
+        for action in actions:
+            try:
+                self._handler(action)
+            except Exception as e:
+                LOGGER.warning('Scheduled task was not accepted by the handler: %r', e)
+                action.skip()
+
+    def _create_readmittence_action_from_entry(self, entry: ScheduleEntry) -> 'ScheduledRun':
+        return ScheduledRun(self, entry)
+
+    def _readmit(self, key: ScheduleKey, generation: int, started: TimeType, is_skipped: bool = False):
+        with self._cv:
+            if key._generation == generation:
+                current_time = self.s_time()
+                self._admit(key, _plan_next_run(key, started, current_time, is_skipped), current_time)
+
+    def has_expired(self) -> bool:
+        with self._lock:
+            next_run = self._timers.next_run()
+            return next_run is not None and next_run - self.s_time() <= 0
+
+    def _get_next_sleep_duration(self) -> TimeType:
+        next_run = self._timers.next_run()
+        if next_run is not None:
+            return min(_MAX_SLEEP_DURATION, max(ZERO_DURATION, next_run - self.s_time()))
+        else:
+            return _MAX_SLEEP_DURATION
+
+    def _register_key(self, key: ScheduleKey, delay: Optional[TimeType]):
+        with self._cv:
+            now = self.s_time()
+            self._admit_first(key, now + (delay or ZERO_DURATION), now)
+
+    def _register_keys(self, keys: Sequence[ScheduleKey], delays: Sequence[Optional[TimeType]]):
+        with self._cv:
+            now = self.s_time()
+
+            entries = []
+            for key, delay in zip(keys, delays):
+                key._is_pending = True
+                key._slot = now + (delay or ZERO_DURATION)
+                entries.append(ScheduleEntry(key._slot, key))
+
+            self._timers.push_many(entries, now)
+            self._cv.notify()
+
+    def _admit_first(self, key: ScheduleKey, next_run: TimeType, now: TimeType):
+        key._slot = next_run
+        self._admit(key, next_run, now)
+
+    def _admit(self, key: ScheduleKey, next_run: TimeType, now: TimeType):
+        key._is_pending = True
+        if key.slack:
+            entry = ScheduleEntry(_apply_slack(next_run, key.slack), key, key._generation, next_run)
+        else:
+            entry = ScheduleEntry(next_run, key, key._generation)
+
+        self._enqueue(entry, now)
+
+    def _kill(self, key: ScheduleKey):
+        key._generation += 1
+        if key._is_pending:
+            key._is_pending = False
+            self._dead_count += 1
+
+            size = len(self._timers)
+            if size >= _MIN_COMPACTION_SIZE and self._dead_count > size * self._max_dead_fraction:
+                self._timers.compact(_is_live)
+                self._dead_count = 0
+
+    def _pop_batch(self, now: TimeType) -> List[ScheduleEntry]:
+        entry = self._pop_live(self._timers.pop, now)
+        if entry is None:
+            return []
+
+        # Take along the entries whose slack window has opened, sparing them a wakeup of their own
+        batch = [entry]
+        entry = self._pop_live(self._timers.pop_early, now)
+        while entry is not None:
+            batch.append(entry)
+            if entry.next_run > now:
+                self._early += 1
+            entry = self._pop_live(self._timers.pop_early, now)
+
+        return batch
+
+    def _pop_live(self, pop, now: TimeType) -> Optional[ScheduleEntry]:
+        entry = pop(now)
+        while entry is not None and not _is_live(entry):
+            self._dead_count -= 1
+            entry = pop(now)
+
+        if entry is not None:
+            entry.key._is_pending = False
+        return entry
+
+    def _enqueue(self, entry: ScheduleEntry, now: TimeType):
+        self._cv.notify()
+        self._timers.push(entry, now)
+
+
+class ScheduledRun:
+    """
+    Action performing one dispatched run of a ScheduleKey.
+
+    Calling a ScheduledRun runs the action of its key and then readmits the key if it is periodic, whether or not the
+    action raises. Handlers that need to run the action elsewhere may instead call begin, run key.action by other means
+    and call complete once it is done, or has failed.
+
+    """
+
+    __slots__ = ('_schedule', 'key', 'scheduled_time', 'enqueued_at', '_generation', '_started')
+
+    def __init__(self, schedule: Schedule, entry: ScheduleEntry):
+        self._schedule = schedule
+        self.key = entry.key
+        self.scheduled_time = entry.earliest
+
+        # Set by a SchedulingQueue that records metrics
+        self.enqueued_at = None  # type: Optional[float]
+
+        self._generation = entry.generation
+        self._started = None  # type: Optional[TimeType]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.key!r})'
+
+    def __call__(self):
+        self.begin()
+
+        # Complete the run even if the action raises, so that periodic keys keep running
+        metrics = self._schedule._metrics
+        try:
+            if metrics is None:
+                self.key.action()
+            else:
+                start = time.perf_counter()
+                try:
+                    self.key.action()
+                finally:
+                    metrics.record_run(self.key, time.perf_counter() - start)
+        finally:
+            self.complete()
+
+    def begin(self):
+        """Mark the start of the run."""
+        self._started = self._schedule.s_time()
+        _record_start(self.key, self.scheduled_time, self._started)
+
+    def complete(self):
+        """Mark the completion of the run and readmit the key if it is periodic and has not been cancelled."""
+        if self.key.period is not None and self._started is not None:
+            self._schedule._readmit(self.key, self._generation, self._started)
+
+    def skip(self):
+        """Give up on the run without performing it, counting it as missed and readmitting the key if it is periodic."""
+        self.key._missed += 1
+        if self.key.period is not None:
+            self._schedule._readmit(self.key, self._generation, self.scheduled_time, True)
+
+
+def _record_start(key: ScheduleKey, scheduled_time: TimeType, started: TimeType):
+    drift = started - (key._slot if key.fixed_rate is not None else scheduled_time)
+
+    key._runs += 1
+    key._last_drift = drift
+    key._total_drift += drift
+    if drift > key._max_drift:
+        key._max_drift = drift
+
+
+def _plan_next_run(key: ScheduleKey, started: TimeType, now: TimeType, is_skipped: bool = False) -> TimeType:
+    """
+    Get the time of the next run of a periodic key whose last run started and completed at the provided times.
+
+    A skipped run is taken to have started at its scheduled time; it never counts as an overrun.
+
+    """
+    period = key.period
+    if not is_skipped and now - started > period:
+        key._overruns += 1
+        LOGGER.warning('Scheduled task took longer than its period length to complete')
+
+    if key.fixed_rate is None:
+        return max(now, started + period)
+
+    next_slot = key._slot + period
+    if next_slot >= now:
+        key._slot = next_slot
+        return next_slot
+
+    # Number of slots, starting from next_slot, that have already passed
+    behind = math.ceil((now - next_slot) / period)
+    catch_up = key.fixed_rate.catch_up
+
+    if catch_up is CatchUpPolicy.SKIP:
+        key._missed += behind
+        key._slot = next_slot + behind * period
+        return key._slot
+
+    if catch_up is CatchUpPolicy.COALESCE:
+        key._missed += behind - 1
+        key._slot = next_slot + (behind - 1) * period
+        return now
+
+    dropped = max(0, behind - key.fixed_rate.max_burst)
+    key._missed += dropped
+    key._slot = next_slot + dropped * period
+    return now
+
+
+def _apply_slack(next_run: TimeType, slack: TimeType) -> TimeType:
+    """
+    Round a due time up within its slack window.
+
+    The due time is rounded to the last multiple, within the window, of the largest power of two not exceeding the
+    slack, so that the due times of keys with similar slack and overlapping windows tend to coincide.
+
+    """
+    granularity = 2. ** math.floor(math.log2(slack))
+    return max(next_run, math.floor((next_run + slack) / granularity) * granularity)
+
+
+def _is_live(entry: ScheduleEntry) -> bool:
+    return entry.generation == entry.key._generation
+
+
+def _create_key(
+        action: Action,
+        period: Optional[TimeType],
+        delay: Optional[TimeType],
+        fixed_rate: Optional[FixedRate] = None,
+        slack: TimeType = ZERO_DURATION,
+        priority: int = 0) -> ScheduleKey:
+    _validate_timing(period, delay, fixed_rate)
+    if slack < ZERO_DURATION:
+        raise ValueError('slack must be non-negative')
+    if priority < 0:
+        raise ValueError('priority must be non-negative')
+
+    return ScheduleKey(period, action, fixed_rate, slack, priority)
+
+
+def _validate_timing(period: Optional[TimeType], delay: Optional[TimeType], fixed_rate: Optional[FixedRate] = None):
+    if period is not None and period <= ZERO_DURATION:
+        raise ValueError('period must be positive or None')
+    if delay is not None and delay < ZERO_DURATION:
+        raise ValueError('delay must be non-negative or None')
+    if fixed_rate is not None:
+        if period is None:
+            raise ValueError('fixed_rate requires a period')
+        if fixed_rate.max_burst < 1:
+            raise ValueError('max_burst must be positive')
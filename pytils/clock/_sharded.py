@@ -0,0 +1,158 @@
+from threading import Thread
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from ._base import Action, BatchHandler, FixedRate, Handler, ScheduleKey
+from ._metrics import SchedulerMetrics
+from ._schedule import DispatchStats, Schedule, _create_key
+from ._timers import TimerStore
+from .._config.time import MONOTONIC_TIME_SUPPLIER, TimeSupplier, TimeType, ZERO_DURATION
+
+__all__ = [
+    'ShardedSchedule',
+]
+
+_DEFAULT_SHARD_COUNT = 4
+
+# Multiplier of Fibonacci hashing; spreads the identity hashes of keys, which are allocated at regular strides
+_HASH_MULTIPLIER = 0x9E3779B97F4A7C15
+_HASH_MASK = 2 ** 64 - 1
+
+
+class ShardedSchedule:
+    """
+    Schedule spread across independent shards, each with its own timer store, lock and dispatcher thread.
+
+    Keys are assigned to a shard by their hash, so that registrations, dispatches and readmissions of keys of different
+    shards do not contend on a single lock. The API matches that of Schedule; the order in which entries of different
+    shards that are due at the same time are dispatched is unspecified.
+
+    """
+
+    def __init__(
+            self,
+            handler: Handler,
+            s_time: TimeSupplier = MONOTONIC_TIME_SUPPLIER,
+            shards: int = _DEFAULT_SHARD_COUNT,
+            timers: Optional[Callable[[], TimerStore]] = None,
+            metrics: Optional[SchedulerMetrics] = None,
+            batch_handler: Optional[BatchHandler] = None):
+        """
+        Initialize a ShardedSchedule instance with no registered key.
+
+        Args:
+            handler: The handler to which due actions are dispatched.
+            s_time: The time supplier.
+                (Defaults to time.monotonic.)
+            shards: The number of shards.
+                (Defaults to 4.)
+            timers: A factory of the timer store of each shard.
+                (Defaults to None, i.e. a HeapTimerStore per shard.)
+            metrics: The metrics to record, shared by every shard, if any.
+                (Defaults to None.)
+            batch_handler: The handler to which the due actions of a dispatch are passed at once, if any.
+                (Defaults to None.)
+
+        """
+        if shards < 1:
+            raise ValueError('shards must be positive')
+
+        self.s_time = s_time
+        self._shards = tuple(
+            Schedule(
+                handler, s_time, None if timers is None else timers(),
+                metrics=metrics, batch_handler=batch_handler
+            )
+            for _ in range(shards)
+        )
+        self._metrics = metrics
+
+    @property
+    def shards(self) -> Tuple[Schedule, ...]:
+        return self._shards
+
+    @property
+    def metrics(self) -> Optional[SchedulerMetrics]:
+        return self._metrics
+
+    @property
+    def live_count(self) -> int:
+        return sum(shard.live_count for shard in self._shards)
+
+    @property
+    def dead_count(self) -> int:
+        return sum(shard.dead_count for shard in self._shards)
+
+    @property
+    def dispatch_stats(self) -> DispatchStats:
+        return DispatchStats(*(sum(counts) for counts in zip(*(shard.dispatch_stats for shard in self._shards))))
+
+    def shard_of(self, key: ScheduleKey) -> Schedule:
+        """Get the shard to which the provided key is assigned."""
+        return self._shards[(((hash(key) * _HASH_MULTIPLIER) & _HASH_MASK) >> 32) % len(self._shards)]
+
+    def register(
+            self,
+            action: Action,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None,
+            fixed_rate: Optional[FixedRate] = None,
+            slack: TimeType = ZERO_DURATION,
+            priority: int = 0) -> ScheduleKey:
+        """Register an action with the shard of its new key; see Schedule.register."""
+        key = _create_key(action, period, delay, fixed_rate, slack, priority)
+        self.shard_of(key)._register_key(key, delay)
+        return key
+
+    def register_many(
+            self,
+            jobs: Iterable[Tuple[Action, Optional[TimeType], Optional[TimeType]]]) -> List[ScheduleKey]:
+        """Register several actions at once, in bulk within each shard; see Schedule.register_many."""
+        keys = []
+        batches = {shard: ([], []) for shard in self._shards}
+        for action, period, delay in jobs:
+            key = _create_key(action, period, delay)
+            keys.append(key)
+
+            shard_keys, shard_delays = batches[self.shard_of(key)]
+            shard_keys.append(key)
+            shard_delays.append(delay)
+
+        for shard, (shard_keys, shard_delays) in batches.items():
+            if shard_keys:
+                shard._register_keys(shard_keys, shard_delays)
+
+        return keys
+
+    def cancel(self, key: ScheduleKey) -> bool:
+        """Cancel the provided key; see Schedule.cancel."""
+        return self.shard_of(key).cancel(key)
+
+    def reschedule(
+            self,
+            key: ScheduleKey,
+            period: Optional[TimeType],
+            delay: Optional[TimeType] = None) -> ScheduleKey:
+        """Replace the period of the provided key; see Schedule.reschedule."""
+        return self.shard_of(key).reschedule(key, period, delay)
+
+    def next_run(self) -> Optional[TimeType]:
+        next_runs = [next_run for next_run in (shard.next_run() for shard in self._shards) if next_run is not None]
+        return min(next_runs) if next_runs else None
+
+    def has_expired(self) -> bool:
+        return any(shard.has_expired() for shard in self._shards)
+
+    def poll(self) -> int:
+        """Dispatch the entries that are due at the current time in each shard without waiting; return their number."""
+        return sum(shard.poll() for shard in self._shards)
+
+    def run(self):
+        """Start the dispatchers of every shard but the first, then run the dispatcher of the first shard."""
+        for shard in self._shards[1:]:
+            shard.start()
+
+        self._shards[0].run()
+
+    def start(self) -> List[Thread]:
+        """Start one daemon dispatcher thread per shard."""
+        return [shard.start() for shard in self._shards]
@@ -0,0 +1,334 @@
+import heapq
+import itertools
+import math
+import sys
+from collections import deque
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+from ._base import ScheduleEntry
+from .._config.time import TimeType
+
+__all__ = [
+    'HeapTimerStore',
+    'TimerStore',
+    'TimingWheelTimerStore',
+]
+
+_HEAPIFY_BATCH_RATIO = 4
+
+# The (tick, entry) pairs due in one slot of a wheel
+_Slot = List[Tuple[int, ScheduleEntry]]
+
+
+class TimerStore:
+    """
+    Storage for the pending entries of a Schedule.
+
+    A TimerStore is not thread-safe; the owning Schedule serializes all access to it under its lock.
+
+    """
+
+    def push(self, entry: ScheduleEntry, now: TimeType):
+        """
+        Add an entry to the store.
+
+        Args:
+            entry: The entry to add.
+            now: The current time, as measured by the time supplier of the owning Schedule.
+
+        """
+        raise NotImplementedError
+
+    def push_many(self, entries: Sequence[ScheduleEntry], now: TimeType):
+        """Add several entries to the store."""
+        for entry in entries:
+            self.push(entry, now)
+
+    def pop(self, now: TimeType) -> Optional[ScheduleEntry]:
+        """Remove and return one entry that is due at the provided time, or return None if no entry is due."""
+        raise NotImplementedError
+
+    def pop_early(self, now: TimeType) -> Optional[ScheduleEntry]:
+        """
+        Remove and return the next entry to become due if it has a slack window that has opened at the provided time.
+
+        Stores that cannot tell their next entry cheaply may always return None; their entries are then only dispatched
+        once due.
+
+        """
+        return None
+
+    def next_run(self) -> Optional[TimeType]:
+        """
+        Get the earliest time at which pop may return an entry, or None if the store is empty.
+
+        The returned time may precede the next_run of every stored entry; the owning Schedule simply wakes up, finds
+        that no entry is due and goes back to sleep.
+
+        """
+        raise NotImplementedError
+
+    def compact(self, is_live: Callable[[ScheduleEntry], bool]):
+        """Remove every stored entry for which is_live returns False."""
+        raise NotImplementedError
+
+    def __len__(self) -> int:
+        """Get the number of stored entries."""
+        raise NotImplementedError
+
+
+class HeapTimerStore(TimerStore):
+    """
+    TimerStore backed by a binary heap.
+
+    Entries are dispatched exactly in next_run order (ties in order of insertion), at a cost of O(log n) per push and
+    pop.
+
+    """
+
+    __slots__ = ('_heap', '_counter')
+
+    def __init__(self):
+        self._heap = []  # type: List[Tuple[TimeType, int, ScheduleEntry]]
+        self._counter = itertools.count()
+
+    def push(self, entry: ScheduleEntry, now: TimeType):
+        heapq.heappush(self._heap, (entry.next_run, next(self._counter), entry))
+
+    def push_many(self, entries: Sequence[ScheduleEntry], now: TimeType):
+        # Rebuilding the heap is O(n + k); pushing one by one is O(k log(n + k)), which wins for small batches
+        if len(entries) * _HEAPIFY_BATCH_RATIO < len(self._heap):
+            super().push_many(entries, now)
+            return
+
+        counter = self._counter
+        self._heap.extend((entry.next_run, next(counter), entry) for entry in entries)
+        heapq.heapify(self._heap)
+
+    def pop(self, now: TimeType) -> Optional[ScheduleEntry]:
+        if self._heap and self._heap[0][0] <= now:
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def pop_early(self, now: TimeType) -> Optional[ScheduleEntry]:
+        if self._heap and self._heap[0][2].window_start is not None and self._heap[0][2].window_start <= now:
+            return heapq.heappop(self._heap)[2]
+        return None
+
+    def next_run(self) -> Optional[TimeType]:
+        return self._heap[0][0] if self._heap else None
+
+    def compact(self, is_live: Callable[[ScheduleEntry], bool]):
+        self._heap = [item for item in self._heap if is_live(item[2])]
+        heapq.heapify(self._heap)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+
+class TimingWheelTimerStore(TimerStore):
+    """
+    TimerStore backed by a hierarchical timing wheel.
+
+    Time is divided into ticks of the provided resolution. Level k of the wheel has wheel_size slots, each of which
+    spans wheel_size ** k ticks; an entry is stored in the lowest level that can hold it and is cascaded down into the
+    lower levels as the wheel turns. Entries beyond the reach of the top level wait in an overflow heap until they come
+    into range.
+
+    Push and pop are O(1) amortized. In exchange, entries are rounded up to the next tick: an entry is never dispatched
+    before its next_run, but it may be dispatched up to one tick late, and entries due in the same tick are dispatched
+    in no particular order.
+
+    """
+
+    __slots__ = (
+        '_resolution', '_wheel_size', '_spans',
+        '_wheels', '_counts', '_ready', '_overflow', '_counter',
+        '_tick', '_size',
+    )
+
+    def __init__(self, resolution: TimeType = 0.01, wheel_size: int = 64, levels: int = 4):
+        """
+        Initialize an empty TimingWheelTimerStore instance.
+
+        Args:
+            resolution: The duration of one tick.
+                (Defaults to 0.01.)
+            wheel_size: The number of slots in each level of the wheel.
+                (Defaults to 64.)
+            levels: The number of levels in the wheel.
+                (Defaults to 4.)
+
+        """
+        if resolution <= 0:
+            raise ValueError('resolution must be positive')
+        if wheel_size < 2:
+            raise ValueError('wheel_size must be at least 2')
+        if levels < 1:
+            raise ValueError('levels must be positive')
+
+        self._resolution = resolution
+        self._wheel_size = wheel_size
+        self._spans = tuple(wheel_size ** level for level in range(levels))
+
+        self._wheels = [[[] for _ in range(wheel_size)] for _ in range(levels)]  # type: List[List[_Slot]]
+        self._counts = [0] * levels
+        self._ready = deque()  # type: Deque[ScheduleEntry]
+        self._overflow = []  # type: List[Tuple[int, int, ScheduleEntry]]
+        self._counter = itertools.count()
+
+        self._tick = None  # type: Optional[int]
+        self._size = 0
+
+    @property
+    def resolution(self) -> TimeType:
+        """Get the duration of one tick."""
+        return self._resolution
+
+    def push(self, entry: ScheduleEntry, now: TimeType):
+        if self._tick is None:
+            self._tick = math.floor(now / self._resolution)
+
+        self._place(math.ceil(entry.next_run / self._resolution), entry)
+        self._size += 1
+
+    def pop(self, now: TimeType) -> Optional[ScheduleEntry]:
+        if self._tick is None:
+            return None
+
+        target = math.floor(now / self._resolution)
+        if target > self._tick:
+            self._advance(target)
+
+        if self._ready:
+            self._size -= 1
+            return self._ready.popleft()
+        return None
+
+    def next_run(self) -> Optional[TimeType]:
+        if not self._size:
+            return None
+        if self._ready:
+            return self._tick * self._resolution
+
+        tick = self._tick
+        next_tick = self._next_cascade()
+        if self._counts[0]:
+            slots = self._wheels[0]
+            end = tick + self._wheel_size + 1 if next_tick is None else min(next_tick, tick + self._wheel_size + 1)
+            for t in range(tick + 1, end):
+                if slots[t % self._wheel_size]:
+                    return self._time_of(t)
+
+        return self._time_of(next_tick)
+
+    def compact(self, is_live: Callable[[ScheduleEntry], bool]):
+        self._ready = deque(entry for entry in self._ready if is_live(entry))
+        size = len(self._ready)
+
+        for level, wheel in enumerate(self._wheels):
+            count = 0
+            for index, slot in enumerate(wheel):
+                if slot:
+                    wheel[index] = [item for item in slot if is_live(item[1])]
+                    count += len(wheel[index])
+
+            self._counts[level] = count
+            size += count
+
+        self._overflow = [item for item in self._overflow if is_live(item[2])]
+        heapq.heapify(self._overflow)
+
+        self._size = size + len(self._overflow)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _time_of(self, tick: int) -> TimeType:
+        # Round the start of the tick up if need be, so that pop reaches the tick when called at the time returned
+        t = tick * self._resolution
+        while math.floor(t / self._resolution) < tick:
+            t += max(abs(t), self._resolution) * sys.float_info.epsilon
+        return t
+
+    def _place(self, tick: int, entry: ScheduleEntry):
+        current = self._tick
+        if tick <= current:
+            self._ready.append(entry)
+            return
+
+        for level, span in enumerate(self._spans):
+            slot = tick // span
+            if slot - current // span < self._wheel_size:
+                self._wheels[level][slot % self._wheel_size].append((tick, entry))
+                self._counts[level] += 1
+                return
+
+        heapq.heappush(self._overflow, (tick, next(self._counter), entry))
+
+    def _next_cascade(self) -> Optional[int]:
+        """Get the next tick at which entries cascade out of the upper levels or the overflow heap, if any."""
+        for level in range(1, len(self._spans)):
+            if self._counts[level]:
+                break
+        else:
+            if not self._overflow:
+                return None
+            # The overflow heap is drained at the boundaries of the top level
+            level = len(self._spans) - 1
+
+        span = self._spans[level]
+        return (self._tick // span + 1) * span
+
+    def _lowest_occupied_level(self) -> int:
+        for level, count in enumerate(self._counts):
+            if count:
+                return level
+
+        # Only the overflow heap is occupied; it is drained at the boundaries of the top level
+        return len(self._spans) - 1
+
+    def _advance(self, target: int):
+        while self._tick < target:
+            if self._size == len(self._ready):
+                self._tick = target
+                return
+
+            level = self._lowest_occupied_level()
+            span = self._spans[level]
+            tick = (self._tick // span + 1) * span
+            if tick > target:
+                self._tick = target
+                return
+
+            self._tick = tick
+            self._process_tick(tick)
+
+    def _process_tick(self, tick: int):
+        wheel_size = self._wheel_size
+
+        top_span = self._spans[-1]
+        while self._overflow and self._overflow[0][0] // top_span - tick // top_span < wheel_size:
+            overflow_tick, _, entry = heapq.heappop(self._overflow)
+            self._place(overflow_tick, entry)
+
+        for level in range(len(self._spans) - 1, 0, -1):
+            span = self._spans[level]
+            if tick % span == 0:
+                self._cascade(level, (tick // span) % wheel_size)
+
+        slot = self._wheels[0][tick % wheel_size]
+        if slot:
+            self._counts[0] -= len(slot)
+            self._ready.extend(entry for _, entry in slot)
+            slot.clear()
+
+    def _cascade(self, level: int, index: int):
+        slot = self._wheels[level][index]
+        if not slot:
+            return
+
+        self._wheels[level][index] = []
+        self._counts[level] -= len(slot)
+        for tick, entry in slot:
+            self._place(tick, entry)
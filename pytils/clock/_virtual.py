@@ -0,0 +1,125 @@
+from collections import deque
+from typing import Optional
+
+from ._clock import _run_action
+from ._metrics import SchedulerMetrics
+from ._schedule import Schedule
+from ._timers import TimerStore
+from .._config.time import TimeType, ZERO_DURATION
+
+__all__ = [
+    'VirtualClock',
+    'VirtualTime',
+]
+
+
+class VirtualTime:
+    """Time supplier over simulated time, which only advances when told to."""
+
+    __slots__ = ('_now',)
+
+    def __init__(self, start: TimeType = ZERO_DURATION):
+        self._now = start
+
+    def __call__(self) -> TimeType:
+        return self._now
+
+    @property
+    def now(self) -> TimeType:
+        return self._now
+
+    def advance(self, duration: TimeType):
+        """Advance the simulated time by the provided duration, e.g. to simulate the duration of a run."""
+        if duration < ZERO_DURATION:
+            raise ValueError('duration must be non-negative')
+        self._now += duration
+
+    def advance_to(self, t: TimeType):
+        """Advance the simulated time to the provided time."""
+        if t < self._now:
+            raise ValueError('time cannot move backwards')
+        self._now = t
+
+
+class VirtualClock:
+    """
+    Clock driven over simulated time by a single thread.
+
+    Rather than waiting for the next entry of its schedule to become due, a VirtualClock advances its VirtualTime
+    straight to it, dispatches it and runs the due actions inline, in dispatch order. Given the same registrations, a
+    simulation is thus deterministic and runs as fast as the actions allow, regardless of the simulated time span.
+
+    Actions may call clock.time.advance to simulate their own duration.
+
+    """
+
+    def __init__(
+            self,
+            start: TimeType = ZERO_DURATION,
+            timers: Optional[TimerStore] = None,
+            metrics: Optional[SchedulerMetrics] = None):
+        self._time = VirtualTime(start)
+        self._due = deque()
+        self._schedule = Schedule(self._due.append, self._time, timers, metrics=metrics, batch_handler=self._due.extend)
+        self._run_count = 0
+
+    @property
+    def schedule(self) -> Schedule:
+        return self._schedule
+
+    @property
+    def time(self) -> VirtualTime:
+        return self._time
+
+    @property
+    def now(self) -> TimeType:
+        return self._time.now
+
+    @property
+    def run_count(self) -> int:
+        """Get the number of actions run so far."""
+        return self._run_count
+
+    def step(self, until: Optional[TimeType] = None) -> bool:
+        """
+        Advance to the next dispatch and run the actions dispatched.
+
+        Args:
+            until: The time beyond which not to advance.
+                (Defaults to None, i.e. no limit.)
+
+        Returns:
+            Whether any action was dispatched, i.e. False if no entry is pending up to the provided time.
+
+        """
+        while True:
+            next_run = self._schedule.next_run()
+            if next_run is None or (until is not None and next_run > until):
+                return False
+
+            if next_run > self._time.now:
+                self._time.advance_to(next_run)
+
+            if self._schedule.poll():
+                self._run_due()
+                return True
+
+    def run_until(self, t: TimeType) -> int:
+        """Run every dispatch due up to the provided time, then advance to it; return the number of actions run."""
+        run_count = self._run_count
+        while self.step(t):
+            pass
+
+        if t > self._time.now:
+            self._time.advance_to(t)
+
+        return self._run_count - run_count
+
+    def run_for(self, duration: TimeType) -> int:
+        """Run every dispatch due within the provided duration from now; return the number of actions run."""
+        return self.run_until(self._time.now + duration)
+
+    def _run_due(self):
+        while self._due:
+            _run_action(self._due.popleft())
+            self._run_count += 1
@@ -1,5 +1,7 @@
-from ._handlers import DaemonHandler
+from ._handlers import DaemonHandler, LoopStats, SpinBackoff
 
 __all__ = [
-    'DaemonHandler'
+    'DaemonHandler',
+    'LoopStats',
+    'SpinBackoff',
 ]
@@ -1,10 +1,108 @@
-from threading import Thread
-from typing import Any
+import logging
+import math
+import time
+from threading import Lock, Thread, Timer, current_thread
+from typing import Any, NamedTuple, Optional, Set
 
 __all__ = [
-    'DaemonHandler'
+    'DaemonHandler',
+    'LoopStats',
+    'SpinBackoff',
 ]
 
+LOGGER = logging.getLogger('pytils.mixins')
+
+_DEFAULT_SPIN_WARNING_THRESHOLD = 10000
+_DEFAULT_SHRINK_DELAY = 1.
+
+# Guards the registries of loop counters, which are only touched when loops start or exit and when stats are read
+_LOOP_COUNTERS_LOCK = Lock()
+
+
+class LoopStats(NamedTuple):
+    """
+    Statistics on the handler loops of a DaemonHandler, summed over its threads.
+
+    Busy time is spent in the handle_one calls that did some work; idle time, in those that did not, e.g. waiting for
+    work or returning early. Backoff time is spent sleeping between idle iterations.
+
+    """
+
+    iterations: int
+    idle_iterations: int
+    busy_time: float
+    idle_time: float
+    backoff_time: float
+
+    @property
+    def idle_fraction(self) -> float:
+        return self.idle_iterations / self.iterations if self.iterations else 0.
+
+
+class SpinBackoff(NamedTuple):
+    """
+    Exponential backoff for handler loops that spin.
+
+    Once handle_one has done no work for threshold consecutive iterations, the loop sleeps between iterations, starting
+    with initial seconds and multiplying the sleep by factor up to maximum seconds, until an iteration does some work.
+
+    """
+
+    threshold: int = 8
+    initial: float = 0.001
+    maximum: float = 0.1
+    factor: float = 2.
+
+
+class _LoopCounters:
+    """Counters of one handler loop, only updated by the thread running it."""
+
+    __slots__ = ('iterations', 'idle_iterations', 'busy_time', 'idle_time', 'backoff_time', 'idle_streak', 'delay')
+
+    def __init__(self):
+        self.iterations = 0
+        self.idle_iterations = 0
+        self.busy_time = 0.
+        self.idle_time = 0.
+        self.backoff_time = 0.
+        self.idle_streak = 0
+        self.delay = 0.
+
+    def add(self, other: '_LoopCounters'):
+        """Add the totals of the provided counters to these."""
+        self.iterations += other.iterations
+        self.idle_iterations += other.idle_iterations
+        self.busy_time += other.busy_time
+        self.idle_time += other.idle_time
+        self.backoff_time += other.backoff_time
+
+
+class _Pool:
+    """State of the managed pool of a DaemonHandler."""
+
+    __slots__ = (
+        'lock', 'threads', 'min_threads', 'max_threads', 'load_per_thread', 'shrink_delay', 'target', 'shrink_at',
+        'shrink_timer', 'is_stopping',
+    )
+
+    def __init__(self, min_threads: int, max_threads: int, load_per_thread: float, shrink_delay: float):
+        self.lock = Lock()
+        self.threads = set()  # type: Set[Thread]
+        self.min_threads = min_threads
+        self.max_threads = max_threads
+        self.load_per_thread = load_per_thread
+        self.shrink_delay = shrink_delay
+        self.target = min_threads
+        self.shrink_at = None  # type: Optional[float]
+        self.shrink_timer = None  # type: Optional[Timer]
+        self.is_stopping = False
+
+    def cancel_shrink(self):
+        self.shrink_at = None
+        if self.shrink_timer is not None:
+            self.shrink_timer.cancel()
+            self.shrink_timer = None
+
 
 class DaemonHandler:
     """
@@ -20,20 +118,55 @@ class DaemonHandler:
     The is_active method may be overridden to signal any running daemon threads to gradually terminate while the Python
     interpreter instance continues to run.
 
+    To detect spinning, handle_one may return False when it did no work; any other return value counts as work. The
+    handler loops count their iterations and time their handle_one calls, as reported by loop_stats, and log a warning
+    once spin_warning_threshold consecutive iterations did no work. Setting spin_backoff makes spinning loops sleep
+    between iterations.
+
+    Alternatively, the daemon threads may be run as a managed pool through start_pool. The pool is sized between its
+    minimum and maximum number of threads according to the load reported by the load method, only shrinking once the
+    load has stayed low for shrink_delay seconds, and stop drains the pending work before joining the threads. To
+    support the pool, handle_one implementations should return, even if there is no work to perform, once woken up
+    through wakeup while should_yield holds; handlers should call rescale_pool whenever their load increases.
+
     """
 
+    spin_backoff = None  # type: Optional[SpinBackoff]
+    spin_warning_threshold = _DEFAULT_SPIN_WARNING_THRESHOLD
+
+    _pool = None  # type: Optional[_Pool]
+
     def is_active(self) -> Any:
         """Get whether this handler is active."""
         return True
 
-    def handle_one(self):
-        """Perform one handling action."""
+    def handle_one(self) -> Optional[bool]:
+        """Perform one handling action; return False if there was nothing to do."""
         raise NotImplementedError
 
     def run(self):
         """Run the handler loop."""
-        while self.is_active():
-            self.handle_one()
+        counters = self._create_loop_counters()
+        try:
+            while self.is_active():
+                self._handle_one_instrumented(counters)
+        finally:
+            self._retire_loop_counters(counters)
+
+    @property
+    def loop_stats(self) -> LoopStats:
+        """Get the statistics on the handler loops of this handler."""
+        totals = _LoopCounters()
+        with _LOOP_COUNTERS_LOCK:
+            retired = self.__dict__.get('_retired_loop_counters')
+            if retired is not None:
+                totals.add(retired)
+            for counters in self.__dict__.get('_loop_counters', ()):
+                totals.add(counters)
+
+        return LoopStats(
+            totals.iterations, totals.idle_iterations, totals.busy_time, totals.idle_time, totals.backoff_time
+        )
 
     def start(self) -> Thread:
         """Start a daemon thread to run the handler loop."""
@@ -41,3 +174,224 @@ class DaemonHandler:
         t.start()
 
         return t
+
+    #
+    # Managed Pool
+
+    def load(self) -> float:
+        """
+        Get the load of this handler, e.g. the depth of its queue, by which to size the managed pool.
+
+        The load is also the pending work that stop drains. It is sampled under the lock of the pool, so it must be
+        computed without blocking or acquiring any lock.
+
+        """
+        return 0
+
+    def wakeup(self):
+        """Wake up the threads blocked in handle_one, so that they may return if should_yield holds."""
+
+    @property
+    def thread_count(self) -> int:
+        """Get the number of threads in the managed pool."""
+        pool = self._pool
+        return len(pool.threads) if pool is not None else 0
+
+    def should_yield(self) -> bool:
+        """Get whether threads of the managed pool should return from handle_one to exit, work permitting."""
+        pool = self._pool
+        return (
+            pool is not None
+            and (pool.is_stopping or len(pool.threads) > pool.target)
+            and current_thread() in pool.threads
+        )
+
+    def start_pool(self, min_threads: int = 1, max_threads: Optional[int] = None, load_per_thread: float = 1,
+                   shrink_delay: float = _DEFAULT_SHRINK_DELAY):
+        """
+        Start a managed pool of daemon threads to run the handler loop.
+
+        Args:
+            min_threads: The number of threads below which the pool does not shrink.
+                (Defaults to 1.)
+            max_threads: The number of threads beyond which the pool does not grow.
+                (Defaults to None, i.e. min_threads.)
+            load_per_thread: The load that each thread is expected to keep up with.
+                (Defaults to 1.)
+            shrink_delay: The time for which the load must stay below that of the current threads before the pool
+                shrinks, in seconds, so that bursty load does not churn threads.
+                (Defaults to 1.)
+
+        """
+        if self._pool is not None and not self._pool.is_stopping:
+            raise RuntimeError('pool is already running')
+        if load_per_thread <= 0:
+            raise ValueError('load_per_thread must be positive')
+        if shrink_delay < 0:
+            raise ValueError('shrink_delay must be non-negative')
+
+        self._pool = _Pool(0, 0, load_per_thread, shrink_delay)
+        self.resize_pool(min_threads, max_threads)
+
+    def resize_pool(self, min_threads: int, max_threads: Optional[int] = None):
+        """
+        Set the bounds of the managed pool, starting it if need be.
+
+        Missing threads are started immediately. Threads beyond the maximum exit as soon as they are done with their
+        current work.
+
+        """
+        if max_threads is None:
+            max_threads = min_threads
+        if not 0 <= min_threads <= max_threads:
+            raise ValueError('thread bounds must satisfy 0 <= min_threads <= max_threads')
+
+        if self._pool is None or self._pool.is_stopping:
+            self.start_pool(min_threads, max_threads)
+            return
+
+        pool = self._pool
+        with pool.lock:
+            pool.min_threads = min_threads
+            pool.max_threads = max_threads
+
+        self.rescale_pool()
+
+    def rescale_pool(self):
+        """Size the managed pool, if any, according to the current load."""
+        pool = self._pool
+        if pool is None:
+            return
+
+        with pool.lock:
+            if pool.is_stopping:
+                return
+
+            # Sample the load under the lock, so that the last update of the target reflects the latest load
+            target = min(pool.max_threads, max(pool.min_threads, math.ceil(self.load() / pool.load_per_thread)))
+            if target < pool.target <= pool.max_threads and pool.shrink_delay > 0:
+                # Hold the target until the load has stayed low for the delay
+                now = time.monotonic()
+                if pool.shrink_at is None:
+                    pool.shrink_at = now + pool.shrink_delay
+                if now < pool.shrink_at:
+                    if pool.shrink_timer is None:
+                        # Rescale once the delay has passed, as idle threads may not do so
+                        pool.shrink_timer = Timer(pool.shrink_at - now, self._end_shrink_delay, (pool,))
+                        pool.shrink_timer.daemon = True
+                        pool.shrink_timer.start()
+                    target = pool.target
+                else:
+                    pool.cancel_shrink()
+            else:
+                pool.cancel_shrink()
+
+            pool.target = target
+            while len(pool.threads) < target:
+                t = Thread(target=self._run_pool_thread, args=(pool,), daemon=True)
+                pool.threads.add(t)
+                t.start()
+
+            is_shrinking = len(pool.threads) > target
+
+        if is_shrinking:
+            self.wakeup()
+
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        """
+        Stop the managed pool once its pending work is drained.
+
+        Args:
+            timeout: The time to wait for the threads to exit, in seconds.
+                (Defaults to None, i.e. no limit.)
+
+        Returns:
+            Whether every thread of the pool has exited.
+
+        """
+        pool = self._pool
+        if pool is None:
+            return True
+
+        with pool.lock:
+            pool.is_stopping = True
+            pool.cancel_shrink()
+            threads = list(pool.threads)
+
+        self.wakeup()
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for t in threads:
+            t.join(None if deadline is None else max(0., deadline - time.monotonic()))
+
+        return not any(t.is_alive() for t in threads)
+
+    def _end_shrink_delay(self, pool: _Pool):
+        with pool.lock:
+            if pool.shrink_timer is not current_thread():
+                return
+            pool.shrink_timer = None
+
+        if self._pool is pool:
+            self.rescale_pool()
+
+    def _create_loop_counters(self) -> _LoopCounters:
+        counters = _LoopCounters()
+        with _LOOP_COUNTERS_LOCK:
+            self.__dict__.setdefault('_loop_counters', set()).add(counters)
+        return counters
+
+    def _retire_loop_counters(self, counters: _LoopCounters):
+        # Fold the counters of an exiting loop into the totals, so that the counters of exited threads are not kept
+        with _LOOP_COUNTERS_LOCK:
+            self.__dict__['_loop_counters'].discard(counters)
+            retired = self.__dict__.setdefault('_retired_loop_counters', _LoopCounters())
+            retired.add(counters)
+
+    def _handle_one_instrumented(self, counters: _LoopCounters):
+        start = time.perf_counter()
+        did_work = self.handle_one() is not False
+        elapsed = time.perf_counter() - start
+
+        counters.iterations += 1
+        if did_work:
+            counters.busy_time += elapsed
+            counters.idle_streak = 0
+            return
+
+        counters.idle_iterations += 1
+        counters.idle_time += elapsed
+        counters.idle_streak += 1
+
+        if counters.idle_streak == self.spin_warning_threshold:
+            LOGGER.warning(
+                '%s has done no work for %d consecutive iterations; handle_one may be spinning',
+                type(self).__name__, counters.idle_streak
+            )
+
+        backoff = self.spin_backoff
+        if backoff is not None and counters.idle_streak >= backoff.threshold:
+            if counters.idle_streak == backoff.threshold:
+                counters.delay = backoff.initial
+            else:
+                counters.delay = min(backoff.maximum, counters.delay * backoff.factor)
+
+            time.sleep(counters.delay)
+            counters.backoff_time += counters.delay
+
+    def _run_pool_thread(self, pool: _Pool):
+        this = current_thread()
+        counters = self._create_loop_counters()
+        try:
+            while self.is_active():
+                with pool.lock:
+                    if (pool.is_stopping and not self.load()) or len(pool.threads) > pool.target:
+                        pool.threads.discard(this)
+                        return
+
+                self._handle_one_instrumented(counters)
+                self.rescale_pool()
+        finally:
+            with pool.lock:
+                pool.threads.discard(this)
+            self._retire_loop_counters(counters)
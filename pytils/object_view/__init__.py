@@ -0,0 +1,28 @@
+from ._base import CachingObjectView, ObjectView
+from ._columnar import ColumnarObjectView
+from ._frozen import FrozenObjectView
+from ._json import LazyJsonView
+from ._packed import PackedObjectView, RecordSchema
+from ._paths import CompiledPath, CompiledPaths, PathKey, parse_path
+from ._query import PathIndex, Query
+from ._stream import iter_json, iter_ndjson
+from ._tracked import TrackedObjectView
+
+__all__ = [
+    'CachingObjectView',
+    'ColumnarObjectView',
+    'CompiledPath',
+    'CompiledPaths',
+    'FrozenObjectView',
+    'LazyJsonView',
+    'ObjectView',
+    'PackedObjectView',
+    'PathIndex',
+    'PathKey',
+    'Query',
+    'RecordSchema',
+    'TrackedObjectView',
+    'iter_json',
+    'iter_ndjson',
+    'parse_path',
+]
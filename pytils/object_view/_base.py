@@ -0,0 +1,238 @@
+import collections.abc
+from typing import Any, ItemsView, Iterable, Iterator, KeysView, Mapping, ValuesView
+
+__all__ = [
+    'CachingObjectView',
+    'ObjectView',
+]
+
+
+class ObjectView(collections.abc.Sequence, collections.abc.Mapping):
+
+    def __init__(self, data: Any):
+        object.__setattr__(self, '_ov_backing_data', data)
+
+    __slots__ = ('_ov_backing_data',)
+
+    @classmethod
+    def _select_view_ctor(cls, data: Any):
+        # The abstract base classes rather than their typing aliases, whose instance checks are several times slower
+        if isinstance(data, (collections.abc.Mapping, collections.abc.Sequence)) \
+                and not isinstance(data, (str, bytes, bytearray)):
+            return cls
+        else:
+            return lambda x: x
+
+    @classmethod
+    def _ov_wrap(cls, data: Any) -> Any:
+        return cls._select_view_ctor(data)(data)
+
+    @staticmethod
+    def _ov_unwrap(view: Any) -> Any:
+        return view() if isinstance(view, ObjectView) else view
+
+    @classmethod
+    def of(cls, data: Any) -> Any:
+        return cls._ov_wrap(data)
+
+    @staticmethod
+    def get_value(view: Any) -> Any:
+        return ObjectView._ov_unwrap(view)
+
+    @staticmethod
+    def compile(path) -> 'CompiledPath':
+        """Compile an accessor for the provided path, e.g. 'a.b[3].c', which works on raw data and views alike."""
+        from ._paths import CompiledPath
+        return CompiledPath(path)
+
+    @staticmethod
+    def compile_many(*paths) -> 'CompiledPaths':
+        """Compile an accessor for several paths at once, e.g. to extract them from many records in one call."""
+        from ._paths import CompiledPaths
+        return CompiledPaths(*paths)
+
+    @staticmethod
+    def compile_query(pattern) -> 'Query':
+        """Compile a query for the values matching a pattern of paths, e.g. 'orders.*.lines.*.sku' or '**.sku'."""
+        from ._query import Query
+        return Query(pattern)
+
+    @classmethod
+    def iter_json(cls, file, path=None) -> Iterator[Any]:
+        """
+        Iterate views of the items of an array of a JSON document, read incrementally from a binary file.
+
+        Only the current item is held in memory, rather than the whole document; path selects the array in the
+        document, e.g. 'results.items', which is the document itself by default.
+
+        """
+        from ._stream import iter_json
+        return (cls.of(item) for item in iter_json(file, path))
+
+    @classmethod
+    def iter_ndjson(cls, file) -> Iterator[Any]:
+        """Iterate views of the values of a newline-delimited JSON file, read incrementally from a binary file."""
+        from ._stream import iter_ndjson
+        return (cls.of(item) for item in iter_ndjson(file))
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._ov_backing_data!r})'
+
+    def __str__(self) -> str:
+        return str(self._ov_backing_data)
+
+    def __bytes__(self):
+        return bytes(self._ov_backing_data)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self._ov_backing_data, format_spec)
+
+    def __hash__(self):
+        return hash(self._ov_backing_data)
+
+    def __bool__(self):
+        return bool(self._ov_backing_data)
+
+    def __getattr__(self, key: str):
+        return self._ov_wrap(self._ov_backing_data[key])
+
+    def __setattr__(self, key: str, value):
+        self._ov_backing_data[key] = value
+
+    def __delattr__(self, key: str):
+        del self._ov_backing_data[key]
+
+    def __call__(self):
+        return self._ov_backing_data
+
+    def __len__(self):
+        return len(self._ov_backing_data)
+
+    def __getitem__(self, key):
+        return self._ov_wrap(self._ov_backing_data[key])
+
+    def __setitem__(self, key, value):
+        self._ov_backing_data[key] = value
+
+    def __delitem__(self, key):
+        del self._ov_backing_data[key]
+
+    def _ov_wrap_iterable(self, iterable: Iterable) -> Iterator:
+        return (self._ov_wrap(item) for item in iterable)
+
+    def __iter__(self):
+        return self._ov_wrap_iterable(iter(self._ov_backing_data))
+
+    def __reversed__(self):
+        return self._ov_wrap_iterable(reversed(self._ov_backing_data))
+
+    def __contains__(self, item):
+        return item in self._ov_backing_data
+
+    def keys(self) -> KeysView:
+        return self._ov_backing_data.keys()
+
+    def values(self) -> ValuesView:
+        return ObjectView.Values(self)
+
+    def items(self) -> ItemsView:
+        return ObjectView.Items(self)
+
+    def _values(self) -> Iterator:
+        return self._ov_wrap_iterable(self._ov_backing_data.values())
+
+    def _items(self) -> Iterator:
+        return (
+            (key, self._ov_wrap(value))
+            for key, value in self._ov_backing_data.items()
+        )
+
+    class Values(collections.abc.ValuesView):
+
+        def __init__(self, data: 'ObjectView'):
+            super().__init__(data)
+            self._data = data
+
+        def __iter__(self) -> Iterator:
+            return self._data._values()
+
+    class Items(collections.abc.ItemsView):
+
+        def __init__(self, data: 'ObjectView'):
+            super().__init__(data)
+            self._data = data
+
+        def __iter__(self) -> Iterator:
+            return self._data._items()
+
+
+class CachingObjectView(ObjectView):
+    """
+    ObjectView that memoizes the views of its children.
+
+    The view of a child is cached per key along with the child it wraps, and is reused for as long as the backing data
+    holds the same child object at that key; setting or deleting a key through the view drops its cached view. Slices
+    are not cached.
+
+    The children of a CachingObjectView are CachingObjectViews as well, so that the views along repeatedly accessed deep
+    paths are reused.
+
+    """
+
+    def __init__(self, data: Any):
+        super().__init__(data)
+        object.__setattr__(self, '_ov_cache', {})
+
+    __slots__ = ('_ov_cache',)
+
+    def _ov_child(self, key) -> Any:
+        data = self._ov_backing_data[key]
+        if isinstance(key, slice):
+            return self._ov_wrap(data)
+
+        cached = self._ov_cache.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+        view = self._ov_wrap(data)
+        self._ov_cache[key] = (data, view)
+        return view
+
+    def _ov_invalidate(self, key):
+        if not isinstance(key, slice):
+            self._ov_cache.pop(key, None)
+        else:
+            # Slice assignment and deletion shift the indices of the items beyond the slice
+            self._ov_cache.clear()
+
+    def __getattr__(self, key: str):
+        return self._ov_child(key)
+
+    def __setattr__(self, key: str, value):
+        self._ov_backing_data[key] = value
+        self._ov_invalidate(key)
+
+    def __delattr__(self, key: str):
+        del self._ov_backing_data[key]
+        self._ov_invalidate(key)
+
+    def __getitem__(self, key):
+        return self._ov_child(key)
+
+    def __setitem__(self, key, value):
+        self._ov_backing_data[key] = value
+        self._ov_invalidate(key)
+
+    def __delitem__(self, key):
+        del self._ov_backing_data[key]
+        if isinstance(self._ov_backing_data, Mapping):
+            self._ov_invalidate(key)
+        else:
+            # Deleting an item shifts the indices of the items beyond it
+            self._ov_cache.clear()
+
+    def _items(self) -> Iterator:
+        return (
+            (key, self._ov_child(key))
+            for key in self._ov_backing_data.keys()
+        )
@@ -0,0 +1,214 @@
+import collections.abc
+from array import array
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
+
+from ._base import ObjectView
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = [
+    'ColumnarObjectView',
+]
+
+# The array type codes of the columns whose values are all of a type, when NumPy is not available
+_TYPE_CODES = {
+    bool: 'b',
+    int: 'q',
+    float: 'd',
+}
+_DTYPES = {} if numpy is None else {
+    bool: numpy.bool_,
+    int: numpy.int64,
+    float: numpy.float64,
+}
+
+Column = Union[List[Any], array, Any]
+
+
+def _make_column(values: List[Any]) -> Tuple[Column, Optional[type]]:
+    """Get a column holding the provided values, along with the type to which its items are converted on access."""
+    kinds = set(map(type, values))
+    if len(kinds) != 1:
+        return values, None
+
+    kind, = kinds
+    if kind not in _TYPE_CODES:
+        return values, None
+
+    try:
+        if numpy is not None:
+            return numpy.array(values, dtype=_DTYPES[kind]), kind
+        return array(_TYPE_CODES[kind], values), kind
+    except OverflowError:
+        # Integers beyond 64 bits
+        return values, None
+
+
+def _slice_column(column: Column, index: slice) -> Column:
+    # Copy NumPy columns, which are sliced as views, so that slices are copies regardless of the storage
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return column[index].copy()
+    return column[index]
+
+
+class _ColumnStore(collections.abc.Sequence):
+    """Sequence of records with the same fields, stored as one column per field."""
+
+    __slots__ = ('fields', '_columns', '_kinds', '_length')
+
+    def __init__(self, fields: Tuple[str, ...], columns: Dict[str, Column], kinds: Dict[str, Optional[type]]):
+        self.fields = fields
+        self._columns = columns
+        self._kinds = kinds
+        self._length = len(columns[fields[0]]) if fields else 0
+
+    @classmethod
+    def from_records(cls, records: Sequence[Mapping[str, Any]]) -> '_ColumnStore':
+        if not records:
+            return cls((), {}, {})
+
+        fields = tuple(records[0])
+        field_set = set(fields)
+        for index, record in enumerate(records):
+            if len(record) != len(fields) or not field_set.issuperset(record):
+                raise ValueError(f'record {index} does not have the fields of the first record: {fields}')
+
+        columns = {}
+        kinds = {}
+        for field in fields:
+            columns[field], kinds[field] = _make_column([record[field] for record in records])
+
+        return cls(fields, columns, kinds)
+
+    def __repr__(self) -> str:
+        return f'<columns {self.fields} of {self._length} records>'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: Union[int, slice]) -> Union['_Row', '_ColumnStore']:
+        if isinstance(index, slice):
+            columns = {field: _slice_column(column, index) for field, column in self._columns.items()}
+            return _ColumnStore(self.fields, columns, dict(self._kinds))
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError('list index out of range')
+        return _Row(self, index)
+
+    def __iter__(self) -> Iterator['_Row']:
+        return (_Row(self, index) for index in range(self._length))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, _ColumnStore)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def column(self, field: str) -> Column:
+        return self._columns[field]
+
+    def get(self, field: str, index: int) -> Any:
+        value = self._columns[field][index]
+        kind = self._kinds[field]
+        return value if kind is None else kind(value)
+
+    def set(self, field: str, index: int, value: Any):
+        kind = self._kinds[field]
+        if kind is not None and type(value) is not kind:
+            # Fall back to a list for the column, as its values are no longer all of its type
+            self._to_list(field)
+
+        try:
+            self._columns[field][index] = value
+        except OverflowError:
+            # Integers beyond 64 bits
+            self._to_list(field)
+            self._columns[field][index] = value
+
+    def _to_list(self, field: str):
+        kind = self._kinds[field]
+        self._columns[field] = [kind(item) for item in self._columns[field]]
+        self._kinds[field] = None
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        columns = [self._columns[field] for field in self.fields]
+        kinds = [self._kinds[field] for field in self.fields]
+        converted = [column if kind is None else list(map(kind, column)) for column, kind in zip(columns, kinds)]
+        return [dict(zip(self.fields, values)) for values in zip(*converted)]
+
+
+class _Row(collections.abc.Mapping):
+    """Record of a column store, reading and writing its fields in place."""
+
+    __slots__ = ('_store', '_index')
+
+    def __init__(self, store: _ColumnStore, index: int):
+        self._store = store
+        self._index = index
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+    def __getitem__(self, field: str) -> Any:
+        return self._store.get(field, self._index)
+
+    def __setitem__(self, field: str, value: Any):
+        if field not in self._store.fields:
+            raise KeyError(field)
+        self._store.set(field, self._index, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._store.fields)
+
+    def __len__(self) -> int:
+        return len(self._store.fields)
+
+
+class ColumnarObjectView(ObjectView):
+    """
+    ObjectView over a sequence of records with the same fields, stored as one column per field.
+
+    Columns whose values are all booleans, integers or floats are stored as NumPy arrays if NumPy is available, or as
+    arrays otherwise, and the other columns as lists. Thus, the field names are stored once rather than in every record,
+    and numeric fields take 8 bytes or less per record.
+
+    Rows are views of their records, whose fields are read from and written to the columns in place; column gets a
+    whole column, e.g. to scan a field with vectorized operations. A column falls back to a list once a value of another
+    type is written to it.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, data: Any) -> Any:
+        """Get a columnar view of the provided sequence of records, or a view of other data."""
+        if isinstance(data, collections.abc.Sequence) and not isinstance(data, (str, bytes, bytearray, _ColumnStore)) \
+                and data and all(isinstance(record, collections.abc.Mapping) for record in data):
+            data = _ColumnStore.from_records(data)
+
+        return cls._ov_wrap(data)
+
+    def _ov_store(self) -> _ColumnStore:
+        data = self._ov_backing_data
+        if not isinstance(data, _ColumnStore):
+            raise TypeError(f'{type(self).__name__} is not a view of columns')
+        return data
+
+    def column(self, field: str) -> Column:
+        """Get the column of the provided field, which is shared with the rows."""
+        return self._ov_store().column(field)
+
+    def fields(self) -> Tuple[str, ...]:
+        """Get the fields of the records."""
+        return self._ov_store().fields
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get the records as a list of dicts."""
+        return self._ov_store().to_records()
@@ -0,0 +1,230 @@
+import collections.abc
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple, Union
+
+from ._base import ObjectView
+from ._paths import PathKey, PathLike, parse_path
+
+__all__ = [
+    'FrozenObjectView',
+]
+
+
+class _FrozenMap(collections.abc.Mapping):
+    """Immutable mapping whose hash is computed once."""
+
+    __slots__ = ('_data', '_hash')
+
+    def __init__(self, data: Dict[Any, Any]):
+        self._data = data
+        self._hash = None  # type: Optional[int]
+
+    def __repr__(self) -> str:
+        return repr(self._data)
+
+    def __getitem__(self, key) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(frozenset(self._data.items()))
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, _FrozenMap):
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            # Shared children compare equal by identity
+            return self._data == other._data
+        if isinstance(other, collections.abc.Mapping):
+            return self._data == dict(other.items())
+        return NotImplemented
+
+    def _child(self, key) -> Any:
+        return self._data.get(key, _EMPTY_MAP)
+
+    def _replace(self, key, value) -> '_FrozenMap':
+        if key in self._data and self._data[key] is value:
+            return self
+
+        data = self._data.copy()
+        data[key] = value
+        return _FrozenMap(data)
+
+    def _remove(self, key) -> '_FrozenMap':
+        data = self._data.copy()
+        del data[key]
+        return _FrozenMap(data)
+
+    def thaw(self) -> Dict[Any, Any]:
+        return {key: _thaw(value) for key, value in self._data.items()}
+
+
+class _FrozenList(collections.abc.Sequence):
+    """Immutable sequence whose hash is computed once."""
+
+    __slots__ = ('_items', '_hash')
+
+    def __init__(self, items: Tuple[Any, ...]):
+        self._items = items
+        self._hash = None  # type: Optional[int]
+
+    def __repr__(self) -> str:
+        return repr(list(self._items))
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return _FrozenList(self._items[index])
+        return self._items[index]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._items)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __hash__(self) -> int:
+        if self._hash is None:
+            self._hash = hash(self._items)
+        return self._hash
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, _FrozenList):
+            if self._hash is not None and other._hash is not None and self._hash != other._hash:
+                return False
+            return self._items == other._items
+        if isinstance(other, (list, tuple)):
+            return self._items == tuple(other)
+        return NotImplemented
+
+    def _child(self, index: int) -> Any:
+        return self._items[index]
+
+    def _replace(self, index: int, value) -> '_FrozenList':
+        if self._items[index] is value:
+            return self
+
+        items = list(self._items)
+        items[index] = value
+        return _FrozenList(tuple(items))
+
+    def _remove(self, index: int) -> '_FrozenList':
+        items = list(self._items)
+        del items[index]
+        return _FrozenList(tuple(items))
+
+    def thaw(self) -> list:
+        return [_thaw(item) for item in self._items]
+
+
+_EMPTY_MAP = _FrozenMap({})
+
+_Node = Union[_FrozenMap, _FrozenList]
+
+
+def _freeze(data: Any) -> Any:
+    data = ObjectView.get_value(data)
+    if isinstance(data, (_FrozenMap, _FrozenList)):
+        return data
+    if isinstance(data, collections.abc.Mapping):
+        return _FrozenMap({key: _freeze(value) for key, value in data.items()})
+    if isinstance(data, (list, tuple)):
+        return _FrozenList(tuple(_freeze(item) for item in data))
+    if isinstance(data, (set, frozenset)):
+        return frozenset(data)
+    return data
+
+
+def _thaw(data: Any) -> Any:
+    return data.thaw() if isinstance(data, (_FrozenMap, _FrozenList)) else data
+
+
+def _as_node(data: Any, key: PathKey) -> _Node:
+    if not isinstance(data, (_FrozenMap, _FrozenList)):
+        raise TypeError(f'cannot index {type(data).__name__} by {key!r}')
+    return data
+
+
+def _set_in(node: _Node, keys: Sequence[PathKey], value: Any) -> _Node:
+    key = keys[0]
+    if len(keys) > 1:
+        value = _set_in(_as_node(node._child(key), keys[1]), keys[1:], value)
+    return node._replace(key, value)
+
+
+def _delete_in(node: _Node, keys: Sequence[PathKey]) -> _Node:
+    key = keys[0]
+    if len(keys) == 1:
+        return node._remove(key)
+    return node._replace(key, _delete_in(_as_node(node[key], keys[1]), keys[1:]))
+
+
+class FrozenObjectView(ObjectView):
+    """
+    Immutable ObjectView, whose updates return new views that share the unchanged parts of the data.
+
+    The data is frozen once into immutable mappings and sequences, which are hashable; their hashes are computed on
+    first use and cached, and comparisons short-circuit on shared, i.e. identical, parts. set_in and delete_in copy the
+    containers along the path only, so that snapshots are free and an update costs the size of those containers.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, data: Any) -> Any:
+        """Get a view of a frozen copy of the provided data, unless it is frozen already."""
+        return cls._ov_wrap(_freeze(data))
+
+    def set_in(self, path: PathLike, value: Any) -> 'FrozenObjectView':
+        """
+        Get a view of this data with the value at the provided path replaced, e.g. view.set_in('a.b[3].c', 1).
+
+        The missing keys of the mappings along the path are added, with empty mappings.
+
+        """
+        keys = parse_path(path)
+        if not keys:
+            return type(self).of(value)
+        return type(self)(_set_in(_as_node(self._ov_backing_data, keys[0]), keys, _freeze(value)))
+
+    def delete_in(self, path: PathLike) -> 'FrozenObjectView':
+        """Get a view of this data without the key at the provided path."""
+        keys = parse_path(path)
+        if not keys:
+            raise ValueError('path must have at least one key')
+        return type(self)(_delete_in(_as_node(self._ov_backing_data, keys[0]), keys))
+
+    def thaw(self) -> Any:
+        """Get a mutable copy of this data, as dicts and lists."""
+        return _thaw(self._ov_backing_data)
+
+    def __setattr__(self, key: str, value):
+        raise TypeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, key: str):
+        raise TypeError(f'{type(self).__name__} is immutable')
+
+    def __setitem__(self, key, value):
+        raise TypeError(f'{type(self).__name__} is immutable')
+
+    def __delitem__(self, key):
+        raise TypeError(f'{type(self).__name__} is immutable')
+
+    def __eq__(self, other) -> bool:
+        return self._ov_backing_data == ObjectView.get_value(other)
+
+    def __hash__(self) -> int:
+        return hash(self._ov_backing_data)
@@ -0,0 +1,360 @@
+import collections.abc
+import json
+import mmap
+import re
+from array import array
+from itertools import accumulate, chain, compress, repeat
+from operator import add, itemgetter, mul
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from ._base import ObjectView
+
+__all__ = [
+    'LazyJsonView',
+]
+
+Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+# The number of bytes of a node that are scanned at once, doubled from one scan to the next, so that lookups near the
+# start of a node stop early while large nodes are scanned in few windows
+_MIN_WINDOW_SIZE = 1 << 10
+_MAX_WINDOW_SIZE = 1 << 18
+
+_WHITESPACE = re.compile(rb'[ \t\n\r]*')
+_MEMBER = re.compile(rb'[ \t\n\r]*("[^"\\]*(?:\\.[^"\\]*)*")[ \t\n\r]*:', re.DOTALL)
+_SCALAR = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"|[^,:\[\]{}\s"]+', re.DOTALL)
+
+_BACKSLASH = ord('\\')
+_COMMA = ord(',')
+_OPEN_ARRAY = ord('[')
+_OPEN_OBJECT = ord('{')
+_CLOSE_ARRAY = ord(']')
+_CLOSE_OBJECT = ord('}')
+
+_DEPTH_CHANGES = [0] * 256
+_DEPTH_CHANGES[ord('[')] = _DEPTH_CHANGES[ord('{')] = 1
+_DEPTH_CHANGES[ord(']')] = _DEPTH_CHANGES[ord('}')] = -1
+_SEPARATOR_KEY = 256 + _COMMA
+
+# A chunk skips over strings and other content up to the next structural character, if any before the end of the
+# window; an unterminated string, i.e. one that runs past the window, ends a chunk at its opening quote
+_CHUNK_PATTERN = r'[^\[\]{}",]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^\[\]{}",]*)*(?:[\[\]{}",]|\Z)'
+
+_LAST_BYTE = itemgetter(-1)
+_LAST_CHARACTER = itemgetter(slice(-1, None))
+
+
+class _WindowScanner:
+    """Scanner of the structural characters of windows of JSON texts, either bytes or strings."""
+
+    __slots__ = ('_chunk', '_binary', '_quote', '_depth_change')
+
+    def __init__(self, empty: Union[bytes, str], depth_changes):
+        """Initialize a scanner of texts of the type of the provided empty text."""
+        self._binary = isinstance(empty, bytes)
+        self._chunk = re.compile(_CHUNK_PATTERN.encode() if self._binary else _CHUNK_PATTERN, re.DOTALL)
+        self._quote = b'"' if self._binary else '"'
+        self._depth_change = depth_changes.__getitem__
+
+    def scan(
+            self, text: Any, position: int, window_end: int, truncated: bool, depth: int
+    ) -> Tuple[List[int], List[int], Any]:
+        """
+        Scan a window of a text, up to the end of its last complete chunk.
+
+        Args:
+            text: The text.
+            position: The start of the window, outside of any string.
+            window_end: The end of the window.
+            truncated: Whether the text goes on after the window, so that its last chunk may be cut short.
+            depth: The nesting depth at the start of the window.
+
+        Returns:
+            The offsets of the ends of the scanned chunks, preceded by position; the depths after them, preceded by
+            depth; and the structural characters that terminate them.
+
+        """
+        chunks = self._chunk.findall(text, position, window_end)
+        if not chunks[-1]:
+            # The empty match at the end of the window
+            chunks.pop()
+        if chunks and truncated:
+            # The last chunk may be cut short by the end of the window
+            chunks.pop()
+
+        if self._binary:
+            terminators = bytes(map(_LAST_BYTE, chunks))
+        else:
+            terminators = ''.join(map(_LAST_CHARACTER, chunks))
+        quote = terminators.find(self._quote)
+        if quote != -1:
+            # The string starting at the quote runs past the window
+            del chunks[quote:]
+            terminators = terminators[:quote]
+
+        ends = list(accumulate(chain((position,), map(len, chunks))))
+        depths = list(accumulate(chain((depth,), map(self._depth_change, terminators))))
+        return ends, depths, terminators
+
+
+_BYTES_SCANNER = _WindowScanner(b'', _DEPTH_CHANGES)
+_TEXT_SCANNER = _WindowScanner('', {'[': 1, '{': 1, ']': -1, '}': -1, ',': 0})
+
+
+def _skip_whitespace(buffer: Buffer, position: int) -> int:
+    return _WHITESPACE.match(buffer, position).end()
+
+
+def _decode_key(raw: bytes) -> str:
+    if _BACKSLASH in raw:
+        return json.loads(raw)
+    return raw[1:-1].decode('utf-8')
+
+
+def _load(buffer: Buffer, start: int, end: int) -> Any:
+    """Get a lazy container for the value at the provided offset if it is an array or object, or else decode it."""
+    position = _skip_whitespace(buffer, start)
+    if position < end:
+        first = buffer[position]
+        if first == _OPEN_OBJECT:
+            return _LazyJsonObject(buffer, position, end)
+        if first == _OPEN_ARRAY:
+            return _LazyJsonArray(buffer, position, end)
+
+        match = _SCALAR.match(buffer, position, end)
+        if match is not None:
+            return json.loads(bytes(buffer[position:match.end()]))
+
+    raise ValueError(f'invalid JSON value at offset {position}')
+
+
+class _LazyJsonNode:
+    """
+    Array or object of a JSON document, read from its buffer on demand.
+
+    The start offsets of the children are indexed by scanning the node, window by window, only as far as the accessed
+    children; children are only parsed when accessed. The containers among the children are cached, and the scan of a
+    node jumps over those that have been scanned already.
+
+    """
+
+    __slots__ = ('_buffer', '_start', '_end', '_starts', '_children', '_position', '_depth', '_window_size')
+
+    _kind = ''
+    _closing = 0
+
+    def __init__(self, buffer: Buffer, start: int, end: int):
+        """Initialize a node starting at its opening bracket and ending at the latest at the provided offset."""
+        self._buffer = buffer
+        self._start = start
+        self._end = end
+        self._starts = array('q')
+        self._children = {}  # type: Dict[int, _LazyJsonNode]
+
+        # The state of the scan, until it reaches the closing bracket
+        self._position = start  # type: Optional[int]
+        self._depth = 0
+        self._window_size = _MIN_WINDOW_SIZE
+
+    def __repr__(self) -> str:
+        return f'<lazy JSON {self._kind} at offset {self._start}>'
+
+    def _add_child(self, start: int):
+        """Index the child starting at the provided offset, possibly preceded by whitespace."""
+        self._starts.append(start)
+
+    def _scan(self):
+        """Scan the next window of this node, indexing the children that start in it."""
+        buffer = self._buffer
+        position = self._position
+        if position == self._start:
+            first = _skip_whitespace(buffer, position + 1)
+            if first < self._end and buffer[first] == self._closing:
+                self._end = first + 1
+                self._position = None
+                return
+
+            self._add_child(position + 1)
+            position += 1
+            self._depth = 1
+
+        last_child = self._children.get(len(self._starts) - 1)
+        if last_child is not None and last_child._position is None and last_child._end > position:
+            position = last_child._end
+            self._depth = 1
+
+        window_size = self._window_size
+        self._window_size = min(_MAX_WINDOW_SIZE, 2 * window_size)
+        while True:
+            window_end = min(self._end, position + window_size)
+            ends, depths, terminators = _BYTES_SCANNER.scan(
+                buffer, position, window_end, window_end < self._end, self._depth
+            )
+            if ends[-1] > position or window_end == self._end:
+                break
+            window_size *= 2
+
+        resume = ends[-1]
+        try:
+            closing = depths.index(0, 1)
+        except ValueError:
+            closing = None
+        else:
+            del depths[closing + 1:], ends[closing + 1:]
+
+        # The separators of the children are the commas at depth 1, found as (depth, byte) keys equal to (1, ',')
+        keys = map(add, map(mul, depths[1:], repeat(256)), terminators)
+        for separator in compress(ends[1:], map(_SEPARATOR_KEY.__eq__, keys)):
+            self._add_child(separator)
+
+        if closing is not None:
+            self._end = ends[closing]
+            self._position = None
+        elif window_end == self._end:
+            raise ValueError(f'unterminated JSON {self._kind} at offset {self._start}')
+        else:
+            self._position = resume
+            self._depth = depths[-1]
+
+    def _index(self, count: Optional[int] = None):
+        """Index the children of this node, at least up to the provided number of them, if any."""
+        while self._position is not None and (count is None or len(self._starts) < count):
+            self._scan()
+
+    def _child(self, index: int) -> Any:
+        child = self._children.get(index)
+        if child is not None:
+            return child
+
+        # The child ends before the next one, if indexed already
+        end = self._starts[index + 1] if index + 1 < len(self._starts) else self._end
+        value = _load(self._buffer, self._starts[index], end)
+        if isinstance(value, _LazyJsonNode):
+            self._children[index] = value
+        return value
+
+    def __len__(self) -> int:
+        self._index()
+        return len(self._starts)
+
+    def materialize(self) -> Any:
+        """Parse the whole span of this node into plain Python data."""
+        self._index()
+        return json.loads(bytes(self._buffer[self._start:self._end]))
+
+
+class _LazyJsonObject(_LazyJsonNode, collections.abc.Mapping):
+
+    __slots__ = ('_keys',)
+
+    _kind = 'object'
+    _closing = _CLOSE_OBJECT
+
+    def __init__(self, buffer: Buffer, start: int, end: int):
+        super().__init__(buffer, start, end)
+        self._keys = {}  # type: Dict[str, int]
+
+    def _add_child(self, start: int):
+        match = _MEMBER.match(self._buffer, start, self._end)
+        if match is None:
+            raise ValueError(f'invalid JSON object member at offset {start}')
+
+        # Later duplicates take precedence, as in json.loads, once they are indexed
+        self._keys[_decode_key(match.group(1))] = len(self._starts)
+        super()._add_child(match.end())
+
+    def _find(self, key: str) -> bool:
+        """Index the children of this object up to the provided key; get whether it was found."""
+        keys = self._keys
+        while key not in keys and self._position is not None:
+            self._scan()
+        return key in keys
+
+    def __getitem__(self, key: str) -> Any:
+        if not self._find(key):
+            raise KeyError(key)
+        return self._child(self._keys[key])
+
+    def __iter__(self) -> Iterator[str]:
+        self._index()
+        return iter(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return isinstance(key, str) and self._find(key)
+
+
+class _LazyJsonArray(_LazyJsonNode, collections.abc.Sequence):
+
+    __slots__ = ()
+
+    _kind = 'array'
+    _closing = _CLOSE_ARRAY
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Any, List[Any]]:
+        if isinstance(index, slice):
+            return [self._child(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        elif index >= len(self._starts):
+            self._index(index + 1)
+
+        if not 0 <= index < len(self._starts):
+            raise IndexError('list index out of range')
+        return self._child(index)
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while True:
+            if index >= len(self._starts):
+                self._index(index + 1)
+                if index >= len(self._starts):
+                    return
+
+            yield self._child(index)
+            index += 1
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, _LazyJsonArray)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+
+class LazyJsonView(ObjectView):
+    """
+    Read-only ObjectView over a JSON document held as raw bytes, e.g. in an mmap.
+
+    Only the parts of the document that are accessed are parsed: an array or object is scanned only as far as needed
+    to index the offsets of its accessed children, and only the children that are then accessed are parsed. Thus,
+    reading a few fields of a large document costs a scan of the enclosing spans rather than a full parse, and the
+    memory held is that of the indexes rather than that of the parsed document. Scanning a span costs more per byte
+    than parsing it with json.loads, however, so a full parse remains faster to read most of a document.
+
+    The views are drop-in replacements for those of ObjectView for reads; malformed parts of the document are reported
+    as a ValueError when they are first scanned or parsed. Use materialize to parse a view into plain Python data.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, data: Any) -> Any:
+        """Get a view of the JSON document held in the provided buffer, or of already parsed data."""
+        if isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            data = _load(data, 0, len(data))
+
+        return cls._ov_wrap(data)
+
+    @classmethod
+    def from_file(cls, path: str) -> Any:
+        """Get a view of the JSON document in the provided file, which is memory-mapped rather than read."""
+        with open(path, 'rb') as f:
+            return cls.of(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @staticmethod
+    def materialize(view: Any) -> Any:
+        """Parse the provided view, or lazy container, into plain Python data."""
+        data = ObjectView.get_value(view)
+        return data.materialize() if isinstance(data, _LazyJsonNode) else data
@@ -0,0 +1,263 @@
+import collections.abc
+import re
+import struct
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+from ._base import ObjectView
+
+__all__ = [
+    'PackedObjectView',
+    'RecordSchema',
+]
+
+_NATIVE_BYTE_ORDERS = ('@', '')
+_BYTE_ORDERS = ('@', '=', '<', '>', '!')
+
+# A single struct format code, possibly with a repeat count; pad bytes are not fields
+_FIELD_CODE = re.compile(r'\d*[cbB?hHiIlLqQnNefdspP]')
+
+FieldType = Union[str, 'RecordSchema', Tuple['RecordSchema', int]]
+
+
+class _Field(NamedTuple):
+    """Layout of a field of a record: a struct code, a nested record or a nested array of records."""
+
+    offset: int
+    codec: Optional[struct.Struct]
+    schema: Optional['RecordSchema']
+    count: Optional[int]
+
+
+class RecordSchema:
+    """
+    Layout of fixed-size binary records, as a sequence of named fields.
+
+    The type of a field is either a single struct format code, possibly with a repeat count, e.g. 'I', 'd', '16s' or
+    '3h'; a nested RecordSchema; or a (RecordSchema, count) pair for a nested array of records. Codes that unpack to a
+    single value are scalar fields; others, e.g. '3h', are tuples.
+
+    The fields are laid out in order, following the alignment rules of struct for the byte order, i.e. aligned for the
+    native byte order '@' and packed otherwise. With the native byte order, nested records are also aligned to their
+    alignment, i.e. that of their most aligned field, and the size of a record is padded to a multiple of its alignment,
+    as in C, so that the records of an array are aligned.
+
+    """
+
+    __slots__ = ('byte_order', 'fields', 'size', 'alignment', '_layout')
+
+    def __init__(self, fields: Sequence[Tuple[str, FieldType]], byte_order: str = '<'):
+        if byte_order not in _BYTE_ORDERS:
+            raise ValueError(f'invalid byte order: {byte_order!r}')
+
+        self.byte_order = byte_order
+        self.fields = tuple(name for name, _ in fields)
+        if len(set(self.fields)) != len(self.fields):
+            raise ValueError('field names must be unique')
+
+        is_native = byte_order in _NATIVE_BYTE_ORDERS
+        layout = {}  # type: Dict[str, _Field]
+        offset = 0
+        max_alignment = 1
+        for name, field_type in fields:
+            if isinstance(field_type, str):
+                if not _FIELD_CODE.fullmatch(field_type):
+                    raise ValueError(f'field {name!r} must have a single struct format code, got {field_type!r}')
+                codec = struct.Struct(byte_order + field_type)
+                if is_native:
+                    # The padding that struct inserts before the code after a single byte
+                    alignment = struct.calcsize('@c' + field_type) - codec.size
+                    offset += -offset % alignment
+                    max_alignment = max(max_alignment, alignment)
+                layout[name] = _Field(offset, codec, None, None)
+                offset += codec.size
+            else:
+                schema, count = field_type if isinstance(field_type, tuple) else (field_type, None)
+                if is_native:
+                    offset += -offset % schema.alignment
+                    max_alignment = max(max_alignment, schema.alignment)
+                layout[name] = _Field(offset, None, schema, count)
+                offset += schema.size * (1 if count is None else count)
+
+        # Trailing padding, so that the fields of consecutive records are aligned
+        offset += -offset % max_alignment
+
+        self.size = offset
+        self.alignment = max_alignment
+        self._layout = layout
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.fields!r}, size={self.size})'
+
+    def get(self, buffer: memoryview, offset: int, name: str) -> Any:
+        """Decode the provided field of the record at the provided offset, or view it if it is nested."""
+        field = self._layout[name]
+        if field.codec is None:
+            if field.count is None:
+                return _PackedRecord(field.schema, buffer, offset + field.offset)
+            return _PackedArray(field.schema, buffer, offset + field.offset, field.count)
+
+        values = field.codec.unpack_from(buffer, offset + field.offset)
+        return values[0] if len(values) == 1 else values
+
+    def set(self, buffer: memoryview, offset: int, name: str, value: Any):
+        """Encode the provided value into the provided field of the record at the provided offset."""
+        field = self._layout[name]
+        value = ObjectView.get_value(value)
+        if field.codec is None:
+            target = self.get(buffer, offset, name)
+            if field.count is None:
+                for key in field.schema.fields:
+                    target[key] = value[key]
+            else:
+                if len(value) != field.count:
+                    raise ValueError(f'expected {field.count} records for field {name!r}')
+                for index, item in enumerate(value):
+                    target[index] = item
+        elif isinstance(value, tuple):
+            field.codec.pack_into(buffer, offset + field.offset, *value)
+        else:
+            field.codec.pack_into(buffer, offset + field.offset, value)
+
+
+class _PackedRecord(collections.abc.Mapping):
+    """Record of a buffer, decoding and encoding its fields in place."""
+
+    __slots__ = ('_schema', '_buffer', '_offset')
+
+    def __init__(self, schema: RecordSchema, buffer: memoryview, offset: int):
+        self._schema = schema
+        self._buffer = buffer
+        self._offset = offset
+
+    def __repr__(self) -> str:
+        return f'<packed record {self._schema.fields} at offset {self._offset}>'
+
+    def __getitem__(self, name: str) -> Any:
+        return self._schema.get(self._buffer, self._offset, name)
+
+    def __setitem__(self, name: str, value: Any):
+        self._schema.set(self._buffer, self._offset, name, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._schema.fields)
+
+    def __len__(self) -> int:
+        return len(self._schema.fields)
+
+    def __contains__(self, name) -> bool:
+        return name in self._schema.fields
+
+    def materialize(self) -> Dict[str, Any]:
+        return {name: _materialize(self[name]) for name in self._schema.fields}
+
+
+class _PackedArray(collections.abc.Sequence):
+    """Array of records of a buffer, viewed at a stride without copying."""
+
+    __slots__ = ('_schema', '_buffer', '_offset', '_count', '_stride')
+
+    def __init__(self, schema: RecordSchema, buffer: memoryview, offset: int, count: int, stride: Optional[int] = None):
+        self._schema = schema
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._stride = schema.size if stride is None else stride
+
+    def __repr__(self) -> str:
+        return f'<packed array of {self._count} records {self._schema.fields} at offset {self._offset}>'
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[_PackedRecord, '_PackedArray']:
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._count))
+            return _PackedArray(
+                self._schema, self._buffer, self._offset + indices.start * self._stride, len(indices),
+                self._stride * indices.step
+            )
+
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError('list index out of range')
+        return _PackedRecord(self._schema, self._buffer, self._offset + index * self._stride)
+
+    def __setitem__(self, index: int, value: Any):
+        record = self[index]
+        value = ObjectView.get_value(value)
+        for name in self._schema.fields:
+            record[name] = value[name]
+
+    def __iter__(self) -> Iterator[_PackedRecord]:
+        return (
+            _PackedRecord(self._schema, self._buffer, self._offset + index * self._stride)
+            for index in range(self._count)
+        )
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, tuple, _PackedArray)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def materialize(self) -> List[Dict[str, Any]]:
+        return [record.materialize() for record in self]
+
+
+def _materialize(value: Any) -> Any:
+    return value.materialize() if isinstance(value, (_PackedRecord, _PackedArray)) else value
+
+
+def _as_bytes(buffer: Any) -> memoryview:
+    view = memoryview(buffer)
+    return view if view.format == 'B' and view.ndim == 1 else view.cast('B')
+
+
+class PackedObjectView(ObjectView):
+    """
+    ObjectView over fixed-layout binary records held in a buffer, such as bytes, a bytearray, a memoryview or an mmap.
+
+    The layout of the records is described by a RecordSchema. Fields are decoded from the buffer on access, and written
+    back into it, if writable, on assignment; nothing else is copied. Arrays of records, including their slices, are
+    viewed at a stride over the buffer.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def of(cls, data: Any, schema: Optional[RecordSchema] = None, count: Optional[int] = None, offset: int = 0) -> Any:
+        """
+        Get a view of the array of records held in the provided buffer, if a schema is provided, or a view of data.
+
+        Args:
+            data: The buffer, or data to view.
+            schema: The layout of the records.
+                (Defaults to None, i.e. data is not a buffer of records.)
+            count: The number of records.
+                (Defaults to None, i.e. as many as fit in the buffer after the offset.)
+            offset: The offset of the first record in the buffer.
+                (Defaults to 0.)
+
+        """
+        if schema is not None:
+            buffer = _as_bytes(data)
+            if count is None:
+                count = (len(buffer) - offset) // schema.size
+            if offset < 0 or offset + count * schema.size > len(buffer):
+                raise ValueError('records exceed the buffer')
+            data = _PackedArray(schema, buffer, offset, count)
+
+        return cls._ov_wrap(data)
+
+    @classmethod
+    def of_record(cls, data: Any, schema: RecordSchema, offset: int = 0) -> 'PackedObjectView':
+        """Get a view of the single record held in the provided buffer at the provided offset."""
+        return cls.of(data, schema, 1, offset)[0]
+
+    @staticmethod
+    def materialize(view: Any) -> Any:
+        """Decode the provided view into plain Python data."""
+        return _materialize(ObjectView.get_value(view))
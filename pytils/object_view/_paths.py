@@ -0,0 +1,184 @@
+import re
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Union
+
+from ._base import ObjectView
+from ..paths import AbstractPath
+
+__all__ = [
+    'CompiledPath',
+    'CompiledPaths',
+    'PathKey',
+    'parse_path',
+]
+
+PathKey = Union[str, int]
+PathLike = Union[str, AbstractPath, Sequence[PathKey]]
+
+# A segment is a bare name, an index between brackets or a quoted key between brackets
+_SEGMENT_PATTERN = re.compile(r'''
+    (?:^|\.)(?P<name>[^.\[\]'"]+)
+    | \[(?P<index>-?\d+)\]
+    | \[(?P<quote>['"])(?P<key>.*?)(?P=quote)\]
+''', re.VERBOSE)
+_INTEGER_PATTERN = re.compile(r'-?\d+')
+
+_MISSING = object()
+_LOOKUP_ERRORS = (KeyError, IndexError, TypeError)
+
+
+def parse_path(path: PathLike) -> Tuple[PathKey, ...]:
+    """
+    Parse a path into the sequence of keys it denotes.
+
+    Paths are dot-delimited, as generated by DotDelimitedPath, and may index sequences between brackets, e.g.
+    'a.b[3].c' or, equivalently, 'a.b.3.c'. Bare segments that are integers are parsed as indices; keys that would
+    otherwise be misparsed, such as '3' or 'a.b', may be quoted between brackets, e.g. "a['3']".
+
+    A sequence of keys is returned as is.
+
+    """
+    if isinstance(path, AbstractPath):
+        path = path.path
+    if not isinstance(path, str):
+        return tuple(path)
+    if not path:
+        return ()
+
+    keys = []  # type: List[PathKey]
+    position = 0
+    while position < len(path):
+        match = _SEGMENT_PATTERN.match(path, position)
+        if match is None:
+            raise ValueError(f'invalid path: {path!r}')
+
+        if match.group('name') is not None:
+            name = match.group('name')
+            keys.append(int(name) if _INTEGER_PATTERN.fullmatch(name) else name)
+        elif match.group('index') is not None:
+            keys.append(int(match.group('index')))
+        else:
+            keys.append(match.group('key'))
+
+        position = match.end()
+
+    return tuple(keys)
+
+
+def _compile(source: str, name: str, keys: Sequence[PathKey]) -> Callable:
+    namespace = {f'k{index}': key for index, key in enumerate(keys)}
+    exec(source, namespace)
+    return namespace[name]
+
+
+def _unwrap_records(records: Iterable[Any]) -> Iterable[Any]:
+    records = ObjectView.get_value(records)
+    if isinstance(records, Sequence) and not any(isinstance(record, ObjectView) for record in records):
+        return records
+
+    return [ObjectView.get_value(record) for record in records]
+
+
+def _lookup_expression(keys: Sequence[PathKey], offset: int = 0) -> str:
+    return 'data' + ''.join(f'[k{offset + index}]' for index in range(len(keys)))
+
+
+class CompiledPath:
+    """
+    Accessor for one path into raw data.
+
+    The getter and setter are compiled into a single expression over the raw data, so that no intermediate view is
+    built. Calling a CompiledPath gets the value at the path.
+
+    """
+
+    __slots__ = ('keys', '_get', '_set')
+
+    def __init__(self, path: PathLike):
+        keys = parse_path(path)
+        if not keys:
+            raise ValueError('path must have at least one key')
+
+        self.keys = keys
+        self._get = _compile(f'def get(data):\n    return {_lookup_expression(keys)}\n', 'get', keys)
+        self._set = _compile(f'def set(data, value):\n    {_lookup_expression(keys)} = value\n', 'set', keys)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.keys!r})'
+
+    def __call__(self, data: Any) -> Any:
+        return self._get(ObjectView.get_value(data))
+
+    def get(self, data: Any, default: Any = _MISSING) -> Any:
+        """Get the value at this path, or the provided default, if any, should the path not resolve."""
+        try:
+            return self._get(ObjectView.get_value(data))
+        except _LOOKUP_ERRORS:
+            if default is _MISSING:
+                raise
+            return default
+
+    def set(self, data: Any, value: Any):
+        """Set the value at this path; every key but the last must resolve."""
+        self._set(ObjectView.get_value(data), ObjectView.get_value(value))
+
+    def get_many(self, records: Iterable[Any], default: Any = _MISSING) -> List[Any]:
+        """Get the value at this path in each of the provided records."""
+        records = _unwrap_records(records)
+        if default is _MISSING:
+            get = self._get
+            return [get(record) for record in records]
+
+        return [self.get(record, default) for record in records]
+
+
+class CompiledPaths:
+    """
+    Accessor for several paths into raw data at once.
+
+    Calling a CompiledPaths returns the tuple of the values at each path; extract does so for many records in one call,
+    with the loop over the records compiled along with the lookups.
+
+    """
+
+    __slots__ = ('paths', '_get', '_extract')
+
+    def __init__(self, *paths: PathLike):
+        if not paths:
+            raise ValueError('at least one path is required')
+
+        self.paths = tuple(CompiledPath(path) for path in paths)
+
+        keys = []  # type: List[PathKey]
+        lookups = []
+        for path in self.paths:
+            lookups.append(_lookup_expression(path.keys, len(keys)))
+            keys.extend(path.keys)
+
+        row = f'({", ".join(lookups)},)'
+        self._get = _compile(f'def get(data):\n    return {row}\n', 'get', keys)
+        self._extract = _compile(f'def extract(records):\n    return [{row} for data in records]\n', 'extract', keys)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({", ".join(repr(path.keys) for path in self.paths)})'
+
+    def __call__(self, data: Any) -> Tuple:
+        return self._get(ObjectView.get_value(data))
+
+    def extract(self, records: Iterable[Any], default: Any = _MISSING) -> List[Tuple]:
+        """
+        Get the values at each path in each of the provided records.
+
+        Args:
+            records: The records, as raw data or views.
+            default: The value to use for the paths that do not resolve in a record.
+                (Defaults to none, i.e. raising the lookup error.)
+
+        Returns:
+            The tuple of the values at each path, for each record.
+
+        """
+        records = _unwrap_records(records)
+        if default is _MISSING:
+            return self._extract(records)
+
+        return [tuple(path.get(record, default) for path in self.paths) for record in records]
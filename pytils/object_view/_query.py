@@ -0,0 +1,285 @@
+import collections.abc
+import functools
+import heapq
+import operator
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+from ._base import ObjectView
+from ._paths import PathKey, PathLike, parse_path
+
+__all__ = [
+    'PathIndex',
+    'Query',
+]
+
+_ANY = '*'
+_DESCENDANTS = '**'
+
+Path = Tuple[PathKey, ...]
+
+
+class _Index:
+    """Placeholder for the indices of sequences in the shapes of paths."""
+
+    def __repr__(self) -> str:
+        return '[]'
+
+
+# The key of any index of a sequence in the shape of a path
+_INDEX = _Index()
+
+
+def _is_sequence(node: Any) -> bool:
+    return isinstance(node, collections.abc.Sequence) and not isinstance(node, (str, bytes, bytearray))
+
+
+def _children(node: Any) -> Iterable[Any]:
+    if type(node) is dict:
+        return node.values()
+    if type(node) is list or type(node) is tuple:
+        return node
+    if isinstance(node, collections.abc.Mapping):
+        return node.values()
+    if _is_sequence(node):
+        return node
+    return ()
+
+
+def _child_items(node: Any) -> Iterable[Tuple[PathKey, Any]]:
+    if isinstance(node, collections.abc.Mapping):
+        return node.items()
+    if _is_sequence(node):
+        return enumerate(node)
+    return ()
+
+
+def _descendants(node: Any) -> List[Any]:
+    """Get the provided node and all its descendants, in document order."""
+    nodes = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        nodes.append(node)
+        children = _children(node)
+        if children:
+            stack.extend(reversed(list(children)))
+    return nodes
+
+
+def _descendant_items(path: Path, node: Any) -> List[Tuple[Path, Any]]:
+    items = []
+    stack = [(path, node)]
+    while stack:
+        path, node = stack.pop()
+        items.append((path, node))
+        children = [(path + (key,), child) for key, child in _child_items(node)]
+        stack.extend(reversed(children))
+    return items
+
+
+def _lookup(nodes: List[Any], key: PathKey) -> List[Any]:
+    found = []
+    for node in nodes:
+        if type(node) is dict:
+            if key in node:
+                found.append(node[key])
+        elif isinstance(node, collections.abc.Mapping):
+            if key in node:
+                found.append(node[key])
+        elif isinstance(key, int) and _is_sequence(node) and -len(node) <= key < len(node):
+            found.append(node[key])
+    return found
+
+
+def _lookup_items(items: List[Tuple[Path, Any]], key: PathKey) -> List[Tuple[Path, Any]]:
+    found = []
+    for path, node in items:
+        if isinstance(node, collections.abc.Mapping):
+            if key in node:
+                found.append((path + (key,), node[key]))
+        elif isinstance(key, int) and _is_sequence(node) and -len(node) <= key < len(node):
+            found.append((path + (key % len(node),), node[key]))
+    return found
+
+
+def _matches(segments: Sequence[PathKey], keys: Sequence[Any]) -> bool:
+    """Get whether the provided segments of a query match the provided keys of a path, or of the shape of a path."""
+    if not segments:
+        return not keys
+
+    segment = segments[0]
+    if segment == _DESCENDANTS:
+        return any(_matches(segments[1:], keys[start:]) for start in range(len(keys) + 1))
+    if not keys:
+        return False
+
+    key = keys[0]
+    if segment == _ANY or (segment == key if key is not _INDEX else isinstance(segment, int)):
+        return _matches(segments[1:], keys[1:])
+    return False
+
+
+class PathIndex:
+    """
+    Index of the paths of all the nodes of a document, for repeated queries.
+
+    The nodes are indexed by the shape of their paths, i.e. their paths with the indices of sequences left out, so that
+    a query only matches its pattern against the distinct shapes of the document, which are few in documents of similar
+    records, rather than traversing it. The index is a snapshot of the document, which is not updated when the document
+    changes.
+
+    """
+
+    __slots__ = ('_shapes', '_selections')
+
+    def __init__(self, data: Any):
+        # The ordinals, paths and values of the nodes of each shape, in document order
+        shapes = {}  # type: Dict[Tuple[Any, ...], Tuple[List[int], List[Path], List[Any]]]
+        stack = [((), (), ObjectView.get_value(data))]
+        ordinal = 0
+        while stack:
+            shape, path, node = stack.pop()
+            nodes = shapes.get(shape)
+            if nodes is None:
+                nodes = shapes[shape] = ([], [], [])
+            nodes[0].append(ordinal)
+            nodes[1].append(path)
+            nodes[2].append(node)
+            ordinal += 1
+
+            if isinstance(node, collections.abc.Mapping):
+                stack.extend(reversed([(shape + (key,), path + (key,), child) for key, child in node.items()]))
+            elif _is_sequence(node):
+                shape += (_INDEX,)
+                stack.extend(reversed([(shape, path + (index,), child) for index, child in enumerate(node)]))
+
+        self._shapes = shapes
+        self._selections = {}  # type: Dict[Tuple[PathKey, ...], List[Tuple[Any, ...]]]
+
+    def __len__(self) -> int:
+        return sum(len(ordinals) for ordinals, _, _ in self._shapes.values())
+
+    def _select(self, segments: Tuple[PathKey, ...]) -> List[Tuple[List[int], List[Path], List[Any]]]:
+        shapes = self._selections.get(segments)
+        if shapes is None:
+            shapes = self._selections[segments] = [shape for shape in self._shapes if _matches(segments, shape)]
+        return [self._shapes[shape] for shape in shapes]
+
+    def items(self, segments: Tuple[PathKey, ...]) -> List[Tuple[Path, Any]]:
+        """Get the paths and values of the nodes matching the provided segments of a query, in document order."""
+        selected = self._select(segments)
+        if len(selected) == 1:
+            (_, paths, values), = selected
+            items = zip(paths, values)
+        else:
+            items = ((path, value) for _, path, value in heapq.merge(*(zip(*nodes) for nodes in selected)))
+
+        if any(isinstance(segment, int) for segment in segments):
+            # The shapes match any index
+            return [(path, value) for path, value in items if _matches(segments, path)]
+        return list(items)
+
+    def values(self, segments: Tuple[PathKey, ...]) -> List[Any]:
+        """Get the values of the nodes matching the provided segments of a query, in document order."""
+        if any(isinstance(segment, int) for segment in segments):
+            return [value for _, value in self.items(segments)]
+
+        selected = self._select(segments)
+        if len(selected) == 1:
+            return list(selected[0][2])
+        return [value for _, _, value in heapq.merge(*(zip(*nodes) for nodes in selected))]
+
+
+class Query:
+    """
+    Query for the values matching a pattern of paths in raw data, e.g. 'orders.*.lines.*.sku'.
+
+    A pattern is a path whose segments may also be wildcards: '*' matches any key of a mapping or index of a sequence,
+    and '**' matches any number of them, including none, so that e.g. '**.sku' matches all the values at a key 'sku'.
+    Negative indices match from the end of the sequences.
+
+    The raw data is traversed, level by level, rather than views of it; alternatively, a PathIndex of the data may be
+    queried instead, which is faster for queries repeated on the same document. Negative indices are not supported then.
+
+    The matches are in document order; when the data is traversed, however, the matches of the segments following a
+    recursive descent are ordered by the node that it matched, e.g. a nested match comes first if its ancestor's key
+    comes later.
+
+    """
+
+    __slots__ = ('segments',)
+
+    def __init__(self, pattern: PathLike):
+        segments = []  # type: List[PathKey]
+        for segment in parse_path(pattern):
+            # Consecutive recursive descents match the same paths as one
+            if segment != _DESCENDANTS or not segments or segments[-1] != _DESCENDANTS:
+                segments.append(segment)
+
+        if not segments:
+            raise ValueError('pattern must have at least one segment')
+        self.segments = tuple(segments)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.segments!r})'
+
+    def _check_index(self, index: PathIndex) -> PathIndex:
+        if any(isinstance(segment, int) and segment < 0 for segment in self.segments):
+            raise ValueError('negative indices are not supported by path indexes')
+        return index
+
+    def values(self, data: Union[Any, PathIndex]) -> List[Any]:
+        """Get the values matching this query in the provided data, view or index."""
+        if isinstance(data, PathIndex):
+            return self._check_index(data).values(self.segments)
+        if self.segments.count(_DESCENDANTS) > 1:
+            # The same node may be matched through several paths, which are deduplicated by items
+            return [value for _, value in self.items(data)]
+
+        nodes = [ObjectView.get_value(data)]
+        for segment in self.segments:
+            if segment == _ANY:
+                nodes = [child for node in nodes for child in _children(node)]
+            elif segment == _DESCENDANTS:
+                nodes = [descendant for node in nodes for descendant in _descendants(node)]
+            else:
+                nodes = _lookup(nodes, segment)
+        return nodes
+
+    def items(self, data: Union[Any, PathIndex]) -> List[Tuple[Path, Any]]:
+        """Get the paths and values matching this query in the provided data, view or index."""
+        if isinstance(data, PathIndex):
+            return self._check_index(data).items(self.segments)
+
+        items = [((), ObjectView.get_value(data))]  # type: List[Tuple[Path, Any]]
+        is_nested = False
+        for segment in self.segments:
+            if segment == _ANY:
+                items = [(path + (key,), child) for path, node in items for key, child in _child_items(node)]
+            elif segment == _DESCENDANTS:
+                items = [item for path, node in items for item in _descendant_items(path, node)]
+                if is_nested:
+                    # Matches of an earlier recursive descent may be nested in one another, so that the descendants of
+                    # the inner ones are found again through the outer ones
+                    paths = set()
+                    items = [item for item in items if item[0] not in paths and not paths.add(item[0])]
+                is_nested = True
+            else:
+                items = _lookup_items(items, segment)
+        return items
+
+    def paths(self, data: Union[Any, PathIndex]) -> List[Path]:
+        """Get the paths matching this query in the provided data, view or index."""
+        return [path for path, _ in self.items(data)]
+
+    def views(self, data: Union[Any, PathIndex]) -> List[Any]:
+        """
+        Get views of the values matching this query in the provided data, view or index.
+
+        The matches of a view are viewed as its descendants, through its own item access, so that e.g. the writes made
+        through them are logged by a TrackedObjectView.
+
+        """
+        if isinstance(data, ObjectView):
+            return [functools.reduce(operator.getitem, path, data) for path in self.paths(data)]
+        return [ObjectView._ov_wrap(value) for value in self.values(data)]
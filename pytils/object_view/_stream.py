@@ -0,0 +1,217 @@
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Iterator, Optional
+
+from ._json import _TEXT_SCANNER
+from ._paths import PathKey, PathLike, parse_path
+
+__all__ = [
+    'iter_json',
+    'iter_ndjson',
+]
+
+_DEFAULT_CHUNK_SIZE = 1 << 16
+# The number of characters of a skipped container that are scanned at once, doubled until it is closed
+_MIN_WINDOW_SIZE = 1 << 10
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_MEMBER = re.compile(r'("[^"\\]*(?:\\.[^"\\]*)*")[ \t\n\r]*:', re.DOTALL)
+# The characters that may follow a value, which a number cannot run past
+_DELIMITER = re.compile(r'[ \t\n\r,:\]}]')
+
+_COMMA = ','
+_OPEN_ARRAY = '['
+_OPEN_OBJECT = '{'
+_CLOSE_ARRAY = ']'
+_CLOSE_OBJECT = '}'
+
+_DECODER = json.JSONDecoder()
+
+
+class _JsonStream:
+    """
+    Reader of a JSON document from a binary file, value by value.
+
+    The file is decoded as it is read, and the text is buffered only until the values it holds are consumed, so that
+    the buffer is bounded by the largest value parsed, plus a read. Skipped containers are scanned rather than parsed,
+    and dropped from the buffer as they are scanned.
+
+    """
+
+    __slots__ = ('_file', '_decoder', '_chunk_size', '_text', '_position', '_eof')
+
+    def __init__(self, file: BinaryIO, chunk_size: int):
+        self._file = file
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self._chunk_size = chunk_size
+        self._text = ''
+        self._position = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """Read more of the file, at least as much as is buffered; get whether anything was read."""
+        if self._eof:
+            return False
+
+        chunk = self._file.read(max(self._chunk_size, len(self._text) - self._position))
+        if not chunk:
+            self._decoder.decode(b'', final=True)
+            self._eof = True
+            return False
+
+        self._text = self._text[self._position:] + self._decoder.decode(chunk)
+        self._position = 0
+        return True
+
+    def _fail(self, message: str):
+        raise ValueError(f'{message} at offset {self._position} of the buffered document')
+
+    def peek(self) -> Optional[str]:
+        """Skip whitespace; get the next character, or None at the end of the file."""
+        while True:
+            self._position = _WHITESPACE.match(self._text, self._position).end()
+            if self._position < len(self._text):
+                return self._text[self._position]
+            if not self._fill():
+                return None
+
+    def expect(self, character: str):
+        """Consume the provided character, after whitespace."""
+        if self.peek() != character:
+            self._fail(f'expected {character!r}')
+        self._position += 1
+
+    def next_item(self, closing: str) -> bool:
+        """Consume the comma or the provided closing bracket after an item; get whether another item follows."""
+        character = self.peek()
+        if character == _COMMA or character == closing:
+            self._position += 1
+            return character == _COMMA
+        self._fail(f'expected {closing!r} or {_COMMA!r}')
+
+    def is_empty(self, closing: str) -> bool:
+        """Consume the provided closing bracket if it directly follows an opening one; get whether it did."""
+        if self.peek() == closing:
+            self._position += 1
+            return True
+        return False
+
+    def read_key(self) -> str:
+        """Consume the key of an object member, along with its colon."""
+        self.peek()
+        while True:
+            match = _MEMBER.match(self._text, self._position)
+            if match is not None:
+                self._position = match.end()
+                return json.loads(match.group(1))
+            if not self._fill():
+                self._fail('invalid JSON object member')
+
+    def read_value(self) -> Any:
+        """Consume a value; get it parsed."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self._text, self._position)
+            except json.JSONDecodeError:
+                end = None
+            # A value may be cut short by the end of the buffer, e.g. a number, unless a delimiter follows it
+            if end is not None and (self._eof or _DELIMITER.search(self._text, end) is not None):
+                self._position = end
+                return value
+            if not self._fill() and end is None:
+                self._fail('invalid JSON value')
+
+    def skip_value(self):
+        """Consume a value, without parsing it if it is an array or object."""
+        first = self.peek()
+        if first != _OPEN_ARRAY and first != _OPEN_OBJECT:
+            self.read_value()
+            return
+
+        depth = 0
+        window_size = _MIN_WINDOW_SIZE
+        while True:
+            text = self._text
+            position = self._position
+            window_end = min(len(text), position + window_size)
+            ends, depths, _ = _TEXT_SCANNER.scan(
+                text, position, window_end, window_end < len(text) or not self._eof, depth
+            )
+            try:
+                closing = depths.index(0, 1)
+            except ValueError:
+                pass
+            else:
+                self._position = ends[closing]
+                return
+
+            # The scanned part is dropped from the buffer on the next read
+            depth = depths[-1]
+            self._position = ends[-1]
+            if window_end < len(text):
+                window_size *= 2
+            elif not self._fill():
+                self._fail('unterminated JSON container')
+
+
+def _find(stream: _JsonStream, key: PathKey):
+    """Consume the document up to the value at the provided key of the current container."""
+    if isinstance(key, int):
+        stream.expect(_OPEN_ARRAY)
+        if not stream.is_empty(_CLOSE_ARRAY):
+            for _ in range(key):
+                stream.skip_value()
+                if not stream.next_item(_CLOSE_ARRAY):
+                    break
+            else:
+                return
+        raise IndexError(key)
+
+    stream.expect(_OPEN_OBJECT)
+    if not stream.is_empty(_CLOSE_OBJECT):
+        while True:
+            if stream.read_key() == key:
+                return
+            stream.skip_value()
+            if not stream.next_item(_CLOSE_OBJECT):
+                break
+    raise KeyError(key)
+
+
+def iter_json(file: BinaryIO, path: Optional[PathLike] = None, chunk_size: int = _DEFAULT_CHUNK_SIZE) -> Iterator[Any]:
+    """
+    Iterate the items of an array of a JSON document read incrementally from a binary file, parsed one by one.
+
+    Only the text of the current item is held in memory, along with a read of the file, so that documents larger than
+    the memory may be iterated; the parts of the document before the array are skipped as they are read, and those after
+    it are not read. Negative indices in the path are not supported.
+
+    Args:
+        file: The binary file, which is read from its current position.
+        path: The path of the array in the document, e.g. 'results.items'.
+            (Defaults to None, i.e. the document is the array.)
+        chunk_size: The minimum number of bytes read at once.
+            (Defaults to 64 KiB.)
+
+    """
+    stream = _JsonStream(file, chunk_size)
+    for key in () if path is None else parse_path(path):
+        _find(stream, key)
+
+    stream.expect(_OPEN_ARRAY)
+    if stream.is_empty(_CLOSE_ARRAY):
+        return
+
+    while True:
+        yield stream.read_value()
+        if not stream.next_item(_CLOSE_ARRAY):
+            return
+
+
+def iter_ndjson(file: BinaryIO) -> Iterator[Any]:
+    """Iterate the values of a newline-delimited JSON file, read and parsed line by line; blank lines are skipped."""
+    for line in file:
+        if not line.isspace():
+            yield json.loads(line)
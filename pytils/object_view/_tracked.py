@@ -0,0 +1,276 @@
+import collections.abc
+import copy
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from ._base import ObjectView
+from ._paths import PathKey
+
+__all__ = [
+    'TrackedObjectView',
+]
+
+Path = Tuple[PathKey, ...]
+Change = Dict[str, Any]
+
+_ADD = 'add'
+_REMOVE = 'remove'
+_REPLACE = 'replace'
+
+
+def _is_container(data: Any) -> bool:
+    return isinstance(data, (collections.abc.Mapping, collections.abc.Sequence)) \
+        and not isinstance(data, (str, bytes, bytearray))
+
+
+def _pointer(path: Path) -> str:
+    """Format a path as a JSON Pointer, e.g. '/a/b/3'."""
+    return ''.join('/' + str(key).replace('~', '~0').replace('/', '~1') for key in path)
+
+
+class _ChangeLog:
+    """
+    Log of the writes to a document since its last checkpoint, as JSON Patch operations.
+
+    The writes that are not separated by the removal of an item of a list, which shifts the indices of the items beyond
+    it, are kept in a mapping by path, so that a write replaces the earlier writes at or below its path; the others are
+    kept in order.
+
+    """
+
+    __slots__ = ('_settled', '_pending')
+
+    def __init__(self):
+        self._settled = []  # type: List[Tuple[Path, Change]]
+        self._pending = {}  # type: Dict[Path, Change]
+
+    def record(self, op: str, path: Path, value: Any = None, container: bool = True):
+        """
+        Record a write of the provided value at the provided path.
+
+        Args:
+            op: The JSON Patch operation: 'add', 'replace' or 'remove'.
+            path: The path of the write.
+            value: The value written, which is copied.
+                (Defaults to None, i.e. for a removal.)
+            container: Whether the value overwritten may be a container, whose earlier writes are then discarded.
+                (Defaults to True.)
+
+        """
+        pending = self._pending
+        earlier = pending.pop(path, None)
+        if container:
+            for other in [other for other in pending if other[:len(path)] == path]:
+                del pending[other]
+
+        if earlier is not None:
+            if earlier['op'] == _ADD:
+                # The key did not exist at the checkpoint
+                if op == _REMOVE:
+                    return
+                op = _ADD
+            elif earlier['op'] == _REMOVE and op == _ADD:
+                # The key existed at the checkpoint, and is only missing since its removal
+                op = _REPLACE
+
+        change = {'op': op, 'path': _pointer(path)}
+        if op != _REMOVE:
+            change['value'] = copy.deepcopy(ObjectView.get_value(value))
+
+        if op == _REMOVE and isinstance(path[-1], int):
+            # Settle the pending writes, whose indices into the list are shifted by the removal
+            self._settled.extend(pending.items())
+            self._settled.append((path, change))
+            pending.clear()
+        else:
+            pending[path] = change
+
+    def changes(self) -> List[Change]:
+        return [change for _, change in self._settled] + list(self._pending.values())
+
+    def dirty_paths(self) -> Set[Path]:
+        return {path for path, _ in self._settled}.union(self._pending)
+
+    def clear(self):
+        self._settled = []
+        self._pending = {}
+
+
+class TrackedObjectView(ObjectView):
+    """
+    ObjectView that logs the writes through it and through its child views, so that only the delta is persisted.
+
+    The views of a document share a log of the writes made through them since the last checkpoint, as JSON Patch
+    operations whose values are copied when written. Later writes replace earlier ones at or below their path, unless
+    separated by the removal of an item of a list; assigning or deleting slices of a list is logged as a replacement of
+    the whole list. Writes made to the backing data directly, e.g. by appending to a list, are not logged, nor are those
+    made through views of parts that have since been removed from the document.
+
+    Use changes or checkpoint on any of the views to get the delta, and apply to replay it on a copy of the document.
+
+    """
+
+    def __init__(self, data: Any, log: Optional[_ChangeLog] = None, parent: Optional['TrackedObjectView'] = None,
+                 key: Optional[PathKey] = None):
+        super().__init__(data)
+        object.__setattr__(self, '_ov_log', _ChangeLog() if log is None else log)
+        object.__setattr__(self, '_ov_parent', parent)
+        object.__setattr__(self, '_ov_parent_key', key)
+
+    __slots__ = ('_ov_log', '_ov_parent', '_ov_parent_key')
+
+    @classmethod
+    def of(cls, data: Any) -> Any:
+        """Get a view of the provided data that logs the writes made through it, starting from an empty log."""
+        return cls(data) if _is_container(data) else data
+
+    def changes(self) -> List[Change]:
+        """Get the writes logged since the last checkpoint, as a JSON Patch relative to the whole document."""
+        return self._ov_log.changes()
+
+    def dirty_paths(self) -> Set[Path]:
+        """Get the paths written since the last checkpoint."""
+        return self._ov_log.dirty_paths()
+
+    def checkpoint(self) -> List[Change]:
+        """Get the writes logged since the last checkpoint, and clear the log."""
+        changes = self._ov_log.changes()
+        self._ov_log.clear()
+        return changes
+
+    @staticmethod
+    def apply(data: Any, changes: List[Change]) -> Any:
+        """Apply the provided changes, as logged by a TrackedObjectView, to a copy of its document; get the data."""
+        data = ObjectView.get_value(data)
+        for change in changes:
+            keys = [key.replace('~1', '/').replace('~0', '~') for key in change['path'].split('/')[1:]]
+            if not keys:
+                data = copy.deepcopy(change['value'])
+                continue
+
+            parent = data
+            for key in keys[:-1]:
+                parent = parent[int(key) if isinstance(parent, list) else key]
+
+            key = int(keys[-1]) if isinstance(parent, list) else keys[-1]
+            if change['op'] == _REMOVE:
+                del parent[key]
+            else:
+                parent[key] = copy.deepcopy(change['value'])
+
+        return data
+
+    def _ov_child(self, key: PathKey, data: Any) -> Any:
+        if not _is_container(data):
+            return data
+        return type(self)(data, self._ov_log, self, key)
+
+    def _ov_path(self) -> Optional[Path]:
+        """
+        Get the current path of this view in the document, or None if its data has been removed from the document.
+
+        The path is resolved when written to rather than when the view is created, as removing items from the lists
+        along it shifts their indices.
+
+        """
+        keys = []
+        view = self
+        while view._ov_parent is not None:
+            data = view._ov_parent._ov_backing_data
+            key = view._ov_parent_key
+            child = view._ov_backing_data
+            try:
+                found = data[key] is child
+            except (KeyError, IndexError, TypeError):
+                found = False
+
+            if not found:
+                if isinstance(data, collections.abc.Mapping):
+                    return None
+                key = next((index for index, item in enumerate(data) if item is child), None)
+                if key is None:
+                    return None
+                object.__setattr__(view, '_ov_parent_key', key)
+
+            keys.append(key)
+            view = view._ov_parent
+
+        return tuple(reversed(keys))
+
+    def _ov_normalize(self, key: Any) -> Any:
+        # Log list indices as non-negative
+        if isinstance(key, int) and key < 0 and not isinstance(self._ov_backing_data, collections.abc.Mapping):
+            return key + len(self._ov_backing_data)
+        return key
+
+    def _ov_set(self, key: Any, value: Any):
+        data = self._ov_backing_data
+        path = self._ov_path()
+        if isinstance(key, slice):
+            data[key] = value
+            if path is not None:
+                self._ov_log.record(_REPLACE, path, data)
+            return
+
+        key = self._ov_normalize(key)
+        exists = not isinstance(data, collections.abc.Mapping) or key in data
+        container = not exists or _is_container(data[key])
+        data[key] = value
+        if path is not None:
+            self._ov_log.record(_REPLACE if exists else _ADD, path + (key,), value, container)
+
+    def _ov_delete(self, key: Any):
+        data = self._ov_backing_data
+        path = self._ov_path()
+        if isinstance(key, slice):
+            del data[key]
+            if path is not None:
+                self._ov_log.record(_REPLACE, path, data)
+            return
+
+        key = self._ov_normalize(key)
+        del data[key]
+        if path is not None:
+            self._ov_log.record(_REMOVE, path + (key,))
+
+    def __getattr__(self, key: str):
+        return self._ov_child(key, self._ov_backing_data[key])
+
+    def __setattr__(self, key: str, value):
+        self._ov_set(key, value)
+
+    def __delattr__(self, key: str):
+        self._ov_delete(key)
+
+    def __getitem__(self, key):
+        data = self._ov_backing_data[key]
+        if isinstance(key, slice):
+            # A copy of the items, whose writes are not written to the document
+            return ObjectView.of(data)
+        return self._ov_child(self._ov_normalize(key), data)
+
+    def __setitem__(self, key, value):
+        self._ov_set(key, value)
+
+    def __delitem__(self, key):
+        self._ov_delete(key)
+
+    def __iter__(self) -> Iterator:
+        data = self._ov_backing_data
+        if isinstance(data, collections.abc.Mapping):
+            return iter(data)
+        return (self._ov_child(index, item) for index, item in enumerate(data))
+
+    def __reversed__(self) -> Iterator:
+        data = self._ov_backing_data
+        if isinstance(data, collections.abc.Mapping):
+            return reversed(data)
+        return (self._ov_child(index, data[index]) for index in reversed(range(len(data))))
+
+    def _values(self) -> Iterator:
+        return (self._ov_child(key, value) for key, value in self._ov_backing_data.items())
+
+    def _items(self) -> Iterator:
+        return (
+            (key, self._ov_child(key, value))
+            for key, value in self._ov_backing_data.items()
+        )
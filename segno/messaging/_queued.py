@@ -14,6 +14,13 @@ _DEFAULT_MAX_QUEUE_SIZE = 4096
 
 
 class QueuedSender(DaemonHandler, IOSender):
+    """
+    Sender that queues messages to be sent by daemon threads.
+
+    The messages are sent one at a time, so a managed pool of one thread suffices; stop sends the queued messages before
+    stopping it.
+
+    """
 
     def __init__(self, dst: BinaryIO, max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE):
         super().__init__(dst)
@@ -28,16 +35,27 @@ class QueuedSender(DaemonHandler, IOSender):
             self._queue.append(msg)
             self._cv.notify()
 
+        self.rescale_pool()
+
     def is_active(self) -> bool:
         return not self.is_closed
 
+    def load(self) -> float:
+        return len(self._queue)
+
+    def wakeup(self):
+        with self._cv:
+            self._cv.notify_all()
+
     def handle_one(self):
         with self._cv:
-            self._cv.wait_for(lambda: self.is_closed or self._queue)
+            self._cv.wait_for(lambda: self.is_closed or self._queue or self.should_yield())
             self._cv.notify()
 
-            if self._queue:
-                super().send(self._queue.popleft())
+            if not self._queue:
+                return False
+
+            super().send(self._queue.popleft())
 
     def close(self):
         self.is_closed = True
@@ -46,6 +64,14 @@ class QueuedSender(DaemonHandler, IOSender):
 
 
 class QueuedReceiver(DaemonHandler, IOReceiver):
+    """
+    Receiver that queues the messages received by daemon threads.
+
+    Messages are read from a single stream, so the receiver must be run by a single thread, e.g. a managed pool of one
+    thread. Stopping the pool closes the receiver once the message being read, if any, is queued; as reads cannot be
+    interrupted, stop only returns in time if the stream is closed or keeps delivering.
+
+    """
 
     def __init__(self, src: BinaryIO, max_queue_size: int = _DEFAULT_MAX_QUEUE_SIZE):
         super().__init__(src)
@@ -64,6 +90,14 @@ class QueuedReceiver(DaemonHandler, IOReceiver):
     def is_active(self) -> bool:
         return not self.is_closed
 
+    def stop(self, timeout: Optional[float] = None) -> bool:
+        is_stopped = super().stop(timeout)
+        with self._cv:
+            self.is_closed = True
+            self._cv.notify_all()
+
+        return is_stopped
+
     def handle_one(self):
         msg = super().receive()
         with self._cv:
@@ -0,0 +1,25 @@
+"""Fixtures shared by the tests of pytils.clock."""
+
+from typing import Any, List
+
+import pytest
+
+
+class ManualTime:
+    """Time supplier that only advances when told to."""
+
+    def __init__(self, now: float = 0.):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def manual_time() -> ManualTime:
+    return ManualTime()
+
+
+@pytest.fixture
+def dispatched() -> List[Any]:
+    return []
@@ -0,0 +1,99 @@
+"""Test pytils.clock.AsyncSchedule on an asyncio event loop."""
+
+import asyncio
+
+from pytils.clock import AsyncClock, AsyncSchedule
+
+_PERIOD = 0.01
+
+
+def test_one_shot_and_periodic_actions():
+    """Test that one-shot actions fire once and periodic actions are readmitted until cancelled."""
+    runs = []
+
+    async def scenario():
+        schedule = AsyncClock().schedule
+        schedule.register(lambda: runs.append('once'), None, _PERIOD)
+        key = schedule.register(lambda: runs.append('periodic'), _PERIOD)
+
+        await asyncio.sleep(_PERIOD * 5.5)
+        assert schedule.cancel(key)
+        assert schedule.live_count == 0
+
+        count = runs.count('periodic')
+        await asyncio.sleep(_PERIOD * 3)
+        assert runs.count('periodic') == count
+
+    asyncio.run(scenario())
+
+    assert runs.count('once') == 1
+    assert 3 <= runs.count('periodic') <= 7
+
+
+def test_coroutine_actions_are_readmitted_after_completion():
+    """Test that a periodic coroutine action never overlaps with its previous run."""
+    active = []
+    overlaps = []
+
+    async def action():
+        if active:
+            overlaps.append(True)
+        active.append(True)
+        await asyncio.sleep(_PERIOD * 2)
+        active.pop()
+
+    async def scenario():
+        schedule = AsyncSchedule()
+        schedule.register(action, _PERIOD)
+
+        await asyncio.sleep(_PERIOD * 10)
+        schedule.close()
+
+    asyncio.run(scenario())
+    assert not overlaps
+
+
+def test_failing_actions_are_readmitted():
+    """Test that periodic actions and coroutine actions that raise keep running."""
+    runs = []
+
+    def action():
+        runs.append('action')
+        raise ValueError('action fails')
+
+    async def coroutine_action():
+        runs.append('coroutine')
+        raise ValueError('coroutine fails')
+
+    async def scenario():
+        schedule = AsyncSchedule()
+        schedule.register(action, _PERIOD)
+        schedule.register(coroutine_action, _PERIOD)
+
+        await asyncio.sleep(_PERIOD * 5.5)
+        schedule.close()
+
+    asyncio.run(scenario())
+    assert runs.count('action') >= 3
+    assert runs.count('coroutine') >= 3
+
+
+def test_time_supplier_and_reschedule():
+    """Test that delays are measured with the injected time supplier and that rescheduling replaces the period."""
+    runs = []
+    now = [100.]
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        schedule = AsyncSchedule(lambda: now[0], loop)
+
+        key = schedule.register(lambda: runs.append(loop.time()), 60.)
+        await asyncio.sleep(_PERIOD)
+        assert len(runs) == 1
+
+        schedule.reschedule(key, None, 0.)
+        await asyncio.sleep(_PERIOD)
+        assert len(runs) == 2
+        assert schedule.live_count == 0
+
+    asyncio.run(scenario())
@@ -0,0 +1,73 @@
+"""Test the overflow policies of pytils.clock.SchedulingQueue."""
+
+import time
+from threading import Thread
+
+import pytest
+
+from pytils.clock import OverflowPolicy, SchedulingQueue
+
+
+def fill_past_capacity(manual_time, policy: OverflowPolicy):
+    """Dispatch three periodic keys to a queue with room for two of them."""
+    scheduling_queue = SchedulingQueue(2, manual_time, overflow_policy=policy)
+    schedule = scheduling_queue.schedule
+
+    keys = [schedule.register(f'action_{i}', 10.) for i in range(3)]
+    for _ in keys:
+        schedule.handle_one()
+
+    return scheduling_queue, keys
+
+
+@pytest.mark.parametrize('policy, skipped_index', [
+    (OverflowPolicy.DROP_OLDEST, 0),
+    (OverflowPolicy.DROP_NEWEST, 2),
+])
+def test_drop_policies_keep_keys_alive(manual_time, policy, skipped_index):
+    """Test that the dropped run is counted and that its periodic key is readmitted."""
+    scheduling_queue, keys = fill_past_capacity(manual_time, policy)
+
+    assert scheduling_queue.stats == (2, 1, 0, 0.)
+    assert scheduling_queue.schedule.live_count == 1
+    assert [key.stats.missed for key in keys] == [int(i == skipped_index) for i in range(3)]
+
+    queued_keys = {run.key for lane in scheduling_queue._lanes for _, run in lane}
+    assert queued_keys == set(keys) - {keys[skipped_index]}
+
+
+def test_reject_policy(manual_time, caplog):
+    """Test that the rejected run is counted and reported, and that its periodic key is readmitted."""
+    scheduling_queue, keys = fill_past_capacity(manual_time, OverflowPolicy.REJECT)
+
+    assert scheduling_queue.stats == (2, 0, 1, 0.)
+    assert scheduling_queue.schedule.live_count == 1
+    assert keys[2].stats.missed == 1
+    assert 'QueueFullError' in caplog.text
+
+
+def test_block_policy(manual_time):
+    """Test that the dispatching Schedule blocks until there is room in the queue."""
+    scheduling_queue = SchedulingQueue(1, manual_time, overflow_policy=OverflowPolicy.BLOCK)
+    schedule = scheduling_queue.schedule
+
+    ran = []
+    for i in range(2):
+        schedule.register(lambda i=i: ran.append(i), None)
+    schedule.handle_one()
+
+    dispatcher = Thread(target=schedule.handle_one, daemon=True)
+    dispatcher.start()
+    time.sleep(0.05)
+    assert dispatcher.is_alive()
+
+    scheduling_queue.handle_one()
+    dispatcher.join(5.)
+    assert not dispatcher.is_alive()
+
+    scheduling_queue.handle_one()
+    assert ran == [0, 1]
+
+    stats = scheduling_queue.stats
+    assert (stats.depth, stats.dropped, stats.rejected) == (0, 0, 0)
+    assert stats.blocked_time >= 0.04
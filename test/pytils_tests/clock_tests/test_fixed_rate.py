@@ -0,0 +1,79 @@
+"""Test fixed-rate scheduling and catch-up policies on pytils.clock.Schedule."""
+
+from typing import List
+
+import pytest
+
+from pytils.clock import CatchUpPolicy, FixedRate, Schedule
+
+
+@pytest.fixture
+def schedule(manual_time) -> Schedule:
+    """Schedule whose dispatched runs are performed inline."""
+    return Schedule(lambda run: run(), manual_time)
+
+
+def dispatch_at(manual_time, schedule: Schedule, *times: float):
+    """Dispatch every due run at each of the provided times."""
+    for now in times:
+        manual_time.now = max(manual_time.now, now)
+        while schedule.has_expired():
+            schedule.handle_one()
+
+
+def test_fixed_rate_keeps_phase(manual_time, schedule):
+    """Test that a late dispatch shifts the following runs of a default key, but not those of a fixed-rate key."""
+    default_starts = []
+    fixed_rate_starts = []
+
+    def record_start(starts: List[float]):
+        return lambda: starts.append(manual_time.now)
+
+    default_key = schedule.register(record_start(default_starts), 1.)
+    fixed_rate_key = schedule.register(record_start(fixed_rate_starts), 1., fixed_rate=FixedRate())
+
+    dispatch_at(manual_time, schedule, 0., 1.25, 2.25, 3.25, 4.)
+    assert default_starts == [0., 1.25, 2.25, 3.25]
+    assert fixed_rate_starts == [0., 1.25, 2.25, 3.25, 4.]
+
+    assert default_key.stats.runs == 4
+    assert default_key.stats.max_drift == pytest.approx(0.25)
+    assert default_key.stats.total_drift == pytest.approx(0.25)
+
+    stats = fixed_rate_key.stats
+    assert stats.runs == 5
+    assert (stats.missed, stats.overruns) == (0, 0)
+    assert stats.max_drift == pytest.approx(0.25)
+    assert stats.last_drift == pytest.approx(0.)
+    assert stats.mean_drift == pytest.approx(0.75 / 5)
+
+
+@pytest.mark.parametrize('fixed_rate, expected_starts, expected_missed', [
+    (FixedRate(CatchUpPolicy.SKIP), [0., 3., 4.], 2),
+    (FixedRate(CatchUpPolicy.COALESCE), [0., 2.5, 3., 4.], 1),
+    (FixedRate(CatchUpPolicy.BURST), [0., 2.5, 2.5, 3., 4.], 0),
+    (FixedRate(CatchUpPolicy.BURST, max_burst=1), [0., 2.5, 3., 4.], 1),
+])
+def test_catch_up_policies(manual_time, schedule, fixed_rate, expected_starts, expected_missed):
+    """Test the handling of the runs missed while a fixed-rate key overran its slots."""
+    starts = []
+    durations = iter([2.5])
+
+    def action():
+        starts.append(manual_time.now)
+        manual_time.now += next(durations, 0.)
+
+    key = schedule.register(action, 1., fixed_rate=fixed_rate)
+    dispatch_at(manual_time, schedule, 0., 3., 4.)
+
+    assert starts == expected_starts
+    assert key.stats.missed == expected_missed
+    assert key.stats.overruns == 1
+
+
+def test_fixed_rate_validation(schedule):
+    """Test that fixed-rate keys must be periodic and must allow at least one burst run."""
+    with pytest.raises(ValueError):
+        schedule.register(print, None, fixed_rate=FixedRate())
+    with pytest.raises(ValueError):
+        schedule.register(print, 1., fixed_rate=FixedRate(CatchUpPolicy.BURST, 0))
@@ -0,0 +1,93 @@
+"""Test the priority lanes of pytils.clock.SchedulingQueue."""
+
+from typing import List, Sequence, Tuple
+
+import pytest
+
+from pytils.clock import LanePolicy, OverflowPolicy, SchedulingQueue
+
+
+def enqueue(scheduling_queue: SchedulingQueue, jobs: Sequence[Tuple[str, int]]) -> List[str]:
+    """Register one-shot jobs of the provided names and priorities, dispatch them and return the list they run into."""
+    ran = []
+    schedule = scheduling_queue.schedule
+    for name, priority in jobs:
+        schedule.register(lambda name=name: ran.append(name), None, priority=priority)
+    for _ in jobs:
+        schedule.handle_one()
+
+    return ran
+
+
+def drain(scheduling_queue: SchedulingQueue, count: int):
+    for _ in range(count):
+        scheduling_queue.handle_one()
+
+
+def test_strict_policy():
+    """Test that the most urgent lane is always served first."""
+    scheduling_queue = SchedulingQueue(lanes=3)
+    ran = enqueue(scheduling_queue, [('low', 2), ('mid', 1), ('high', 0), ('capped', 7)])
+
+    drain(scheduling_queue, 4)
+    assert ran == ['high', 'mid', 'low', 'capped']
+
+
+def test_weighted_policy():
+    """Test that the lanes are served in proportion to their weights."""
+    scheduling_queue = SchedulingQueue(lanes=2, lane_policy=LanePolicy.WEIGHTED, lane_weights=[2, 1])
+    ran = enqueue(scheduling_queue, [('low', 1)] * 6 + [('high', 0)] * 6)
+
+    drain(scheduling_queue, 6)
+    assert ran == ['high', 'low', 'high', 'high', 'low', 'high']
+
+
+def test_starvation_protection():
+    """Test that an action that has waited beyond max_lane_wait is served ahead of more urgent lanes."""
+    scheduling_queue = SchedulingQueue(lanes=2, max_lane_wait=0.)
+    ran = enqueue(scheduling_queue, [('low', 1), ('high', 0)])
+
+    drain(scheduling_queue, 2)
+    assert ran == ['low', 'high']
+    assert [stats.promoted for stats in scheduling_queue.lane_stats] == [0, 1]
+
+
+def test_lane_stats():
+    scheduling_queue = SchedulingQueue(lanes=2)
+    enqueue(scheduling_queue, [('high', 0), ('low', 1), ('low', 1)])
+
+    high, low = scheduling_queue.lane_stats
+    assert (high.depth, low.depth) == (1, 2)
+
+    drain(scheduling_queue, 2)
+    high, low = scheduling_queue.lane_stats
+    assert (high.depth, high.dequeued) == (0, 1)
+    assert (low.depth, low.dequeued) == (1, 1)
+    assert 0. <= low.mean_wait <= low.max_wait
+    assert scheduling_queue.stats.depth == 1
+
+
+def test_drop_oldest_spares_urgent_lanes():
+    """Test that overflow drops the oldest action of the least urgent lane, possibly the arriving one."""
+    scheduling_queue = SchedulingQueue(2, lanes=3, overflow_policy=OverflowPolicy.DROP_OLDEST)
+    ran = enqueue(scheduling_queue, [('mid', 1), ('high', 0), ('urgent', 0), ('low', 2)])
+
+    drain(scheduling_queue, 2)
+    assert ran == ['high', 'urgent']
+    assert scheduling_queue.stats.dropped == 2
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'lanes': 0},
+    {'lanes': 2, 'lane_weights': [1]},
+    {'lanes': 2, 'lane_weights': [1, 0]},
+    {'max_lane_wait': -1.},
+])
+def test_invalid_lanes(kwargs):
+    with pytest.raises(ValueError):
+        SchedulingQueue(**kwargs)
+
+
+def test_negative_priority():
+    with pytest.raises(ValueError):
+        SchedulingQueue().schedule.register(lambda: None, None, priority=-1)
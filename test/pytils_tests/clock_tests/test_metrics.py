@@ -0,0 +1,83 @@
+"""Test the opt-in instrumentation of pytils.clock through SchedulerMetrics."""
+
+import pytest
+
+from pytils.clock import Histogram, SchedulerMetrics, SchedulingQueue
+
+
+def test_histogram():
+    """Test bucketing, summary values and quantile estimates."""
+    histogram = Histogram((1., 2., 4.))
+    for value in (0.5, 1., 1.5, 3., 3., 10.):
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.counts == (2, 1, 2, 1)
+    assert (snapshot.count, snapshot.total, snapshot.max) == (6, 19., 10.)
+    assert snapshot.mean == pytest.approx(19. / 6)
+
+    assert snapshot.quantile(0.) == 1.
+    assert snapshot.quantile(0.5) == 2.
+    assert snapshot.quantile(0.8) == 4.
+    assert snapshot.quantile(1.) == 10.
+
+    with pytest.raises(ValueError):
+        Histogram((2., 1.))
+
+
+def test_scheduler_metrics(manual_time):
+    """Test that dispatch lag, queue wait, run durations and sizes are recorded."""
+    metrics = SchedulerMetrics(size_bounds=(1, 2, 4))
+    scheduling_queue = SchedulingQueue(s_time=manual_time, metrics=metrics)
+    schedule = scheduling_queue.schedule
+    assert schedule.metrics is metrics
+
+    periodic_key = schedule.register(lambda: None, 1.)
+    one_shot_key = schedule.register(lambda: None, None, 0.5)
+
+    manual_time.now = 0.75
+    schedule.handle_one()
+    schedule.handle_one()
+    scheduling_queue.handle_one()
+    scheduling_queue.handle_one()
+
+    snapshot = metrics.snapshot()
+    assert snapshot.dispatch_lag.count == 2
+    assert snapshot.dispatch_lag.total == pytest.approx(1.)
+    assert snapshot.timer_count.counts[0] == 2
+    assert snapshot.queue_depth.counts[:2] == (1, 1)
+    assert snapshot.queue_wait.count == 2
+    assert snapshot.action_duration.count == 2
+    assert set(snapshot.key_durations) == {periodic_key}
+    assert one_shot_key not in snapshot.key_durations
+
+    schedule.cancel(periodic_key)
+    assert metrics.snapshot().key_durations == {}
+
+
+def test_key_durations_are_not_kept_for_one_shot_keys(manual_time):
+    """Test that completed one-shot keys, including periodic keys rescheduled as one-shot, leave no histograms."""
+    metrics = SchedulerMetrics()
+    scheduling_queue = SchedulingQueue(s_time=manual_time, metrics=metrics)
+    schedule = scheduling_queue.schedule
+
+    for _ in range(100):
+        schedule.register(lambda: None, None)
+    key = schedule.register(lambda: None, 1.)
+    for _ in range(101):
+        schedule.handle_one()
+        scheduling_queue.handle_one()
+
+    assert metrics.snapshot().action_duration.count == 101
+    assert set(metrics.snapshot().key_durations) == {key}
+
+    schedule.reschedule(key, None, 0.)
+    schedule.handle_one()
+    scheduling_queue.handle_one()
+    assert metrics.snapshot().action_duration.count == 102
+    assert metrics.snapshot().key_durations == {}
+
+
+def test_metrics_are_disabled_by_default():
+    """Test that no metrics are recorded unless requested."""
+    assert SchedulingQueue().schedule.metrics is None
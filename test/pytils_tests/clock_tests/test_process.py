@@ -0,0 +1,99 @@
+"""Test running scheduled actions in worker processes through pytils.clock.ProcessPoolHandler."""
+
+import os
+import time
+from queue import Queue
+
+import pytest
+
+from pytils.clock import ProcessPoolHandler, Schedule, wrap_action
+
+_TIMEOUT = 10.
+
+
+def get_pid() -> int:
+    return os.getpid()
+
+
+def sleep_and_get_pid(duration: float) -> int:
+    time.sleep(duration)
+    return os.getpid()
+
+
+def fail():
+    raise ValueError('failure in worker process')
+
+
+@pytest.fixture
+def outcomes() -> Queue:
+    return Queue()
+
+
+@pytest.fixture
+def handler(outcomes):
+    handler = ProcessPoolHandler(
+        2,
+        on_result=lambda key, result: outcomes.put(('result', key, result)),
+        on_error=lambda key, exception: outcomes.put(('error', key, exception)),
+    )
+
+    yield handler
+
+    handler.shutdown()
+
+
+def test_results_and_errors(manual_time, handler, outcomes):
+    """Test that results and exceptions are delivered to the scheduling process."""
+    schedule = Schedule(handler, manual_time)
+    result_key = schedule.register(get_pid, None)
+    error_key = schedule.register(fail, None)
+
+    schedule.handle_one()
+    schedule.handle_one()
+
+    received = {}
+    for _ in range(2):
+        kind, key, value = outcomes.get(timeout=_TIMEOUT)
+        received[key] = (kind, value)
+
+    assert received[result_key][0] == 'result'
+    assert received[result_key][1] != os.getpid()
+
+    assert received[error_key][0] == 'error'
+    assert isinstance(received[error_key][1], ValueError)
+
+
+def test_periodic_readmission_without_overlap(manual_time, handler, outcomes):
+    """Test that a periodic key is readmitted by the parent and that overlapping runs are deferred."""
+    schedule = Schedule(handler, manual_time)
+    key = schedule.register(wrap_action(sleep_and_get_pid, 0.2), 1.)
+
+    schedule.handle_one()
+    assert handler.in_flight_count == 1
+    assert schedule.live_count == 0
+
+    schedule.reschedule(key, 1., 0.)
+    schedule.handle_one()
+    assert handler.in_flight_count == 1
+
+    assert outcomes.get(timeout=_TIMEOUT)[0] == 'result'
+    assert outcomes.get(timeout=_TIMEOUT)[0] == 'result'
+
+    deadline = time.monotonic() + _TIMEOUT
+    while schedule.live_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert schedule.live_count == 1
+
+
+def test_periodic_readmission_after_failure(manual_time, handler, outcomes):
+    """Test that a periodic key whose action raises in the worker process is readmitted."""
+    schedule = Schedule(handler, manual_time)
+    schedule.register(fail, 1.)
+
+    schedule.handle_one()
+    assert outcomes.get(timeout=_TIMEOUT)[0] == 'error'
+
+    deadline = time.monotonic() + _TIMEOUT
+    while schedule.live_count == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert schedule.live_count == 1
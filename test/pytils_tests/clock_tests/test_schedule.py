@@ -0,0 +1,161 @@
+"""Test the registration, cancellation and rescheduling of keys on pytils.clock.Schedule."""
+
+from typing import Any, List
+
+import pytest
+
+from pytils.clock import Schedule
+
+
+@pytest.fixture
+def schedule(manual_time, dispatched) -> Schedule:
+    return Schedule(dispatched.append, manual_time)
+
+
+def run_dispatched(dispatched: List[Any]):
+    """Run and clear every dispatched action."""
+    actions = list(dispatched)
+    dispatched.clear()
+    for action in actions:
+        action()
+
+
+def test_register_validation(schedule):
+    """Test that invalid periods and delays are rejected."""
+    with pytest.raises(ValueError):
+        schedule.register(print, 0.)
+    with pytest.raises(ValueError):
+        schedule.register(print, None, -1.)
+
+
+def test_cancel_before_dispatch(manual_time, schedule, dispatched):
+    """Test that a cancelled key is skipped at dispatch."""
+    key_a = schedule.register('a', None, 1.)
+    key_b = schedule.register('b', None, 2.)
+    assert schedule.live_count == 2
+
+    assert schedule.cancel(key_a)
+    assert not schedule.cancel(key_a)
+    assert key_a.is_cancelled
+    assert (schedule.live_count, schedule.dead_count) == (1, 1)
+
+    manual_time.now = 2.
+    schedule.handle_one()
+    assert [run.key.action for run in dispatched] == ['b']
+    assert (schedule.live_count, schedule.dead_count) == (0, 0)
+    assert not key_b.is_cancelled
+
+
+def test_cancel_periodic_key_while_running(manual_time, schedule, dispatched):
+    """Test that a periodic key cancelled during a run is not readmitted."""
+    runs = []
+    key = schedule.register(lambda: runs.append(manual_time.now), 1.)
+
+    schedule.handle_one()
+    run_dispatched(dispatched)
+    assert schedule.live_count == 1
+
+    manual_time.now = 1.
+    schedule.handle_one()
+    schedule.cancel(key)
+    run_dispatched(dispatched)
+
+    assert runs == [0., 1.]
+    assert (schedule.live_count, schedule.dead_count) == (0, 0)
+
+
+def test_periodic_key_is_readmitted_after_failure(manual_time, schedule, dispatched):
+    """Test that a periodic key whose action raises keeps running."""
+    runs = []
+
+    def action():
+        runs.append(manual_time.now)
+        if len(runs) == 1:
+            raise ValueError('first run fails')
+
+    schedule.register(action, 1.)
+    schedule.handle_one()
+    with pytest.raises(ValueError):
+        run_dispatched(dispatched)
+    assert schedule.live_count == 1
+
+    manual_time.now = 1.
+    schedule.handle_one()
+    run_dispatched(dispatched)
+
+    assert runs == [0., 1.]
+    assert schedule.live_count == 1
+
+
+def test_failing_batch_handler_skips_runs(manual_time, caplog):
+    """Test that the runs of a batch that the batch handler raised for are skipped, so that periodic keys survive."""
+    batches = []
+
+    def batch_handler(actions):
+        batches.append(actions)
+        if len(batches) == 1:
+            raise RuntimeError('batch refused')
+
+    schedule = Schedule(print, manual_time, batch_handler=batch_handler)
+    key = schedule.register('periodic', 1.)
+
+    schedule.handle_one()
+    assert 'batch refused' in caplog.text
+    assert key.stats.missed == 1
+    assert schedule.live_count == 1
+
+    manual_time.now = 1.
+    schedule.handle_one()
+    assert [run.key for run in batches[1]] == [key]
+
+
+def test_reschedule(manual_time, schedule, dispatched):
+    """Test that rescheduling discards the pending run and replaces the period."""
+    runs = []
+    key = schedule.register(lambda: runs.append(manual_time.now), 10.)
+    schedule.handle_one()
+    run_dispatched(dispatched)
+
+    assert schedule.reschedule(key, 2., 1.) is key
+    assert key.period == 2.
+    assert (schedule.live_count, schedule.dead_count) == (1, 1)
+
+    for now in (1., 3., 5.):
+        manual_time.now = now
+        schedule.handle_one()
+        run_dispatched(dispatched)
+
+    assert runs == [0., 1., 3., 5.]
+
+    schedule.cancel(key)
+    with pytest.raises(ValueError):
+        schedule.reschedule(key, 1.)
+
+
+def test_compaction(schedule):
+    """Test that dead entries are removed once they make up more than half of the pending entries."""
+    keys = [schedule.register('action', None, 1.) for _ in range(100)]
+
+    for key in keys[:50]:
+        schedule.cancel(key)
+    assert (schedule.live_count, schedule.dead_count) == (50, 50)
+
+    schedule.cancel(keys[50])
+    assert (schedule.live_count, schedule.dead_count) == (49, 0)
+
+
+def test_register_many(manual_time, schedule, dispatched):
+    """Test that bulk registration returns the keys in order and dispatches them like individual registrations."""
+    keys = schedule.register_many([('c', None, 3.), ('a', None, 1.), ('b', 1., None)])
+    assert [key.action for key in keys] == ['c', 'a', 'b']
+    assert [key.period for key in keys] == [None, None, 1.]
+    assert schedule.live_count == 3
+
+    manual_time.now = 3.
+    for _ in range(3):
+        schedule.handle_one()
+    assert [run.key.action for run in dispatched] == ['b', 'a', 'c']
+
+    with pytest.raises(ValueError):
+        schedule.register_many([('d', None, None), ('e', -1., None)])
+    assert schedule.live_count == 0
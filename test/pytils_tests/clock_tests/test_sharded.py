@@ -0,0 +1,76 @@
+"""Test the distribution of keys across the shards of pytils.clock.ShardedSchedule."""
+
+import threading
+
+import pytest
+
+from pytils.clock import SchedulingQueue, ShardedSchedule, TimingWheelTimerStore
+
+
+def test_keys_spread_across_shards(manual_time, dispatched):
+    """Test that keys are spread across every shard and that each key stays with its shard."""
+    schedule = ShardedSchedule(dispatched.append, manual_time, shards=4)
+    keys = [schedule.register(i, None, 1.) for i in range(400)]
+
+    sizes = [shard.live_count for shard in schedule.shards]
+    assert sum(sizes) == schedule.live_count == 400
+    assert min(sizes) > 50
+
+    for key in keys:
+        assert schedule.shard_of(key) is schedule.shard_of(key)
+
+
+def test_cancel_and_reschedule(manual_time, dispatched):
+    schedule = ShardedSchedule(dispatched.append, manual_time, shards=3)
+    keys = schedule.register_many((name, None, 1.) for name in 'abcdef')
+
+    assert schedule.cancel(keys[0])
+    assert not schedule.cancel(keys[0])
+    assert schedule.reschedule(keys[1], None, 2.) is keys[1]
+    assert (schedule.live_count, schedule.dead_count) == (5, 2)
+
+    manual_time.now = 1.
+    assert schedule.next_run() == 1.
+    while schedule.poll():
+        pass
+    assert sorted(run.key.action for run in dispatched) == ['c', 'd', 'e', 'f']
+
+    manual_time.now = 2.
+    assert schedule.poll() == 1
+    assert schedule.dispatch_stats.dispatched == 5
+    assert schedule.next_run() is None
+
+
+def test_timer_factory(manual_time, dispatched):
+    schedule = ShardedSchedule(dispatched.append, manual_time, shards=2, timers=TimingWheelTimerStore)
+    schedule.register('a', None, 1.)
+
+    manual_time.now = 1.
+    assert schedule.poll() == 1
+
+
+def test_concurrent_producers():
+    """Test that producers registering from many threads are dispatched by the shard dispatchers."""
+    done = threading.Semaphore(0)
+    scheduling_queue = SchedulingQueue(workers=2, shards=4)
+    scheduling_queue.schedule.start()
+
+    def produce():
+        for _ in range(50):
+            scheduling_queue.schedule.register(done.release, None)
+
+    producers = [threading.Thread(target=produce) for _ in range(4)]
+    for producer in producers:
+        producer.start()
+    for producer in producers:
+        producer.join()
+
+    for _ in range(200):
+        assert done.acquire(timeout=5.)
+
+
+def test_invalid_shards():
+    with pytest.raises(ValueError):
+        ShardedSchedule(None, shards=0)
+    with pytest.raises(ValueError):
+        SchedulingQueue(shards=2, timers=TimingWheelTimerStore())
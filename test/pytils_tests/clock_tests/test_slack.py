@@ -0,0 +1,95 @@
+"""Test the coalescing of timers within slack windows on pytils.clock.Schedule."""
+
+import pytest
+
+from pytils.clock import DispatchStats, Schedule, TimingWheelTimerStore
+
+
+def test_aligned_windows_share_dispatch(manual_time, dispatched):
+    """Test that keys with overlapping slack windows are rounded to the same due time and dispatched together."""
+    schedule = Schedule(dispatched.append, manual_time)
+    schedule.register('a', None, 1.1, slack=0.5)
+    schedule.register('b', None, 1.3, slack=0.5)
+
+    manual_time.now = 1.4
+    assert not schedule.has_expired()
+
+    manual_time.now = 1.5
+    schedule.handle_one()
+    assert sorted(run.key.action for run in dispatched) == ['a', 'b']
+    assert [run.scheduled_time for run in dispatched] == [1.1, 1.3]
+
+    stats = schedule.dispatch_stats
+    assert stats == DispatchStats(1, 2, 0)
+    assert stats.saved_wakeups == 1
+
+
+def test_open_window_dispatched_early(manual_time, dispatched):
+    """Test that an entry whose slack window has opened is dispatched along with a due entry."""
+    schedule = Schedule(dispatched.append, manual_time)
+    schedule.register('a', None, 1.)
+    schedule.register('b', None, 1.2, slack=1.)
+    schedule.register('c', None, 3., slack=1.)
+
+    manual_time.now = 1.25
+    schedule.handle_one()
+    assert [run.key.action for run in dispatched] == ['a', 'b']
+    assert schedule.live_count == 1
+    assert schedule.dispatch_stats == DispatchStats(1, 2, 1)
+
+
+def test_no_slack_dispatches_one_by_one(manual_time, dispatched):
+    """Test that entries without slack are dispatched one at a time."""
+    schedule = Schedule(dispatched.append, manual_time)
+    for name in 'ab':
+        schedule.register(name, None, 1.)
+
+    manual_time.now = 1.
+    schedule.handle_one()
+    assert len(dispatched) == 1
+    schedule.handle_one()
+    assert schedule.dispatch_stats.saved_wakeups == 0
+
+
+def test_batch_handler(manual_time):
+    """Test that the batch handler receives every action of a dispatch at once."""
+    batches = []
+    schedule = Schedule(None, manual_time, batch_handler=batches.append)
+    schedule.register('a', None, 0.75, slack=0.5)
+    schedule.register('b', None, 0.5, slack=0.5)
+
+    manual_time.now = 1.
+    schedule.handle_one()
+    assert [sorted(run.key.action for run in batch) for batch in batches] == [['a', 'b']]
+
+
+def test_periodic_slack(manual_time, dispatched):
+    """Test that the runs of a periodic key with slack stay within their windows."""
+    schedule = Schedule(dispatched.append, manual_time)
+    schedule.register(lambda: None, 1., 0.3, slack=0.25)
+
+    for now in (0.5, 1.75, 3.):
+        manual_time.now = now
+        schedule.handle_one()
+        run = dispatched.pop()
+        assert run.scheduled_time <= now <= run.scheduled_time + 0.25
+        run()
+
+
+def test_wheel_alignment(manual_time, dispatched):
+    """Test that slack alignment also coalesces the entries of a timing wheel."""
+    schedule = Schedule(dispatched.append, manual_time, TimingWheelTimerStore(resolution=0.125))
+    schedule.register('a', None, 1.1, slack=0.5)
+    schedule.register('b', None, 1.3, slack=0.5)
+
+    manual_time.now = 1.5
+    schedule.handle_one()
+    schedule.handle_one()
+    assert sorted(run.key.action for run in dispatched) == ['a', 'b']
+    assert schedule.dispatch_stats.dispatched == 2
+
+
+def test_negative_slack(manual_time, dispatched):
+    schedule = Schedule(dispatched.append, manual_time)
+    with pytest.raises(ValueError):
+        schedule.register('a', None, slack=-1.)
@@ -0,0 +1,175 @@
+"""Test the TimerStore implementations backing pytils.clock.Schedule."""
+
+import random
+
+import pytest
+
+from pytils.clock import HeapTimerStore, Schedule, ScheduleEntry, ScheduleKey, TimingWheelTimerStore
+
+
+def _entry(next_run: float, name: str = None) -> ScheduleEntry:
+    return ScheduleEntry(next_run, ScheduleKey(None, name))
+
+
+def _drain(store, until: float, step: float):
+    """Pop every entry from the store, advancing the time in increments of step, and record the pop times."""
+    popped = []
+
+    now = 0.
+    while now <= until:
+        entry = store.pop(now)
+        while entry is not None:
+            popped.append((now, entry))
+            entry = store.pop(now)
+
+        now += step
+
+    return popped
+
+
+@pytest.fixture(params=['heap', 'wheel'])
+def store(request):
+    if request.param == 'heap':
+        return HeapTimerStore()
+    return TimingWheelTimerStore(resolution=1., wheel_size=4, levels=2)
+
+
+def test_empty_store(store):
+    """Test that an empty store reports nothing to do."""
+    assert len(store) == 0
+    assert store.next_run() is None
+    assert store.pop(100.) is None
+
+
+def test_entries_are_not_popped_early(store):
+    """Test that every entry is popped no earlier than its next_run, and at most one tick late."""
+    rng = random.Random(1234)
+    next_runs = [rng.uniform(0, 200) for _ in range(500)]
+
+    for next_run in next_runs:
+        store.push(_entry(next_run), 0.)
+    assert len(store) == len(next_runs)
+
+    popped = _drain(store, 250., 0.5)
+    assert len(popped) == len(next_runs)
+    assert len(store) == 0
+
+    for pop_time, entry in popped:
+        assert entry.next_run <= pop_time <= entry.next_run + 1.5
+
+
+def test_heap_store_preserves_order():
+    """Test that the heap store pops entries in next_run order, breaking ties by insertion order."""
+    store = HeapTimerStore()
+    for next_run, name in ((3., 'c'), (1., 'a'), (2., 'b1'), (2., 'b2')):
+        store.push(_entry(next_run, name), 0.)
+
+    assert store.next_run() == 1.
+    assert [entry.key.action for _, entry in _drain(store, 3., 1.)] == ['a', 'b1', 'b2', 'c']
+
+
+def test_wheel_overflow():
+    """Test that entries beyond the reach of the top level of the wheel are eventually dispatched."""
+    store = TimingWheelTimerStore(resolution=1., wheel_size=2, levels=2)
+    for next_run in (1., 3., 10., 50.):
+        store.push(_entry(next_run), 0.)
+
+    assert [(pop_time, entry.next_run) for pop_time, entry in _drain(store, 60., 1.)] == [
+        (1., 1.), (3., 3.), (10., 10.), (50., 50.)
+    ]
+
+
+def test_wheel_next_run_does_not_overshoot():
+    """Test that the wheel never reports a next_run later than the earliest stored entry."""
+    store = TimingWheelTimerStore(resolution=1., wheel_size=4, levels=3)
+    store.push(_entry(37.), 0.)
+
+    now = 0.
+    while store.pop(now) is None:
+        next_run = store.next_run()
+        assert now < next_run <= 37.
+        now = next_run
+
+    assert now == 37.
+
+
+def test_wheel_next_run_accounts_for_upper_levels():
+    """Test that next_run reports a cascade from an upper level that precedes the occupied slots of the lowest level."""
+    store = TimingWheelTimerStore(resolution=0.01)
+    store.push(_entry(1.0, 'upper'), 0.)
+    store.pop(0.5)
+    store.push(_entry(1.1, 'lower'), 0.5)
+
+    popped = []
+    while len(popped) < 2:
+        now = store.next_run()
+        entry = store.pop(now)
+        while entry is not None:
+            popped.append((now, entry.key.action))
+            entry = store.pop(now)
+
+    assert [name for _, name in popped] == ['upper', 'lower']
+    for pop_time, name in popped:
+        assert pop_time <= (1.0 if name == 'upper' else 1.1) + 0.01
+
+
+def test_wheel_next_run_jumps_across_levels():
+    """Test that jumping from next_run to next_run dispatches entries of every level at most one tick late."""
+    rng = random.Random(4321)
+    store = TimingWheelTimerStore(resolution=1., wheel_size=4, levels=3)
+
+    now = 0.
+    pending = 0
+    for _ in range(2000):
+        for _ in range(rng.randrange(3)):
+            store.push(_entry(now + rng.uniform(0, 60)), now)
+            pending += 1
+
+        next_run = store.next_run()
+        if next_run is None:
+            continue
+
+        now = next_run
+        entry = store.pop(now)
+        while entry is not None:
+            assert entry.next_run <= now <= entry.next_run + 1.
+            pending -= 1
+            entry = store.pop(now)
+
+    assert pending == len(store)
+
+
+def test_wheel_next_run_is_reachable():
+    """Test that popping at the time returned by next_run always makes progress despite rounding."""
+    store = TimingWheelTimerStore(resolution=0.01)
+    for i in range(1, 200):
+        store.push(_entry(i * 0.07), 0.)
+
+    popped = 0
+    for _ in range(10000):
+        now = store.next_run()
+        if now is None:
+            break
+
+        while store.pop(now) is not None:
+            popped += 1
+
+    assert popped == 199
+
+
+def test_schedule_with_wheel():
+    """Test dispatching actions from a Schedule backed by a timing wheel."""
+    now = [0.]
+    dispatched = []
+
+    schedule = Schedule(dispatched.append, lambda: now[0], TimingWheelTimerStore(resolution=0.5))
+    for name, delay in (('b', 2.), ('a', 1.), ('c', 3.)):
+        schedule.register(name, None, delay)
+
+    assert not schedule.has_expired()
+
+    now[0] = 2.
+    schedule.handle_one()
+    schedule.handle_one()
+    assert [run.key.action for run in dispatched] == ['a', 'b']
+    assert not schedule.has_expired()
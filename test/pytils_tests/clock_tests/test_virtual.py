@@ -0,0 +1,69 @@
+"""Test the deterministic simulation of schedules on pytils.clock.VirtualClock."""
+
+from typing import List, Tuple
+
+import pytest
+
+from pytils.clock import CatchUpPolicy, FixedRate, SchedulerMetrics, TimingWheelTimerStore, VirtualClock
+
+
+def _trace(clock: VirtualClock, horizon: float) -> List[Tuple[float, str]]:
+    trace = []
+    for name, period, delay in (('a', 1., None), ('b', 2.5, 0.5), ('c', 0.75, 0.25)):
+        clock.schedule.register(lambda name=name: trace.append((clock.now, name)), period, delay)
+
+    clock.run_until(horizon)
+    return trace
+
+
+def test_runs_in_time_order():
+    """Test that actions run at their due times, in time order, without waiting in real time."""
+    clock = VirtualClock()
+    trace = _trace(clock, 3600.)
+
+    assert clock.now == 3600.
+    assert len(trace) == clock.run_count == 3601 + 1440 + 4800
+    assert [t for t, _ in trace] == sorted(t for t, _ in trace)
+    assert [t for t, name in trace if name == 'b'][:3] == [0.5, 3., 5.5]
+
+
+@pytest.mark.parametrize('timers', [None, TimingWheelTimerStore(resolution=0.25)], ids=['heap', 'wheel'])
+def test_deterministic(timers):
+    """Test that replaying the same registrations yields the same trace."""
+    assert _trace(VirtualClock(timers=timers), 100.) == _trace(VirtualClock(), 100.)
+
+
+def test_step():
+    clock = VirtualClock(10.)
+    ran = []
+    clock.schedule.register(lambda: ran.append(clock.now), None, 5.)
+
+    assert not clock.step(until=12.)
+    assert clock.now == 10.
+
+    assert clock.step()
+    assert ran == [15.]
+    assert not clock.step()
+
+
+def test_simulated_duration():
+    """Test that actions may simulate their own duration, so that lag and catch-up can be asserted."""
+    metrics = SchedulerMetrics()
+    clock = VirtualClock(metrics=metrics)
+    key = clock.schedule.register(lambda: clock.time.advance(2.5), 1., fixed_rate=FixedRate(CatchUpPolicy.SKIP))
+
+    clock.run_until(10.)
+
+    # Runs start at slots 0, 3, 6 and 9, each skipping the two slots it overran
+    assert key.stats.runs == 4
+    assert key.stats.missed == 8
+    assert key.stats.overruns == 4
+    assert metrics.snapshot().dispatch_lag.max == 0.
+
+
+def test_time_cannot_move_backwards():
+    clock = VirtualClock(5.)
+    with pytest.raises(ValueError):
+        clock.time.advance_to(4.)
+    with pytest.raises(ValueError):
+        clock.time.advance(-1.)
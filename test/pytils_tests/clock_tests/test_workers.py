@@ -0,0 +1,100 @@
+"""Test running the actions of a pytils.clock.SchedulingQueue on a pool of worker threads."""
+
+import time
+from threading import Event, Semaphore
+
+import pytest
+
+from pytils.clock import SchedulingQueue
+
+_IO_DURATION = 0.02
+_NUM_ACTIONS = 24
+
+
+@pytest.fixture
+def scheduling_queue() -> SchedulingQueue:
+    scheduling_queue = SchedulingQueue()
+    scheduling_queue.schedule.start()
+
+    yield scheduling_queue
+
+    scheduling_queue.resize(0)
+
+
+def time_io_bound_actions(scheduling_queue: SchedulingQueue, num_actions: int) -> float:
+    """Register I/O-bound actions for immediate dispatch and measure the time taken for all of them to complete."""
+    done = Semaphore(0)
+
+    def io_bound_action():
+        time.sleep(_IO_DURATION)
+        done.release()
+
+    start = time.perf_counter()
+    for _ in range(num_actions):
+        scheduling_queue.schedule.register(io_bound_action, None)
+    for _ in range(num_actions):
+        assert done.acquire(timeout=5.)
+
+    return time.perf_counter() - start
+
+
+def test_throughput_scales_with_workers(scheduling_queue):
+    """Test that I/O-bound actions complete faster as workers are added."""
+    scheduling_queue.resize(1)
+    single_worker_duration = time_io_bound_actions(scheduling_queue, _NUM_ACTIONS)
+
+    scheduling_queue.resize(8)
+    assert scheduling_queue.num_workers == 8
+    pooled_duration = time_io_bound_actions(scheduling_queue, _NUM_ACTIONS)
+
+    assert single_worker_duration >= _NUM_ACTIONS * _IO_DURATION
+    assert pooled_duration < single_worker_duration / 3
+
+
+def test_slow_action_does_not_stall_dispatch(scheduling_queue):
+    """Test that a blocked action neither blocks dispatch nor the remaining workers."""
+    release = Event()
+    scheduling_queue.resize(2)
+
+    scheduling_queue.schedule.register(release.wait, None)
+    assert time_io_bound_actions(scheduling_queue, 4) < 1.
+
+    release.set()
+
+
+def test_shrink_pool(scheduling_queue):
+    """Test that excess workers exit once the pool is resized down."""
+    scheduling_queue.resize(4)
+    scheduling_queue.resize(1)
+
+    deadline = time.monotonic() + 5.
+    while scheduling_queue.num_workers > 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert scheduling_queue.num_workers == 1
+    assert time_io_bound_actions(scheduling_queue, 2) < 1.
+
+    with pytest.raises(ValueError):
+        scheduling_queue.resize(-1)
+
+
+def test_autoscale_and_drain(scheduling_queue):
+    """Test that the pool scales with the queue depth and that stop drains the queue."""
+    release = Event()
+    done = Semaphore(0)
+    scheduling_queue.resize(1, 4)
+
+    for _ in range(8):
+        scheduling_queue.schedule.register(lambda: (release.wait(), done.release()), None)
+
+    deadline = time.monotonic() + 5.
+    while scheduling_queue.num_workers < 4 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert scheduling_queue.num_workers == 4
+
+    release.set()
+    assert scheduling_queue.stop(5.)
+    assert scheduling_queue.num_workers == 0
+    assert scheduling_queue.stats.depth == 0
+    for _ in range(8):
+        assert done.acquire(timeout=0.)
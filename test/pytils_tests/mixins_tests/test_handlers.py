@@ -0,0 +1,200 @@
+"""Test the managed pool of the pytils.mixins.DaemonHandler mixin."""
+
+import time
+from collections import deque
+from threading import Condition, Event, current_thread
+from typing import Callable
+
+import pytest
+
+from pytils.mixins import DaemonHandler, SpinBackoff
+
+
+class Spinner(DaemonHandler):
+    """DaemonHandler that never has anything to do and never waits, until it has been run a number of times."""
+
+    def __init__(self, iterations: int):
+        self._remaining = iterations
+
+    def is_active(self) -> bool:
+        return self._remaining > 0
+
+    def handle_one(self):
+        self._remaining -= 1
+        return False
+
+
+class TaskQueue(DaemonHandler):
+    """DaemonHandler that runs queued tasks."""
+
+    def __init__(self):
+        self.done = []
+        self._cv = Condition()
+        self._tasks = deque()
+
+    def submit(self, task: Callable[[], None]):
+        with self._cv:
+            self._tasks.append(task)
+            self._cv.notify()
+
+        self.rescale_pool()
+
+    def load(self) -> float:
+        return len(self._tasks)
+
+    def wakeup(self):
+        with self._cv:
+            self._cv.notify_all()
+
+    def handle_one(self):
+        with self._cv:
+            self._cv.wait_for(lambda: self._tasks or self.should_yield())
+            if not self._tasks:
+                return False
+
+            task = self._tasks.popleft()
+
+        task()
+        self.done.append(task)
+
+
+def wait_for_thread_count(handler: DaemonHandler, count: int) -> bool:
+    deadline = time.monotonic() + 5.
+    while handler.thread_count != count and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    return handler.thread_count == count
+
+
+@pytest.fixture
+def task_queue() -> TaskQueue:
+    task_queue = TaskQueue()
+    yield task_queue
+    task_queue.stop(1.)
+
+
+def test_pool_scales_with_load(task_queue):
+    """Test that the pool grows up to its maximum under load and shrinks back to its minimum once idle."""
+    release = Event()
+    task_queue.start_pool(1, 4)
+    assert task_queue.thread_count == 1
+
+    for _ in range(8):
+        task_queue.submit(release.wait)
+    assert task_queue.thread_count == 4
+
+    release.set()
+    assert wait_for_thread_count(task_queue, 1)
+    assert len(task_queue.done) == 8
+
+
+def test_bursts_do_not_churn_threads(task_queue):
+    """Test that the pool keeps its threads between bursts of load closer together than the shrink delay."""
+    threads = set()
+    task_queue.start_pool(1, 4, shrink_delay=0.5)
+
+    for _ in range(5):
+        for _ in range(8):
+            task_queue.submit(lambda: threads.add(current_thread()) or time.sleep(0.005))
+        time.sleep(0.05)
+        assert task_queue.thread_count == 4
+
+    assert len(threads) == 4
+    assert wait_for_thread_count(task_queue, 1)
+
+
+def test_stop_drains_pending_work(task_queue):
+    """Test that stop runs the pending work before joining the threads."""
+    task_queue.start_pool(2)
+    for _ in range(50):
+        task_queue.submit(lambda: time.sleep(0.001))
+
+    assert task_queue.stop(5.)
+    assert task_queue.thread_count == 0
+    assert len(task_queue.done) == 50
+
+
+def test_stop_timeout(task_queue):
+    """Test that stop reports the threads that did not exit in time."""
+    release = Event()
+    task_queue.start_pool(1)
+    task_queue.submit(release.wait)
+
+    assert not task_queue.stop(0.05)
+    release.set()
+    assert task_queue.stop(5.)
+
+
+def test_resize_pool(task_queue):
+    task_queue.resize_pool(3)
+    assert task_queue.thread_count == 3
+
+    task_queue.resize_pool(0)
+    assert wait_for_thread_count(task_queue, 0)
+
+    with pytest.raises(RuntimeError):
+        task_queue.start_pool()
+    with pytest.raises(ValueError):
+        task_queue.resize_pool(2, 1)
+
+
+def test_legacy_threads_ignore_pool(task_queue):
+    """Test that threads spawned through start keep running while the pool stops."""
+    task_queue.start_pool(1)
+    task_queue.start()
+    assert task_queue.stop(5.)
+
+    task_queue.submit(lambda: None)
+    deadline = time.monotonic() + 5.
+    while not task_queue.done and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(task_queue.done) == 1
+
+
+def test_loop_stats(task_queue):
+    """Test that the handler loop counts its iterations and splits busy time from idle time."""
+    task_queue.start_pool(1)
+    for _ in range(5):
+        task_queue.submit(lambda: time.sleep(0.01))
+    assert task_queue.stop(5.)
+
+    stats = task_queue.loop_stats
+    assert stats.iterations == stats.idle_iterations + 5
+    assert stats.busy_time >= 0.05
+    assert stats.backoff_time == 0.
+
+
+def test_loop_stats_of_exited_threads(task_queue):
+    """Test that the counters of exited threads are folded into the totals rather than kept per thread."""
+    for _ in range(3):
+        task_queue.resize_pool(3)
+        for _ in range(3):
+            task_queue.submit(lambda: None)
+        task_queue.resize_pool(0)
+        assert wait_for_thread_count(task_queue, 0)
+
+        assert not task_queue.__dict__['_loop_counters']
+        stats = task_queue.loop_stats
+        assert stats.iterations - stats.idle_iterations == len(task_queue.done)
+
+
+def test_spin_detection(caplog):
+    """Test that a spinning loop is reported once it exceeds the warning threshold."""
+    spinner = Spinner(100)
+    spinner.spin_warning_threshold = 50
+    spinner.run()
+
+    stats = spinner.loop_stats
+    assert (stats.iterations, stats.idle_iterations) == (100, 100)
+    assert stats.idle_fraction == 1.
+    assert caplog.text.count('consecutive iterations') == 1
+
+
+def test_spin_backoff():
+    """Test that a spinning loop sleeps exponentially longer between iterations, up to the maximum."""
+    spinner = Spinner(10)
+    spinner.spin_backoff = SpinBackoff(threshold=4, initial=0.001, maximum=0.004)
+    spinner.run()
+
+    # Sleeps of 1, 2, 4, 4, 4, 4 and 4 ms after iterations 4 to 10
+    assert spinner.loop_stats.backoff_time == pytest.approx(0.023)
@@ -0,0 +1,82 @@
+"""Test the memoization of child views by pytils.object_view.CachingObjectView."""
+
+import pytest
+
+from pytils.object_view import CachingObjectView, ObjectView
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        'server': {
+            'hosts': ['alpha', 'beta'],
+            'limits': {'connections': 64},
+        },
+        'stages': [{'name': 'build'}, {'name': 'test'}, {'name': 'deploy'}],
+    }
+
+
+def test_children_are_reused(config):
+    view = CachingObjectView.of(config)
+
+    assert isinstance(view, CachingObjectView)
+    assert view.server is view.server
+    assert view.server.limits is view['server']['limits']
+    assert view.stages[1] is view.stages[1]
+    assert isinstance(view.server.hosts, CachingObjectView)
+    assert view.server.limits.connections == 64
+
+
+def test_set_invalidates(config):
+    view = CachingObjectView.of(config)
+    limits = view.server.limits
+
+    view.server.limits = {'connections': 8}
+    assert view.server.limits is not limits
+    assert view.server.limits.connections == 8
+
+    view.server['hosts'] = ['gamma']
+    assert list(view.server.hosts) == ['gamma']
+
+
+def test_delete_invalidates(config):
+    view = CachingObjectView.of(config)
+    assert view.stages[0].name == 'build'
+
+    del view.stages[0]
+    assert view.stages[0].name == 'test'
+    assert len(view.stages) == 2
+
+    del view.server.limits
+    assert 'limits' not in view.server
+    with pytest.raises(KeyError):
+        _ = view.server.limits
+
+
+def test_external_mutation_is_detected(config):
+    """Test that a cached view is dropped once the backing data no longer holds the child it wraps."""
+    view = CachingObjectView.of(config)
+    hosts = view.server.hosts
+
+    config['server']['hosts'] = ['delta']
+    assert view.server.hosts is not hosts
+    assert list(view.server.hosts) == ['delta']
+
+
+def test_slices_are_not_cached(config):
+    view = CachingObjectView.of(config)
+
+    assert [stage.name for stage in view.stages[1:]] == ['test', 'deploy']
+    view.stages[:2] = [{'name': 'lint'}]
+    assert [stage.name for stage in view.stages] == ['lint', 'deploy']
+
+
+def test_items_use_cache(config):
+    view = CachingObjectView.of(config)
+    assert dict(view.items())['server'] is view.server
+
+
+def test_plain_view_is_unchanged(config):
+    view = ObjectView.of(config)
+    assert type(view.server) is ObjectView
+    assert view.server is not view.server
@@ -0,0 +1,82 @@
+"""Test the columnar storage of pytils.object_view.ColumnarObjectView."""
+
+import pytest
+
+from pytils.object_view import ColumnarObjectView, ObjectView
+
+
+@pytest.fixture
+def records() -> list:
+    return [
+        {'sku': f'S{i}', 'price': i * 1.5, 'quantity': i, 'active': i % 2 == 0, 'tags': ['a'] * i}
+        for i in range(5)
+    ]
+
+
+def test_rows_match_records(records):
+    view = ColumnarObjectView.of(records)
+
+    assert len(view) == 5
+    assert view.fields() == ('sku', 'price', 'quantity', 'active', 'tags')
+    assert view[1].sku == 'S1'
+    assert view[-1]['price'] == 6.
+    assert view[2].active is True
+    assert type(view[3].quantity) is int
+    assert len(view[2].tags) == 2
+    assert [row.quantity for row in view] == [0, 1, 2, 3, 4]
+    assert [row.sku for row in view[1:3]] == ['S1', 'S2']
+    assert dict(view[4].items()).keys() == records[4].keys()
+    assert view.to_records() == records
+    assert ObjectView.get_value(view) == records
+
+    with pytest.raises(IndexError):
+        _ = view[5]
+
+
+def test_columns(records):
+    view = ColumnarObjectView.of(records)
+
+    assert list(view.column('quantity')) == [0, 1, 2, 3, 4]
+    assert sum(view.column('price')) == 15.
+    assert view.column('tags') == [record['tags'] for record in records]
+    with pytest.raises(KeyError):
+        view.column('missing')
+    with pytest.raises(TypeError):
+        view[0].column('price')
+
+
+def test_writes(records):
+    view = ColumnarObjectView.of(records)
+
+    view[1].quantity = 10
+    view[2]['price'] = 0.25
+    assert view.column('quantity')[1] == 10
+    assert view[2].price == 0.25
+
+    # Writing a value of another type falls back to a list
+    view[3].quantity = 'many'
+    assert view.column('quantity') == [0, 10, 2, 'many', 4]
+
+    with pytest.raises(KeyError):
+        view[0].missing = 1
+
+
+def test_wide_integer_writes(records):
+    """Test that writing an integer beyond 64 bits into an integer column falls back to a list."""
+    view = ColumnarObjectView.of(records)
+
+    view[1].quantity = 2 ** 64
+    view[2].quantity = -2 ** 70
+    assert view.column('quantity') == [0, 2 ** 64, -2 ** 70, 3, 4]
+    assert type(view[3].quantity) is int
+    assert view.to_records()[1]['quantity'] == 2 ** 64
+
+
+def test_non_columnar_data(records):
+    records[2]['extra'] = True
+    with pytest.raises(ValueError):
+        ColumnarObjectView.of(records)
+
+    assert len(ColumnarObjectView.of([])) == 0
+    assert ColumnarObjectView.of([1, 2])[1] == 2
+    assert ColumnarObjectView.of({'a': 1}).a == 1
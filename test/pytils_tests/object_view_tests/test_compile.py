@@ -0,0 +1,73 @@
+"""Test the compiled path accessors of pytils.object_view."""
+
+import pytest
+
+from pytils.object_view import CompiledPaths, ObjectView, parse_path
+from pytils.paths import DotDelimitedPath
+
+
+@pytest.fixture
+def records() -> list:
+    return [
+        {'id': i, 'user': {'name': f'user{i}', 'tags': ['a', 'b', f'c{i}']}, '3': 'three'}
+        for i in range(5)
+    ]
+
+
+@pytest.mark.parametrize('path, keys', [
+    ('a', ('a',)),
+    ('a.b[3].c', ('a', 'b', 3, 'c')),
+    ('a.b.3.c', ('a', 'b', 3, 'c')),
+    ('a[-1][0]', ('a', -1, 0)),
+    ("a['3'][\"b.c\"]", ('a', '3', 'b.c')),
+    (('a', 0), ('a', 0)),
+])
+def test_parse_path(path, keys):
+    assert parse_path(path) == keys
+
+
+def test_parse_dot_delimited_path():
+    assert parse_path(DotDelimitedPath('a.b.2')) == ('a', 'b', 2)
+
+
+@pytest.mark.parametrize('path', ['a.', 'a..b', 'a[b]', 'a[1', 'a[1]b'])
+def test_parse_invalid_path(path):
+    with pytest.raises(ValueError):
+        parse_path(path)
+
+
+def test_get(records):
+    name = ObjectView.compile('user.name')
+    tag = ObjectView.compile('user.tags[-1]')
+
+    assert name(records[1]) == 'user1'
+    assert tag(ObjectView.of(records[2])) == 'c2'
+    assert ObjectView.compile("['3']")(records[0]) == 'three'
+
+    with pytest.raises(KeyError):
+        ObjectView.compile('user.email')(records[0])
+    assert ObjectView.compile('user.email').get(records[0], None) is None
+    assert ObjectView.compile('user.tags[7]').get(records[0], 'none') == 'none'
+
+
+def test_set(records):
+    view = ObjectView.of(records[0])
+    ObjectView.compile('user.tags[0]').set(view, 'z')
+    ObjectView.compile('user.email').set(records[0], ObjectView.of('user0@example.com'))
+
+    assert records[0]['user'] == {'name': 'user0', 'tags': ['z', 'b', 'c0'], 'email': 'user0@example.com'}
+
+
+def test_batch(records):
+    paths = ObjectView.compile_many('id', 'user.name', 'user.tags[2]')
+
+    assert isinstance(paths, CompiledPaths)
+    assert paths(records[3]) == (3, 'user3', 'c3')
+    assert paths.extract(ObjectView.of(records)) == [(i, f'user{i}', f'c{i}') for i in range(5)]
+    assert paths.extract(iter(records[:2])) == [(0, 'user0', 'c0'), (1, 'user1', 'c1')]
+    assert ObjectView.compile('id').get_many(records) == list(range(5))
+
+    records[4]['user'].pop('tags')
+    with pytest.raises(KeyError):
+        paths.extract(records)
+    assert paths.extract(records, None)[4] == (4, 'user4', None)
@@ -0,0 +1,135 @@
+"""Test the immutable views of pytils.object_view.FrozenObjectView."""
+
+import pytest
+
+from pytils.object_view import FrozenObjectView, ObjectView
+
+
+@pytest.fixture
+def config() -> dict:
+    return {
+        'name': 'service',
+        'db': {'host': 'localhost', 'ports': [5432, 5433]},
+        'features': {'search': {'enabled': True}},
+        'tags': ('a', 'b'),
+    }
+
+
+def test_reads(config):
+    view = FrozenObjectView.of(config)
+    assert isinstance(view, FrozenObjectView)
+    assert view.name == 'service'
+    assert view.db.host == 'localhost'
+    assert view.db.ports[1] == 5433
+    assert isinstance(view.db, FrozenObjectView)
+    assert view.thaw() == dict(config, tags=['a', 'b'])
+
+
+def test_of_copies(config):
+    view = FrozenObjectView.of(config)
+    config['db']['host'] = 'remote'
+    assert view.db.host == 'localhost'
+
+
+def test_writes_raise(config):
+    view = FrozenObjectView.of(config)
+    with pytest.raises(TypeError):
+        view.name = 'other'
+    with pytest.raises(TypeError):
+        view['name'] = 'other'
+    with pytest.raises(TypeError):
+        del view.name
+    with pytest.raises(TypeError):
+        del view.db['host']
+
+
+def test_set_in(config):
+    view = FrozenObjectView.of(config)
+    updated = view.set_in('db.ports[0]', 6432)
+
+    assert updated.db.ports[0] == 6432
+    assert view.db.ports[0] == 5432
+    assert updated.thaw()['db'] == {'host': 'localhost', 'ports': [6432, 5433]}
+
+    # The subtrees off the path are shared
+    assert updated.features() is view.features()
+    assert updated.db() is not view.db()
+
+
+def test_set_in_adds_keys(config):
+    view = FrozenObjectView.of(config)
+    updated = view.set_in(['features', 'export', 'enabled'], False)
+    assert updated.features.export.enabled is False
+    assert 'export' not in view.features
+
+
+def test_set_in_freezes_value(config):
+    value = {'enabled': False}
+    updated = FrozenObjectView.of(config).set_in('features.search', value)
+    value['enabled'] = True
+    assert updated.features.search.enabled is False
+    hash(updated)
+
+
+def test_set_in_same_value_shares(config):
+    view = FrozenObjectView.of(config)
+    assert view.set_in('db', view.db)() is view()
+    assert view.set_in('db.ports', [5432, 5433]).db() is not view.db()
+
+
+def test_set_in_errors(config):
+    view = FrozenObjectView.of(config)
+    with pytest.raises(TypeError):
+        view.set_in('name.first', 'x')
+    with pytest.raises(IndexError):
+        view.set_in('db.ports[2]', 1)
+
+
+def test_delete_in(config):
+    view = FrozenObjectView.of(config)
+    updated = view.delete_in('db.ports[0]')
+    assert tuple(updated.db.ports) == (5433,)
+    assert tuple(view.db.ports) == (5432, 5433)
+    assert 'name' not in view.delete_in('name')
+    with pytest.raises(KeyError):
+        view.delete_in('missing.key')
+
+
+def test_hash_and_equality(config):
+    view = FrozenObjectView.of(config)
+    other = FrozenObjectView.of(config)
+
+    assert view is not other
+    assert hash(view) == hash(other)
+    assert view == other
+    assert view == config
+    assert view.db.ports == [5432, 5433]
+    assert view != view.set_in('name', 'other')
+    assert {view: 1}[other] == 1
+
+    # Hashes are cached on the nodes
+    assert view()._hash is not None
+    assert view.db()._hash is not None
+
+
+def test_equality_of_shared_nodes(config):
+    view = FrozenObjectView.of(config)
+    updated = view.set_in('name', 'other')
+
+    class Unequal:
+
+        def __eq__(self, other):
+            raise AssertionError('shared nodes are compared')
+
+        def __hash__(self):
+            return 0
+
+    shared = FrozenObjectView.of({'left': Unequal(), 'right': 1})
+    assert shared.set_in('right', 2).set_in('right', 1) == shared
+    assert updated.set_in('name', 'service') == view
+
+
+def test_of_frozen_shares(config):
+    view = FrozenObjectView.of(config)
+    assert FrozenObjectView.of(view)() is view()
+    assert ObjectView.of(view()).db.host == 'localhost'
@@ -0,0 +1,98 @@
+"""Test the lazy JSON views of pytils.object_view.LazyJsonView."""
+
+import json
+import mmap
+
+import pytest
+
+from pytils.object_view import LazyJsonView, ObjectView
+
+DOCUMENT = {
+    'name': 'catalog',
+    'tricky': 'brackets ]} and "quotes" \\ in strings',
+    'escaped\nkey': 'ü',
+    'products': [
+        {'sku': 'A-1', 'price': 9.5, 'tags': ['x', 'y'], 'stock': None},
+        {'sku': 'B-2', 'price': 12, 'tags': [], 'stock': {'eu': 3, 'us': 0}},
+    ],
+    'flags': [True, False, -1e-3],
+    'empty': {},
+}
+
+
+@pytest.fixture(params=['compact', 'indented'])
+def raw(request) -> bytes:
+    return json.dumps(DOCUMENT, indent=None if request.param == 'compact' else 2).encode()
+
+
+def test_reads_match_object_view(raw):
+    lazy = LazyJsonView.of(raw)
+    eager = ObjectView.of(DOCUMENT)
+
+    assert isinstance(lazy, LazyJsonView)
+    assert len(lazy) == len(eager)
+    assert list(lazy) == list(eager) == list(lazy.keys())
+    assert lazy.tricky == eager.tricky
+    assert lazy['escaped\nkey'] == 'ü'
+    assert lazy.products[1].stock.eu == 3
+    assert len(lazy['products'][-1]['tags']) == 0
+    assert [item.sku for item in lazy['products']] == ['A-1', 'B-2']
+    assert list(reversed(lazy.flags)) == [-1e-3, False, True]
+    assert 'empty' in lazy and 'missing' not in lazy
+    assert len(lazy.empty) == 0
+
+    assert dict(lazy.items()).keys() == DOCUMENT.keys()
+    assert [LazyJsonView.materialize(value) for value in lazy.values()] == list(DOCUMENT.values())
+    assert LazyJsonView.materialize(lazy) == DOCUMENT
+    assert lazy.products[1].stock == DOCUMENT['products'][1]['stock']
+
+    with pytest.raises(KeyError):
+        _ = lazy.missing
+    with pytest.raises(IndexError):
+        _ = lazy.flags[3]
+
+
+def test_children_are_parsed_on_demand():
+    # The malformed value is only reported once it is parsed
+    lazy = LazyJsonView.of(b'{"good": [1, 2], "bad": [1, 2,, 3]}')
+
+    assert lazy.good[1] == 2
+    assert lazy.bad[1] == 2
+    with pytest.raises(ValueError):
+        _ = lazy.bad[2]
+
+
+def test_scalar_documents():
+    assert LazyJsonView.of(b'  42\n') == 42
+    assert LazyJsonView.of(b'"text"') == 'text'
+    assert LazyJsonView.of(b'null') is None
+
+
+def test_from_file(tmp_path, raw):
+    path = tmp_path / 'document.json'
+    path.write_bytes(raw)
+
+    lazy = LazyJsonView.from_file(str(path))
+    assert isinstance(ObjectView.get_value(lazy)._buffer, mmap.mmap)
+    assert lazy.products[0].price == 9.5
+    assert LazyJsonView.materialize(lazy) == DOCUMENT
+
+
+def test_large_nodes_are_scanned_incrementally():
+    # Span several scan windows, with strings across their boundaries
+    records = [{'id': i, 'text': 'x' * (i % 97) + '", [{'} for i in range(5000)]
+    raw = json.dumps({'records': records, 'blob': 'y' * 200000, 'last': [[[]]]}).encode()
+    lazy = LazyJsonView.of(raw)
+
+    assert lazy.records[3].text == records[3]['text']
+    assert ObjectView.get_value(lazy.records)._position is not None
+    assert lazy.records[-1].id == 4999
+    assert [record.id for record in lazy.records] == list(range(5000))
+    assert len(lazy.blob) == 200000
+    assert len(lazy['last'][0][0]) == 0
+
+
+@pytest.mark.parametrize('raw', [b'[1, 2', b'{"a": "b}', b'{"a" 1}', b'   '])
+def test_malformed_documents(raw):
+    with pytest.raises(ValueError):
+        len(LazyJsonView.of(raw))
@@ -0,0 +1,109 @@
+"""Test the views of packed binary records of pytils.object_view.PackedObjectView."""
+
+import struct
+
+import pytest
+
+from pytils.object_view import ObjectView, PackedObjectView, RecordSchema
+
+POINT = RecordSchema([('x', 'h'), ('y', 'h')])
+ORDER = RecordSchema([
+    ('id', 'I'),
+    ('price', 'd'),
+    ('sku', '8s'),
+    ('origin', POINT),
+    ('path', (POINT, 2)),
+    ('flags', '3?'),
+])
+
+
+def pack_order(i: int) -> bytes:
+    return struct.pack('<Id8shhhhhh3?', i, i * 1.5, f'SKU{i}'.encode(), i, -i, 1, 2, 3, 4, True, False, i % 2 == 0)
+
+
+@pytest.fixture
+def buffer() -> bytearray:
+    return bytearray(b''.join(pack_order(i) for i in range(4)))
+
+
+def test_layout():
+    assert POINT.size == 4
+    assert ORDER.size == struct.calcsize('<Id8shhhhhh3?')
+    assert RecordSchema([('a', 'b'), ('b', 'i')], byte_order='@').size == struct.calcsize('@bi')
+
+
+def test_native_alignment():
+    """Test that native records are padded to their alignment and that nested records are aligned, as in C."""
+    double_alignment = struct.calcsize('@cd') - struct.calcsize('@d')
+    record = RecordSchema([('a', 'd'), ('b', 'c')], byte_order='@')
+    assert record.alignment == double_alignment
+    assert record.size == struct.calcsize('@dc0d')
+
+    outer = RecordSchema([('flag', '?'), ('inner', record), ('records', (record, 2)), ('tail', 'c')], byte_order='@')
+    assert outer.alignment == record.alignment
+    assert outer.size == struct.calcsize('@?0d' + 'dc0d' * 3 + 'c0d')
+
+    buffer = bytearray(outer.size * 2)
+    view = PackedObjectView.of(buffer, outer)
+    view[1].records[1].a = 1.5
+    view[1].tail = b'x'
+    assert struct.unpack_from('@d', buffer, outer.size + double_alignment + 2 * record.size)[0] == 1.5
+    assert buffer[outer.size + double_alignment + 3 * record.size] == ord('x')
+
+    # Fields have a single code, whose alignment is that of the field
+    for byte_order in ('@', '<'):
+        for field_type in ('hd', 'x', '2x', '<d', 'Z', ''):
+            with pytest.raises(ValueError):
+                RecordSchema([('a', 'c'), ('b', field_type)], byte_order=byte_order)
+
+    # Packed records are neither aligned nor padded
+    assert RecordSchema([('a', 'd'), ('b', 'c')]).size == 9
+    assert RecordSchema([('a', 'd'), ('b', 'c')]).alignment == 1
+
+
+def test_reads(buffer):
+    view = PackedObjectView.of(buffer, ORDER)
+
+    assert len(view) == 4
+    assert view[1].id == 1
+    assert view[2].price == 3.
+    assert view[3].sku == b'SKU3\0\0\0\0'
+    assert view[3].origin.y == -3
+    assert view[0].path[1].x == 3
+    assert tuple(view[2].flags) == (True, False, True)
+    assert list(view[0]) == list(ORDER.fields)
+    assert view[1].origin == {'x': 1, 'y': -1}
+    assert [order.id for order in view[::2]] == [0, 2]
+    assert [order.id for order in view[::-1]] == [3, 2, 1, 0]
+    assert PackedObjectView.materialize(view[1])['path'] == [{'x': 1, 'y': 2}, {'x': 3, 'y': 4}]
+
+    with pytest.raises(IndexError):
+        _ = view[4]
+
+
+def test_zero_copy_writes(buffer):
+    view = PackedObjectView.of(memoryview(buffer), ORDER)
+
+    view[1].price = 0.5
+    view[1].origin.x = 7
+    view[2].path[0] = {'x': 5, 'y': 6}
+    view[3].origin = ObjectView.of({'x': -1, 'y': -2})
+    view[0].flags = (False, False, False)
+
+    copy = PackedObjectView.of(bytes(buffer), ORDER)
+    assert copy[1].price == 0.5
+    assert copy[1].origin.x == 7
+    assert copy[2].path[0] == {'x': 5, 'y': 6}
+    assert copy[3].origin == {'x': -1, 'y': -2}
+    assert tuple(copy[0].flags) == (False, False, False)
+
+    with pytest.raises(TypeError):
+        copy[0].id = 1
+
+
+def test_single_record(buffer):
+    record = PackedObjectView.of_record(buffer, ORDER, offset=ORDER.size)
+    assert record.id == 1
+
+    with pytest.raises(ValueError):
+        PackedObjectView.of(buffer, ORDER, count=5)
@@ -0,0 +1,142 @@
+"""Test the wildcard queries of pytils.object_view.Query and PathIndex."""
+
+import pytest
+
+from pytils.object_view import CachingObjectView, ObjectView, PathIndex, Query, TrackedObjectView
+
+
+@pytest.fixture
+def data() -> dict:
+    return {
+        'orders': [
+            {'id': 1, 'lines': [{'sku': 'A'}, {'sku': 'B', 'bundle': {'sku': 'B1'}}]},
+            {'id': 2, 'lines': []},
+            {'id': 3, 'lines': [{'sku': 'C'}], 'note': None},
+        ],
+        'sku': 'top',
+    }
+
+
+def test_segments():
+    assert Query('orders.*.lines[0].sku').segments == ('orders', '*', 'lines', 0, 'sku')
+    assert Query('a.**.**.b').segments == ('a', '**', 'b')
+    with pytest.raises(ValueError):
+        Query('')
+
+
+@pytest.mark.parametrize('pattern, values', [
+    ('orders.*.id', [1, 2, 3]),
+    ('orders.*.lines.*.sku', ['A', 'B', 'C']),
+    ('orders[0].lines.*.sku', ['A', 'B']),
+    ('orders[-1].id', [3]),
+    ('orders.*.note', [None]),
+    ('orders.**.sku', ['A', 'B', 'B1', 'C']),
+    ('orders.*.lines.**.bundle.sku', ['B1']),
+    ('orders[5].id', []),
+    ('orders.id', []),
+    ('sku.*', []),
+])
+def test_values(data, pattern, values):
+    assert Query(pattern).values(data) == values
+    assert Query(pattern).values(ObjectView.of(data)) == values
+
+
+def test_wildcard(data):
+    assert Query('*').values(data) == [data['orders'], 'top']
+    assert Query('orders.*').values(data) == data['orders']
+
+
+def test_recursive_descent(data):
+    assert sorted(Query('**.sku').values(data)) == ['A', 'B', 'B1', 'C', 'top']
+    assert len(Query('**').values(data)) == 21
+    assert Query('orders[0].lines[1].**').values(data)[0] is data['orders'][0]['lines'][1]
+
+
+def test_paths(data):
+    assert Query('orders.*.lines.*.sku').paths(data) == [
+        ('orders', 0, 'lines', 0, 'sku'),
+        ('orders', 0, 'lines', 1, 'sku'),
+        ('orders', 2, 'lines', 0, 'sku'),
+    ]
+    assert Query('orders[-1].id').items(data) == [(('orders', 2, 'id'), 3)]
+    assert Query('**.bundle').paths(data) == [('orders', 0, 'lines', 1, 'bundle')]
+
+
+def test_views(data):
+    views = Query('orders.*').views(data)
+    assert all(isinstance(view, ObjectView) for view in views)
+    assert [view.id for view in views] == [1, 2, 3]
+
+    caching = Query('orders.*.lines').views(CachingObjectView.of(data))
+    assert isinstance(caching[0], CachingObjectView)
+    assert Query('orders.*.id').views(data) == [1, 2, 3]
+
+
+def test_tracked_views(data):
+    """Test that writes through the views of the matches of a TrackedObjectView are logged by it."""
+    tracked = TrackedObjectView.of(data)
+    for line in Query('orders.*.lines.*').views(tracked):
+        line.qty = 1
+    Query('orders[-1]').views(tracked)[0].note = 'late'
+
+    assert tracked.changes() == [
+        {'op': 'add', 'path': '/orders/0/lines/0/qty', 'value': 1},
+        {'op': 'add', 'path': '/orders/0/lines/1/qty', 'value': 1},
+        {'op': 'add', 'path': '/orders/2/lines/0/qty', 'value': 1},
+        {'op': 'replace', 'path': '/orders/2/note', 'value': 'late'},
+    ]
+    assert data['orders'][2]['lines'][0]['qty'] == 1
+    assert Query('**').views(tracked)[0] is tracked
+
+
+@pytest.mark.parametrize('pattern', [
+    'orders.*.id',
+    'orders.*.lines.*.sku',
+    'orders[2].lines.*',
+    'orders.**.sku',
+    '**.sku',
+    '**',
+    '*',
+    'missing.*',
+])
+def test_index(data, pattern):
+    index = PathIndex(data)
+    query = Query(pattern)
+    assert sorted(map(repr, query.items(index))) == sorted(map(repr, query.items(data)))
+    assert query.items(index) == query.items(index)
+
+
+@pytest.mark.parametrize('pattern', [
+    '**.a.**.b',
+    '**.a.**',
+    '**.*.**.b',
+    '**.a.**.a.**',
+])
+def test_repeated_recursive_descents(pattern):
+    """Test that nodes matched through nested recursive descents are only matched once, as by a PathIndex."""
+    data = {'a': {'a': {'b': 1, 'c': [{'a': {'b': 1}}]}, 'b': 2}, 'b': 3}
+    query = Query(pattern)
+    index = PathIndex(data)
+
+    assert sorted(map(repr, query.items(data))) == sorted(map(repr, query.items(index)))
+    assert len(query.values(data)) == len(query.values(index))
+    assert sorted(map(repr, query.values(data))) == sorted(map(repr, query.values(index)))
+
+
+def test_repeated_recursive_descents_values():
+    assert Query('**.a.**.b').values({'a': {'a': {'b': 1}}}) == [1]
+    assert Query('**.a.**.b').paths({'a': {'a': {'b': 1}}}) == [('a', 'a', 'b')]
+
+
+def test_index_document_order(data):
+    index = PathIndex(data)
+    assert len(index) == 21
+    assert Query('**.sku').values(index) == ['A', 'B', 'B1', 'C', 'top']
+    with pytest.raises(ValueError):
+        Query('orders[-1]').values(index)
+
+
+def test_compile_query(data):
+    query = ObjectView.compile_query('orders.*.id')
+    assert isinstance(query, Query)
+    assert query.values(data) == [1, 2, 3]
@@ -0,0 +1,92 @@
+"""Test the streaming iteration of JSON documents of pytils.object_view."""
+
+import io
+import json
+
+import pytest
+
+from pytils.object_view import CachingObjectView, ObjectView, iter_json, iter_ndjson
+
+RECORDS = [
+    {'id': i, 'name': f'record {i}', 'note': 'brackets ]} and "quotes" \\' * (i % 3), 'values': [i, i / 2, None]}
+    for i in range(200)
+] + [1, 'text', None, -2.5e3, [], {}]
+
+DOCUMENT = {
+    'header': {'skipped': [{'x': '"]' * 40}] * 20, 'count': len(RECORDS)},
+    'data': {'records': RECORDS, 'empty': []},
+    'footer': 'ü',
+}
+
+
+@pytest.fixture(params=[1, 7, 4096])
+def chunk_size(request) -> int:
+    return request.param
+
+
+@pytest.fixture(params=['compact', 'indented'])
+def raw(request) -> bytes:
+    return json.dumps(DOCUMENT, indent=None if request.param == 'compact' else 2, ensure_ascii=False).encode()
+
+
+def test_iter_json_path(raw, chunk_size):
+    assert list(iter_json(io.BytesIO(raw), 'data.records', chunk_size)) == RECORDS
+    assert list(iter_json(io.BytesIO(raw), ['data', 'empty'], chunk_size)) == []
+    assert len(list(iter_json(io.BytesIO(raw), 'header.skipped', chunk_size))) == 20
+
+
+def test_iter_json_document(chunk_size):
+    raw = json.dumps(RECORDS).encode()
+    assert list(iter_json(io.BytesIO(raw), chunk_size=chunk_size)) == RECORDS
+    assert list(iter_json(io.BytesIO(b' [ ] '), chunk_size=chunk_size)) == []
+    assert list(iter_json(io.BytesIO(b'[[1, [2]], [3]]'), '[0][1]', chunk_size)) == [2]
+
+
+@pytest.mark.parametrize('raw', [b'[1.25, 3e10, -0.5E-3, 12345678, 2.5e+7]', b'{"a": [0.125,\n1e-2 ]}'])
+def test_iter_json_numbers_across_reads(raw):
+    expected = json.loads(raw)
+    path = None if isinstance(expected, list) else 'a'
+    for chunk_size in range(1, len(raw) + 1):
+        assert list(iter_json(io.BytesIO(raw), path, chunk_size)) == (expected if path is None else expected['a'])
+
+
+def test_iter_json_numbers_default_reads():
+    values = [i + 0.123456789 for i in range(20000)] + [i * 1e-300 for i in range(20000)]
+    assert list(iter_json(io.BytesIO(json.dumps(values).encode()))) == values
+
+
+def test_iter_json_is_lazy():
+    raw = io.BytesIO(json.dumps({'items': list(range(100000)), 'tail': 1}).encode())
+    items = iter_json(raw, 'items', chunk_size=1024)
+    assert next(items) == 0
+    assert raw.tell() < 1 << 16
+
+
+def test_iter_json_errors():
+    with pytest.raises(KeyError):
+        list(iter_json(io.BytesIO(b'{"a": [1]}'), 'b'))
+    with pytest.raises(IndexError):
+        list(iter_json(io.BytesIO(b'[[1], [2]]'), '[2]'))
+    with pytest.raises(ValueError):
+        list(iter_json(io.BytesIO(b'{"a": 1}')))
+    with pytest.raises(ValueError):
+        list(iter_json(io.BytesIO(b'[{"a": [1, 2}')))
+    with pytest.raises(ValueError):
+        list(iter_json(io.BytesIO(b'[1 2]')))
+
+
+def test_iter_ndjson():
+    raw = b'\n'.join(json.dumps(record).encode() for record in RECORDS) + b'\n\n'
+    assert list(iter_ndjson(io.BytesIO(raw))) == RECORDS
+
+
+def test_views():
+    raw = json.dumps(DOCUMENT).encode()
+    views = list(ObjectView.iter_json(io.BytesIO(raw), 'data.records'))
+    assert isinstance(views[0], ObjectView)
+    assert views[3]['values'][0] == 3
+    assert views[-6] == 1
+
+    caching = next(CachingObjectView.iter_ndjson(io.BytesIO(b'{"a": {"b": 2}}\n')))
+    assert isinstance(caching, CachingObjectView)
+    assert caching.a.b == 2
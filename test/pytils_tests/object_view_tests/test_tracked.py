@@ -0,0 +1,189 @@
+"""Test the change tracking of pytils.object_view.TrackedObjectView."""
+
+import copy
+import json
+
+import pytest
+
+from pytils.object_view import ObjectView, TrackedObjectView
+
+
+@pytest.fixture
+def state() -> dict:
+    return {
+        'nodes': {'a': {'load': 1, 'tags': ['x']}, 'b': {'load': 2, 'tags': []}},
+        'queue': [{'id': 1}, {'id': 2}, {'id': 3}],
+        'version': 1,
+    }
+
+
+def replay(original: dict, changes: list) -> dict:
+    # Changes are serializable as JSON, to be sent to a replica
+    return TrackedObjectView.apply(copy.deepcopy(original), json.loads(json.dumps(changes)))
+
+
+def test_reads(state):
+    view = TrackedObjectView.of(state)
+    assert isinstance(view.nodes.a, TrackedObjectView)
+    assert view.nodes.a.load == 1
+    assert [item.id for item in view.queue] == [1, 2, 3]
+    assert view.changes() == []
+
+
+def test_nested_writes(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+
+    view.version = 2
+    view.nodes.a.load = 5
+    view.nodes['c'] = {'load': 0}
+    view.queue[-1].id = 4
+
+    assert view.changes() == [
+        {'op': 'replace', 'path': '/version', 'value': 2},
+        {'op': 'replace', 'path': '/nodes/a/load', 'value': 5},
+        {'op': 'add', 'path': '/nodes/c', 'value': {'load': 0}},
+        {'op': 'replace', 'path': '/queue/2/id', 'value': 4},
+    ]
+    assert view.dirty_paths() == {('version',), ('nodes', 'a', 'load'), ('nodes', 'c'), ('queue', 2, 'id')}
+    assert replay(original, view.changes()) == state
+
+
+def test_writes_are_coalesced(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+
+    view.nodes.a.load = 5
+    view.nodes.a.load = 6
+    view.nodes.a.tags[0] = 'y'
+    view.nodes.a = {'load': 7}
+    view.nodes['c'] = {'load': 0}
+    view.nodes.c.load = 1
+
+    assert view.changes() == [
+        {'op': 'replace', 'path': '/nodes/a', 'value': {'load': 7}},
+        {'op': 'add', 'path': '/nodes/c', 'value': {'load': 0}},
+        {'op': 'replace', 'path': '/nodes/c/load', 'value': 1},
+    ]
+    assert replay(original, view.changes()) == state
+
+    del view.nodes.c
+    assert view.changes() == [{'op': 'replace', 'path': '/nodes/a', 'value': {'load': 7}}]
+    assert replay(original, view.changes()) == state
+
+
+def test_removed_keys_written_again():
+    """Test that a key removed and written again is replaced, so that removing it once more is still logged."""
+    view = TrackedObjectView.of({'a': 0, 'b': 0})
+
+    del view['a']
+    view['a'] = 5
+    assert view.changes() == [{'op': 'replace', 'path': '/a', 'value': 5}]
+    assert replay({'a': 0, 'b': 0}, view.changes()) == {'a': 5, 'b': 0}
+
+    del view['a']
+    del view.b
+    view.b = 1
+    assert view.changes() == [{'op': 'remove', 'path': '/a'}, {'op': 'replace', 'path': '/b', 'value': 1}]
+    assert replay({'a': 0, 'b': 0}, view.changes()) == {'b': 1}
+
+
+def test_values_are_copied(state):
+    view = TrackedObjectView.of(state)
+    value = {'load': 3}
+    view.nodes.a = value
+    value['load'] = 4
+    assert view.changes()[0]['value'] == {'load': 3}
+
+
+def test_list_removals(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+
+    view.queue[2].id = 30
+    del view.queue[0]
+    view.queue[1].id = 31
+    del view.queue[-1]
+
+    assert view.changes() == [
+        {'op': 'replace', 'path': '/queue/2/id', 'value': 30},
+        {'op': 'remove', 'path': '/queue/0'},
+        {'op': 'remove', 'path': '/queue/1'},
+    ]
+    assert replay(original, view.changes()) == state
+
+
+def test_slices(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+
+    view.queue[1:] = [{'id': 5}]
+    assert view.changes() == [{'op': 'replace', 'path': '/queue', 'value': [{'id': 1}, {'id': 5}]}]
+
+    del view.nodes.b.tags[:]
+    assert replay(original, view.changes()) == state
+
+    # Slices are copies, whose writes are not tracked
+    assert isinstance(view.queue[:1], ObjectView)
+    assert not isinstance(view.queue[:1], TrackedObjectView)
+
+
+def test_checkpoint(state):
+    view = TrackedObjectView.of(state)
+    view.version = 2
+    snapshot = copy.deepcopy(state)
+
+    assert view.nodes.checkpoint() == [{'op': 'replace', 'path': '/version', 'value': 2}]
+    assert view.changes() == []
+    assert view.dirty_paths() == set()
+
+    view.nodes.b.load = 9
+    assert view.checkpoint() == [{'op': 'replace', 'path': '/nodes/b/load', 'value': 9}]
+    assert replay(snapshot, [{'op': 'replace', 'path': '/nodes/b/load', 'value': 9}]) == state
+
+
+def test_views_are_independent(state):
+    first = TrackedObjectView.of(state)
+    second = TrackedObjectView.of(state)
+    first.version = 2
+    assert second.changes() == []
+
+
+def test_pointer_escaping():
+    view = TrackedObjectView.of({})
+    view['a/b'] = 1
+    view['c~d'] = 2
+    assert [change['path'] for change in view.changes()] == ['/a~1b', '/c~0d']
+    assert TrackedObjectView.apply({}, view.changes()) == {'a/b': 1, 'c~d': 2}
+
+
+def test_held_views_follow_removals(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+    held = view.queue[2]
+    last = view.queue[-1]
+
+    del view.queue[0]
+    held.id = 30
+    assert view.changes()[-1] == {'op': 'replace', 'path': '/queue/1/id', 'value': 30}
+
+    view.queue[1:1] = [{'id': 9}]
+    last.id = 31
+    assert view.changes()[-1] == {'op': 'replace', 'path': '/queue/2/id', 'value': 31}
+    assert replay(original, view.changes()) == state
+
+
+def test_detached_views_are_not_logged(state):
+    original = copy.deepcopy(state)
+    view = TrackedObjectView.of(state)
+    removed = view.queue[0]
+    replaced = view.nodes.a
+
+    del view.queue[0]
+    view.nodes.a = {'load': 0}
+    changes = view.changes()
+
+    removed.id = 10
+    replaced.load = 10
+    assert view.changes() == changes
+    assert replay(original, view.changes()) == state